@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Measure how the time needed to weld the duplicate vertices of an editable mesh
+before exporting it scales with the number of vertices.
+
+The meshes are grids of quads that don't share any vertices, like the vertex
+data of an editable mesh; except along the border of the grid, each grid
+point is therefore duplicated four times, and these duplicates are all welded
+into one vertex.
+
+Run from the root of the repository:
+
+    python benchmarks/export_weld.py
+
+To include the mesh with a million vertices:
+
+    python benchmarks/export_weld.py --full
+
+"""
+
+import os
+import sys
+import gc
+import math
+import time
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from panda3d.core import (GeomVertexFormat, GeomVertexData, GeomVertexWriter, GeomTriangles,
+                          GeomNode, Geom)
+from src.core.base import Mgr, PosObj
+from src.core.geom.vert import VertexManager
+from src.core.geom.edge import EdgeManager
+from src.core.geom.poly import PolygonManager
+from src.core.geom.data.obj import GeomDataObject
+from src.core.export import ExportManager
+
+VERTEX_COUNTS = (10000, 100000, 250000)
+VERTEX_COUNTS_FULL = VERTEX_COUNTS + (1000000,)
+
+
+def create_geom_data_object(vertex_count):
+
+    poly_count = vertex_count // 4
+    side = int(math.ceil(math.sqrt(poly_count)))
+    points = [[PosObj((x, y, 0.)) for x in range(side + 1)] for y in range(side + 1)]
+    normal = (0., 0., 1.)
+    smoothing = [(0, True)]
+    data = []
+
+    for i in range(poly_count):
+
+        y, x = divmod(i, side)
+        corners = (points[y][x], points[y][x+1], points[y+1][x+1], points[y+1][x])
+        vert_data = [{"pos": pos, "normal": normal, "uvs": {0: (pos[0] / side, pos[1] / side)}}
+                     for pos in corners]
+        tris = ((vert_data[0], vert_data[1], vert_data[2]),
+                (vert_data[0], vert_data[2], vert_data[3]))
+        data.append({"tris": tris, "smoothing": smoothing})
+
+    geom_data_obj = GeomDataObject("benchmark", None)
+
+    for _ in geom_data_obj.process_geom_data(data):
+        pass
+
+    # create the geometry that would normally be created by create_geometry,
+    # but only with the vertex data needed for welding
+
+    verts = geom_data_obj.get_subobjects("vert")
+    vertex_data = GeomVertexData("poly_data", GeomVertexFormat.get_v3n3t2(), Geom.UH_static)
+    vertex_data.set_num_rows(len(verts))
+    pos_writer = GeomVertexWriter(vertex_data, "vertex")
+    normal_writer = GeomVertexWriter(vertex_data, "normal")
+    uv_writer = GeomVertexWriter(vertex_data, "texcoord")
+    tris_prim = GeomTriangles(Geom.UH_static)
+    row_index_offset = 0
+
+    for poly in geom_data_obj._ordered_polys:
+
+        for vert_id in poly.get_vertex_ids():
+            vert = verts[vert_id]
+            vert.offset_row_index(row_index_offset)
+            row = vert.get_row_index()
+            pos_writer.set_row(row)
+            pos_writer.set_data3(vert.get_pos())
+            normal_writer.set_row(row)
+            normal_writer.set_data3(vert.get_normal())
+            uv_writer.set_row(row)
+            uv_writer.set_data2(vert.get_uvs(0))
+
+        for vert_ids in poly:
+            tris_prim.add_vertices(*(verts[v_id].get_row_index() for v_id in vert_ids))
+
+        row_index_offset += poly.get_vertex_count()
+
+    geom = Geom(vertex_data)
+    geom.add_primitive(tris_prim)
+    geom_node = GeomNode("toplevel_geom")
+    geom_node.add_geom(geom)
+    geom_data_obj._toplvl_node = geom_node
+
+    return geom_data_obj
+
+
+def run(vertex_count):
+
+    geom_data_obj = create_geom_data_object(vertex_count)
+    # only the welding itself is measured, so the manager doesn't need to be set up
+    export_mgr = ExportManager.__new__(ExportManager)
+
+    gc.collect()
+    start_time = time.perf_counter()
+    node_path = export_mgr._ExportManager__merge_duplicate_vertices(geom_data_obj)
+    duration = time.perf_counter() - start_time
+
+    geom = node_path.node().get_geom(0)
+    welded_count = geom.get_vertex_data().get_num_rows()
+    index_count = geom.get_primitive(0).get_num_vertices()
+    assert index_count == len(geom_data_obj._ordered_polys) * 6
+
+    return duration, welded_count
+
+
+def main():
+
+    logging.disable(logging.CRITICAL)
+
+    obj_types = {"top": [], "sub": []}
+    Mgr.expose("object_type_data", lambda: obj_types)
+    VertexManager()
+    EdgeManager()
+    PolygonManager()
+
+    vertex_counts = VERTEX_COUNTS_FULL if "--full" in sys.argv[1:] else VERTEX_COUNTS
+
+    print("{:>10} {:>16} {:>10} {:>17}".format("vertices", "after welding", "time (s)",
+                                              "per vertex (us)"))
+
+    for vertex_count in vertex_counts:
+        duration, welded_count = run(vertex_count)
+        print("{:>10} {:>16} {:>10.3f} {:>17.2f}".format(vertex_count, welded_count, duration,
+                                                        duration * 1000000. / vertex_count))
+
+
+if __name__ == "__main__":
+    main()
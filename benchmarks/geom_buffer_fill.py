@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""
+Measure how long it takes to fill the vertex and index buffers of an editable
+mesh, comparing the row-by-row approach (GeomVertexWriter and
+GeomPrimitive.add_vertex) with the bulk approach used by
+GeomDataObject.create_geometry (typed arrays copied into the vertex and index
+arrays through memoryviews).
+
+The meshes are grids of quads whose vertices are not shared between polygons,
+as is the case for the vertex data of an editable mesh; the vertex format has
+the same position, color and normal arrays as the "full" vertex format
+defined by GeomDataManager.
+
+Run from the root of the repository:
+
+    python benchmarks/geom_buffer_fill.py
+
+"""
+
+import time
+import array
+
+from panda3d.core import (GeomVertexArrayFormat, GeomVertexFormat, GeomVertexData,
+                          GeomVertexWriter, GeomTriangles, GeomLines, InternalName, Geom)
+
+VERTEX_COUNTS = (10000, 50000, 100000, 500000)
+# the indices of a quad's triangles and edges within its own vertices
+QUAD_TRIS = ((0, 1, 2), (0, 2, 3))
+QUAD_EDGES = ((0, 1), (1, 2), (2, 3), (3, 0))
+
+
+def create_vertex_format():
+
+    pos_array = GeomVertexArrayFormat()
+    pos_array.add_column(InternalName.make("vertex"), 3, Geom.NT_float32, Geom.C_point)
+
+    col_array = GeomVertexArrayFormat()
+    col_array.add_column(InternalName.make("color"), 4, Geom.NT_uint8, Geom.C_color)
+
+    normal_array = GeomVertexArrayFormat()
+    normal_array.add_column(InternalName.make("normal"), 3, Geom.NT_float32, Geom.C_normal)
+
+    vertex_format = GeomVertexFormat()
+    vertex_format.add_array(pos_array)
+    vertex_format.add_array(col_array)
+    vertex_format.add_array(normal_array)
+
+    return GeomVertexFormat.register_format(vertex_format)
+
+
+def create_quads(vertex_count):
+
+    side = int(vertex_count ** .5 / 2.) + 1
+    normal = (0., 0., 1.)
+    quads = []
+
+    for i in range(vertex_count // 4):
+        y, x = divmod(i, side)
+        positions = ((x, y, 0.), (x + 1., y, 0.), (x + 1., y + 1., 0.), (x, y + 1., 0.))
+        quads.append([(pos, normal) for pos in positions])
+
+    return quads
+
+
+def create_data(vertex_format, count):
+
+    vertex_data = GeomVertexData("poly_data", vertex_format, Geom.UH_dynamic)
+    vertex_data.reserve_num_rows(count)
+    vertex_data.set_num_rows(count)
+    tris_prim = GeomTriangles(Geom.UH_static)
+    lines_prim = GeomLines(Geom.UH_static)
+
+    return vertex_data, tris_prim, lines_prim
+
+
+def fill_by_row(vertex_format, quads):
+
+    count = len(quads) * 4
+    vertex_data, tris_prim, lines_prim = create_data(vertex_format, count)
+    pos_writer = GeomVertexWriter(vertex_data, "vertex")
+    normal_writer = GeomVertexWriter(vertex_data, "normal")
+    row_index_offset = 0
+
+    for quad in quads:
+
+        processed_verts = []
+
+        for tri in QUAD_TRIS:
+
+            for index in tri:
+
+                if index not in processed_verts:
+                    pos, normal = quad[index]
+                    pos_writer.add_data3(pos)
+                    normal_writer.add_data3(normal)
+                    processed_verts.append(index)
+
+                tris_prim.add_vertex(row_index_offset + index)
+
+        for index1, index2 in QUAD_EDGES:
+            lines_prim.add_vertices(row_index_offset + index1,
+                                    row_index_offset + index2 + count)
+
+        row_index_offset += len(quad)
+
+    return vertex_data, tris_prim, lines_prim
+
+
+def fill_in_bulk(vertex_format, quads):
+
+    count = len(quads) * 4
+    vertex_data, tris_prim, lines_prim = create_data(vertex_format, count)
+    pos_data = array.array("f")
+    normal_data = array.array("f")
+    tri_rows = array.array("H" if count <= 65535 else "I")
+    line_rows = array.array("H" if count * 2 <= 65535 else "I")
+    row_index_offset = 0
+
+    for quad in quads:
+
+        processed_verts = set()
+
+        for tri in QUAD_TRIS:
+
+            for index in tri:
+
+                if index not in processed_verts:
+                    pos, normal = quad[index]
+                    pos_data.extend(pos)
+                    normal_data.extend(normal)
+                    processed_verts.add(index)
+
+                tri_rows.append(row_index_offset + index)
+
+        for index1, index2 in QUAD_EDGES:
+            line_rows.extend((row_index_offset + index1, row_index_offset + index2 + count))
+
+        row_index_offset += len(quad)
+
+    for index, data in ((0, pos_data), (2, normal_data)):
+        to_view = memoryview(vertex_data.modify_array(index)).cast("B")
+        to_view[:] = memoryview(data).cast("B")
+
+    for prim, rows in ((tris_prim, tri_rows), (lines_prim, line_rows)):
+        prim.set_index_type(Geom.NT_uint16 if rows.typecode == "H" else Geom.NT_uint32)
+        prim_array = prim.modify_vertices(len(rows))
+        memoryview(prim_array).cast("B")[:] = memoryview(rows).cast("B")
+
+    return vertex_data, tris_prim, lines_prim
+
+
+def run(vertex_format, vertex_count):
+
+    quads = create_quads(vertex_count)
+    timings = []
+    results = []
+
+    for fill in (fill_by_row, fill_in_bulk):
+        start_time = time.perf_counter()
+        results.append(fill(vertex_format, quads))
+        timings.append(time.perf_counter() - start_time)
+
+    # both approaches need to yield the same vertex and index data
+    (data1, tris1, lines1), (data2, tris2, lines2) = results
+
+    for index in (0, 2):
+        assert bytes(memoryview(data1.get_array(index))) == bytes(memoryview(data2.get_array(index)))
+
+    for prim1, prim2 in ((tris1, tris2), (lines1, lines2)):
+        assert list(prim1.get_vertex_list()) == list(prim2.get_vertex_list())
+
+    return timings
+
+
+def main():
+
+    vertex_format = create_vertex_format()
+
+    print("{:>10} {:>14} {:>12} {:>10}".format("vertices", "by row (s)", "bulk (s)", "speed-up"))
+
+    for vertex_count in VERTEX_COUNTS:
+        by_row_time, bulk_time = run(vertex_format, vertex_count)
+        print("{:>10} {:>14.3f} {:>12.3f} {:>9.1f}x".format(vertex_count, by_row_time,
+                                                            bulk_time, by_row_time / bulk_time))
+
+
+if __name__ == "__main__":
+    main()
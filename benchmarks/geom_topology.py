@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Measure how the time needed to build the topology of an editable mesh (its
+vertices, edges, polygons and the merged vertices and edges connecting them)
+with GeomDataObject.process_geom_data scales with the size of the mesh.
+
+Two kinds of synthetic meshes are used:
+- grids of quads, with a growing number of polygons;
+- grids of n-gons (triangle fans), with a growing number of sides per polygon
+  but a constant total number of triangles.
+
+For both, the time per polygon (or per triangle) should remain roughly
+constant.
+
+Run from the root of the repository:
+
+    python benchmarks/geom_topology.py
+
+To include the grid of a million quads (needs several GB of memory):
+
+    python benchmarks/geom_topology.py --full
+
+"""
+
+import os
+import sys
+import gc
+import math
+import time
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.base import Mgr, PosObj
+from src.core.geom.vert import VertexManager
+from src.core.geom.edge import EdgeManager
+from src.core.geom.poly import PolygonManager
+from src.core.geom.data.obj import GeomDataObject
+
+POLY_COUNTS = (1000, 10000, 100000)
+POLY_COUNTS_FULL = POLY_COUNTS + (1000000,)
+NGON_SIDES = (8, 64, 512, 4096)
+# the total number of triangles of each n-gon mesh
+NGON_TRI_COUNT = 65536
+
+
+def create_quad_grid(poly_count):
+
+    side = int(math.ceil(math.sqrt(poly_count)))
+    # grid points are shared by all polygons using them, like in the data
+    # created for primitives and imported models
+    points = [[PosObj((x, y, 0.)) for x in range(side + 1)] for y in range(side + 1)]
+    normal = (0., 0., 1.)
+    smoothing = [(0, True)]
+    data = []
+
+    for i in range(poly_count):
+
+        y, x = divmod(i, side)
+        corners = (points[y][x], points[y][x+1], points[y+1][x+1], points[y+1][x])
+        vert_data = [{"pos": pos, "normal": normal, "uvs": {0: (pos[0] / side, pos[1] / side)}}
+                     for pos in corners]
+        tris = ((vert_data[0], vert_data[1], vert_data[2]),
+                (vert_data[0], vert_data[2], vert_data[3]))
+        data.append({"tris": tris, "smoothing": smoothing})
+
+    return data
+
+
+def create_ngon_grid(side_count):
+
+    poly_count = NGON_TRI_COUNT // (side_count - 2)
+    normal = (0., 0., 1.)
+    smoothing = [(0, True)]
+    angle = 2. * math.pi / side_count
+    data = []
+
+    for i in range(poly_count):
+
+        # the n-gons don't share any vertices, so no merging happens
+        corners = [PosObj((i * 3. + math.cos(angle * j), math.sin(angle * j), 0.))
+                   for j in range(side_count)]
+        vert_data = [{"pos": pos, "normal": normal, "uvs": {0: (pos[0], pos[1])}}
+                     for pos in corners]
+        tris = tuple((vert_data[0], vert_data[j], vert_data[j+1])
+                     for j in range(1, side_count - 1))
+        data.append({"tris": tris, "smoothing": smoothing})
+
+    return data
+
+
+def run(data):
+
+    geom_data_obj = GeomDataObject("benchmark", None)
+
+    gc.collect()
+    start_time = time.perf_counter()
+
+    for _ in geom_data_obj.process_geom_data(data):
+        pass
+
+    duration = time.perf_counter() - start_time
+
+    assert len(geom_data_obj.get_subobjects("poly")) == len(data)
+
+    return duration
+
+
+def main():
+
+    logging.disable(logging.CRITICAL)
+
+    obj_types = {"top": [], "sub": []}
+    Mgr.expose("object_type_data", lambda: obj_types)
+    VertexManager()
+    EdgeManager()
+    PolygonManager()
+
+    poly_counts = POLY_COUNTS_FULL if "--full" in sys.argv[1:] else POLY_COUNTS
+
+    print("Quad grids")
+    print("{:>10} {:>12} {:>18}".format("polygons", "time (s)", "per polygon (us)"))
+
+    for poly_count in poly_counts:
+        duration = run(create_quad_grid(poly_count))
+        print("{:>10} {:>12.3f} {:>18.2f}".format(poly_count, duration,
+                                                  duration * 1000000. / poly_count))
+
+    print("")
+    print("N-gon grids ({:d} triangles)".format(NGON_TRI_COUNT))
+    print("{:>10} {:>10} {:>12} {:>19}".format("sides", "polygons", "time (s)",
+                                              "per triangle (us)"))
+
+    for side_count in NGON_SIDES:
+        data = create_ngon_grid(side_count)
+        tri_count = len(data) * (side_count - 2)
+        duration = run(data)
+        print("{:>10} {:>10} {:>12.3f} {:>19.2f}".format(side_count, len(data), duration,
+                                                        duration * 1000000. / tri_count))
+
+
+if __name__ == "__main__":
+    main()
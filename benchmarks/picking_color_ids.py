@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Measure how the time needed to allocate and free picking color IDs scales with
+the number of IDs in use.
+
+Run from the root of the repository:
+
+    python benchmarks/picking_color_ids.py
+
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.base.picking_col_mgr import PickingColorIDManager
+
+ID_COUNTS = (1000, 10000, 100000, 1000000)
+# the number of times some of the allocated IDs are freed and allocated again
+CYCLE_COUNT = 20
+# the number of IDs freed at once, as happens when deleting subobjects
+BATCH_SIZE = 100
+
+
+class BenchmarkIDManager(PickingColorIDManager):
+
+    def get_managed_object_type(self):
+
+        return "benchmark"
+
+
+def run(id_count):
+
+    mgr = BenchmarkIDManager()
+    rng = random.Random(id_count)
+
+    start_time = time.perf_counter()
+    ids = [mgr.get_next_picking_color_id() for _ in range(id_count)]
+    alloc_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+
+    for _ in range(CYCLE_COUNT):
+        # free scattered IDs, so the free ranges get fragmented
+        freed_ids = [ids.pop(rng.randrange(len(ids))) for _ in range(BATCH_SIZE)]
+        mgr.recover_picking_color_ids(freed_ids)
+        mgr.update_picking_color_id_ranges()
+        # discarding some of the recovered IDs again is what undoing part of a
+        # deletion does
+        discarded_ids = freed_ids[::2]
+        mgr.discard_picking_color_ids(discarded_ids)
+        mgr.update_picking_color_id_ranges()
+        ids.extend(discarded_ids)
+
+    cycle_time = (time.perf_counter() - start_time) / CYCLE_COUNT
+
+    return alloc_time, cycle_time, len(mgr._id_ranges)
+
+
+def main():
+
+    logging.disable(logging.CRITICAL)
+
+    print("{:>10} {:>14} {:>20} {:>12}".format("IDs", "allocate (s)", "free+discard (ms)",
+                                                "free ranges"))
+
+    for id_count in ID_COUNTS:
+        alloc_time, cycle_time, range_count = run(id_count)
+        print("{:>10} {:>14.3f} {:>20.3f} {:>12}".format(id_count, alloc_time,
+                                                         cycle_time * 1000., range_count))
+
+
+if __name__ == "__main__":
+    main()
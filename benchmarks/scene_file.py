@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""
+Compare the time needed to save and open the scene data part of a scene file in
+the original layout (format version 1: all scene data pickled into a single
+"scene/data" subfile, compressed at level 9) and in the current layout (format
+version 2: one subfile per part of the scene data, listed in "scene/toc" and
+compressed at SCENE_COMPRESSION).
+
+The history data (hist.dat), which holds the objects themselves, is added to the
+scene file uncompressed in both layouts, so it is left out here.
+
+Run from the root of the repository:
+
+    python benchmarks/scene_file.py
+
+"""
+
+import os
+import sys
+import time
+import pickle
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from panda3d.core import Multifile, StringStream, Filename
+from src.core.scene import SCENE_FORMAT_VERSION, SCENE_COMPRESSION
+
+# the numbers of materials and selection sets in the generated scene data
+SCENE_SIZES = (100, 1000, 10000)
+REPEAT_COUNT = 3
+
+
+def create_scene_data(size):
+
+    rng = random.Random(size)
+    materials = {}
+
+    for i in range(size):
+        props = dict((prop_id, tuple(rng.random() for _ in range(4)))
+                     for prop_id in ("diffuse", "ambient", "specular", "emissive"))
+        props["shininess"] = rng.random() * 100.
+        props["name"] = "Material {:d}".format(i)
+        materials[i] = props
+
+    sel_sets = dict(("Set {:d}".format(i), set(rng.sample(range(size * 10), 50)))
+                    for i in range(size))
+    view_data = dict(("view {:d}".format(i), [rng.random() for _ in range(16)])
+                     for i in range(20))
+
+    return {"material_library": materials, "selection_sets": sel_sets, "view_data": view_data}
+
+
+def save_v1(filename, scene_data):
+
+    scene_file = Multifile()
+    scene_file.open_write(Filename.from_os_specific(filename))
+    stream = StringStream(pickle.dumps(scene_data, -1))
+    scene_file.add_subfile("scene/data", stream, 9)
+    scene_file.flush()
+    scene_file.close()
+
+
+def open_v1(filename):
+
+    scene_file = Multifile()
+    scene_file.open_read(Filename.from_os_specific(filename))
+    subfile_index = scene_file.find_subfile("scene/data")
+    scene_data = pickle.loads(scene_file.read_subfile(subfile_index))
+    scene_file.close()
+
+    return scene_data
+
+
+def save_v2(filename, scene_data):
+
+    scene_file = Multifile()
+    scene_file.open_write(Filename.from_os_specific(filename))
+    streams = []
+    toc = {"version": SCENE_FORMAT_VERSION, "data_ids": list(scene_data.keys())}
+    stream = StringStream(pickle.dumps(toc, -1))
+    scene_file.add_subfile("scene/toc", stream, SCENE_COMPRESSION)
+    streams.append(stream)
+
+    for data_id, data in scene_data.items():
+        stream = StringStream(pickle.dumps(data, -1))
+        scene_file.add_subfile("scene/{}".format(data_id), stream, SCENE_COMPRESSION)
+        streams.append(stream)
+
+    scene_file.flush()
+    scene_file.close()
+
+
+def open_v2(filename):
+
+    scene_file = Multifile()
+    scene_file.open_read(Filename.from_os_specific(filename))
+    toc = pickle.loads(scene_file.read_subfile(scene_file.find_subfile("scene/toc")))
+    scene_data = {}
+
+    for data_id in toc["data_ids"]:
+        subfile_index = scene_file.find_subfile("scene/{}".format(data_id))
+        scene_data[data_id] = pickle.loads(scene_file.read_subfile(subfile_index))
+
+    scene_file.close()
+
+    return scene_data
+
+
+def time_call(func, *args):
+
+    best_time = None
+
+    for _ in range(REPEAT_COUNT):
+        start_time = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start_time
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    return best_time
+
+
+def main():
+
+    print("{:>8} {:>7} {:>10} {:>10} {:>12}".format("size", "format", "save (s)",
+                                                    "open (s)", "file (KiB)"))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        for size in SCENE_SIZES:
+
+            scene_data = create_scene_data(size)
+
+            for version, save, load in ((1, save_v1, open_v1), (2, save_v2, open_v2)):
+                filename = os.path.join(tmp_dir, "scene_v{:d}.p3ds".format(version))
+                save_time = time_call(save, filename, scene_data)
+                open_time = time_call(load, filename)
+                assert load(filename) == scene_data
+                file_size = os.path.getsize(filename) / 1024.
+                print("{:>8} {:>7} {:>10.3f} {:>10.3f} {:>12.1f}".format(size, version, save_time,
+                                                                        open_time, file_size))
+
+
+if __name__ == "__main__":
+    main()
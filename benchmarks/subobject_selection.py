@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Measure how the bookkeeping done when (de)selecting polygons scales with the
+number of polygons of a mesh.
+
+For each mesh size, all polygons are selected in batches, the selection is
+inverted and finally everything is deselected again, with the triangle data
+of the selected and unselected polygons updated the way
+GeomSelectionBase.update_selection does it.
+
+Run from the root of the repository:
+
+    python benchmarks/subobject_selection.py
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.geom.data.select import GeomSelectionBase
+
+POLY_COUNTS = (10000, 50000, 100000, 500000)
+# the number of polygons (de)selected per update
+BATCH_SIZE = 5000
+TRIS_PER_POLY = 2
+
+
+class BenchmarkPolygon(object):
+    """ Stands in for Polygon, which only needs triangle data for this purpose """
+
+    def __init__(self, poly_id, tri_data):
+
+        self._id = poly_id
+        self._tri_data = tri_data
+
+    def __getitem__(self, index):
+
+        return self._tri_data[index]
+
+    def __len__(self):
+
+        return len(self._tri_data) * 3
+
+    def get_id(self):
+
+        return self._id
+
+
+class BenchmarkSelection(GeomSelectionBase):
+
+    def __init__(self, polys):
+
+        GeomSelectionBase.__init__(self)
+
+        self._poly_selection_data["unselected"] = [tri for poly in polys
+                                                   for tri in poly._tri_data]
+
+    def update(self, polys_to_select, polys_to_deselect):
+        """ Do the bookkeeping part of update_selection for polygons """
+
+        selected_ids = self._selected_subobj_ids["poly"]
+        selected_id_set = selected_ids.get_id_set()
+        sel_data = self._poly_selection_data
+        data_selected = sel_data["selected"]
+        data_unselected = sel_data["unselected"]
+        polys_to_select = [p for p in polys_to_select if p.get_id() not in selected_id_set]
+        polys_to_deselect = [p for p in polys_to_deselect if p.get_id() in selected_id_set]
+
+        selected_ids.extend(p.get_id() for p in polys_to_select)
+        self._GeomSelectionBase__remove_selected_ids(selected_ids,
+                                                     set(p.get_id() for p in polys_to_deselect))
+        polys_sel = self._GeomSelectionBase__get_poly_tri_indices(data_unselected, polys_to_select)
+        polys_unsel = self._GeomSelectionBase__get_poly_tri_indices(data_selected, polys_to_deselect)
+
+        for _, poly in polys_sel:
+            data_selected.extend(poly)
+
+        data_unselected[:] = self._GeomSelectionBase__remove_poly_tri_data(data_unselected, polys_sel)
+
+        for _, poly in polys_unsel:
+            data_unselected.extend(poly)
+
+        data_selected[:] = self._GeomSelectionBase__remove_poly_tri_data(data_selected, polys_unsel)
+
+
+def create_polys(poly_count):
+
+    polys = []
+    row = 0
+
+    for poly_id in range(poly_count):
+        tri_data = []
+        for _ in range(TRIS_PER_POLY):
+            tri_data.append((row, row + 1, row + 2))
+            row += 3
+        polys.append(BenchmarkPolygon(poly_id, tri_data))
+
+    return polys
+
+
+def run(poly_count):
+
+    polys = create_polys(poly_count)
+    selection = BenchmarkSelection(polys)
+    timings = []
+
+    # select everything in batches
+    start_time = time.perf_counter()
+
+    for i in range(0, poly_count, BATCH_SIZE):
+        selection.update(polys[i:i+BATCH_SIZE], [])
+
+    timings.append(time.perf_counter() - start_time)
+
+    # deselect every other polygon, then invert the selection
+    start_time = time.perf_counter()
+    selection.update([], polys[::2])
+    selected_ids = selection._selected_subobj_ids["poly"]
+    to_select = [p for p in polys if p.get_id() not in selected_ids]
+    to_deselect = [p for p in polys if p.get_id() in selected_ids]
+    selection.update(to_select, to_deselect)
+    timings.append(time.perf_counter() - start_time)
+
+    # check membership of every polygon, as is_selected does
+    start_time = time.perf_counter()
+    selected_count = sum(1 for p in polys if p.get_id() in selected_ids)
+    timings.append(time.perf_counter() - start_time)
+    assert selected_count == len(selected_ids) == (poly_count + 1) // 2
+
+    # deselect everything
+    start_time = time.perf_counter()
+    selection.update([], polys)
+    timings.append(time.perf_counter() - start_time)
+
+    return timings
+
+
+def main():
+
+    print("{:>10} {:>14} {:>12} {:>14} {:>16}".format("polygons", "select all (s)",
+          "invert (s)", "is_selected (s)", "deselect all (s)"))
+
+    for poly_count in POLY_COUNTS:
+        timings = run(poly_count)
+        print("{:>10} {:>14.3f} {:>12.3f} {:>14.3f} {:>16.3f}".format(poly_count, *timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Measure how the time needed to build the UV data (the UV vertices, edges and
+polygons, as well as the merged UV vertices and edges and the seams) of an
+editable mesh scales with the size of the mesh.
+
+The meshes are grids of quads with two UV sets:
+- UV set 0 maps the grid onto a single continuous island, so merged vertices
+  and edges are kept together;
+- UV set 1 maps each quad onto the entire UV space, so all merged vertices and
+  edges are split up and every edge becomes a seam edge.
+
+The UV data of each set is built separately, as happens when switching UV sets
+in the UV editor.
+
+Run from the root of the repository:
+
+    python benchmarks/uv_data.py
+
+"""
+
+import os
+import sys
+import gc
+import math
+import time
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.base import Mgr, PosObj
+from src.core.geom.vert import VertexManager
+from src.core.geom.edge import EdgeManager
+from src.core.geom.poly import PolygonManager
+from src.core.geom.data.obj import GeomDataObject
+from src.core.uv_edit.data import UVDataObject
+
+POLY_COUNTS = (1000, 10000, 100000)
+UV_SET_IDS = (0, 1)
+QUAD_UVS = ((0., 0.), (1., 0.), (1., 1.), (0., 1.))
+
+
+class BenchmarkUVData(UVDataObject):
+    """ Sets up only the data needed to process the geometry of a mesh """
+
+    def __init__(self, uv_set_id, geom_data_obj):
+
+        self._uv_set_id = uv_set_id
+        self._geom_data_obj = geom_data_obj
+        self._subobjs = dict((subobj_type, {}) for subobj_type in ("vert", "edge", "poly"))
+        self._merged_verts = {}
+        self._merged_edges = {}
+        self._seam_edge_ids = []
+        self._data_row_count = 0
+
+    def process_geom_data(self, uv_registry):
+
+        self._UVDataObject__process_geom_data(uv_registry)
+
+
+def create_geom_data_object(poly_count):
+
+    side = int(math.ceil(math.sqrt(poly_count)))
+    points = [[PosObj((x, y, 0.)) for x in range(side + 1)] for y in range(side + 1)]
+    normal = (0., 0., 1.)
+    smoothing = [(0, True)]
+    data = []
+
+    for i in range(poly_count):
+
+        y, x = divmod(i, side)
+        corners = (points[y][x], points[y][x+1], points[y+1][x+1], points[y+1][x])
+        vert_data = [{"pos": pos, "normal": normal,
+                      "uvs": {0: (pos[0] / side, pos[1] / side), 1: uv}}
+                     for pos, uv in zip(corners, QUAD_UVS)]
+        tris = ((vert_data[0], vert_data[1], vert_data[2]),
+                (vert_data[0], vert_data[2], vert_data[3]))
+        data.append({"tris": tris, "smoothing": smoothing})
+
+    geom_data_obj = GeomDataObject("benchmark", None)
+
+    for _ in geom_data_obj.process_geom_data(data):
+        pass
+
+    return geom_data_obj
+
+
+def run(poly_count):
+
+    geom_data_obj = create_geom_data_object(poly_count)
+    results = []
+
+    for uv_set_id in UV_SET_IDS:
+
+        uv_registry = {"vert": {}, "edge": {}, "poly": {}}
+        uv_data_obj = BenchmarkUVData(uv_set_id, geom_data_obj)
+
+        gc.collect()
+        start_time = time.perf_counter()
+        uv_data_obj.process_geom_data(uv_registry)
+        duration = time.perf_counter() - start_time
+
+        merged_vert_count = len(set(id(m_v) for m_v in uv_data_obj.get_merged_vertices().values()))
+        seam_count = len(uv_data_obj._seam_edge_ids)
+        results.append((duration, merged_vert_count, seam_count))
+
+    return results
+
+
+def main():
+
+    logging.disable(logging.CRITICAL)
+
+    obj_types = {"top": [], "sub": []}
+    Mgr.expose("object_type_data", lambda: obj_types)
+    VertexManager()
+    EdgeManager()
+    PolygonManager()
+
+    print("{:>10} {:>8} {:>10} {:>18} {:>14} {:>12}".format("polygons", "UV set", "time (s)",
+          "per polygon (us)", "merged verts", "seam edges"))
+
+    for poly_count in POLY_COUNTS:
+        for uv_set_id, (duration, merged_vert_count, seam_count) in zip(UV_SET_IDS, run(poly_count)):
+            print("{:>10} {:>8} {:>10.3f} {:>18.2f} {:>14} {:>12}".format(poly_count, uv_set_id,
+                  duration, duration * 1000000. / poly_count, merged_vert_count, seam_count))
+
+
+if __name__ == "__main__":
+    main()
@@ -190,6 +190,166 @@ def get_unique_name(requested_name, namelist, default_search_pattern="",
     return naming_pattern.format(max_index)
 
 
+class NameRegistry(object):
+    """
+    Set of unique names, indexed by base name and numbering pattern.
+    For each pattern, the indices in use are tracked, such that a new unique
+    name can be generated without scanning all existing names.
+
+    """
+
+    def __init__(self, names=()):
+
+        self._names = set()
+        # per (basename, is_parenthesized) key, a dict of index -> name count
+        self._indices = {}
+        self._max_indices = {}
+        self.update(names)
+
+    def __contains__(self, name):
+
+        return name in self._names
+
+    def __iter__(self):
+
+        return iter(self._names)
+
+    def __len__(self):
+
+        return len(self._names)
+
+    def copy(self):
+
+        registry = NameRegistry()
+        registry._names = self._names.copy()
+        registry._indices = {k: v.copy() for k, v in self._indices.items()}
+        registry._max_indices = self._max_indices.copy()
+
+        return registry
+
+    @staticmethod
+    def __get_index_keys(name):
+
+        keys = []
+        match = re.match(r"(.*?)\s*(\d+)$", name, re.S)
+
+        if match:
+            basename, index_str = match.groups()
+            keys.append(((basename, False), int(index_str)))
+
+        match = re.match(r"(.*?)\s*\((\d+)\)$", name, re.S)
+
+        if match:
+            basename, index_str = match.groups()
+            keys.append(((basename, True), int(index_str)))
+
+        return keys
+
+    def add(self, name):
+
+        if name in self._names:
+            return
+
+        self._names.add(name)
+
+        for key, index in self.__get_index_keys(name):
+
+            indices = self._indices.setdefault(key, {})
+            indices[index] = indices.get(index, 0) + 1
+
+            if index > self._max_indices.get(key, 0):
+                self._max_indices[key] = index
+
+    def update(self, names):
+
+        for name in names:
+            self.add(name)
+
+    def discard(self, name):
+
+        if name not in self._names:
+            return
+
+        self._names.remove(name)
+
+        for key, index in self.__get_index_keys(name):
+
+            indices = self._indices[key]
+            indices[index] -= 1
+
+            if indices[index]:
+                continue
+
+            del indices[index]
+
+            if not indices:
+                del self._indices[key]
+                del self._max_indices[key]
+            elif index == self._max_indices[key]:
+                self._max_indices[key] = max(indices)
+
+    def __get_free_index(self, key, min_index):
+
+        indices = self._indices.get(key)
+
+        if not indices or min_index not in indices:
+            return min_index
+
+        return max(min_index, self._max_indices[key]) + 1
+
+    def get_unique_name(self, requested_name, default_basename="",
+                        default_naming_pattern="", default_min_index=1):
+        """
+        Return a name based on the given one that is not yet in this registry.
+        If no name is requested, the default base name and naming pattern are
+        used instead.
+        The minimum index is used if it is still free; otherwise the new name
+        gets the highest index in use for its pattern, incremented by one.
+
+        """
+
+        key = (default_basename, False)
+        naming_pattern = default_naming_pattern
+        min_index = default_min_index
+
+        if requested_name:
+
+            pattern = r"(.*?)(\s*)(\d*)$"
+            basename, space, index_str = re.match(pattern, requested_name, re.S).groups()
+
+            if index_str:
+
+                min_index = int(index_str)
+                key = (basename, False)
+                zero_padding = len(index_str) if index_str.startswith("0") else 0
+                naming_pattern = basename + space + "{:0" + str(zero_padding) + "d}"
+
+            else:
+
+                # also search for "(<index>)" at the end
+                pattern = r"(.*?)(\s*)(?:\((\d*)\))*$"
+                basename, space, index_str = re.match(pattern, requested_name, re.S).groups()
+
+                if index_str:
+
+                    min_index = int(index_str)
+                    key = (basename, True)
+                    zero_padding = len(index_str) if index_str.startswith("0") else 0
+                    naming_pattern = basename + space + "({:0" + str(zero_padding) + "d})"
+
+                elif basename in self._names:
+
+                    min_index = 2
+                    key = (basename, True)
+                    naming_pattern = basename + " ({:d})"
+
+                else:
+
+                    return basename
+
+        return naming_pattern.format(self.__get_free_index(key, min_index))
+
+
 # The following class allows predefining specific bindings of events to their
 # handlers.
 # Multiple bindings can be set active at once, with the option to stop listening
@@ -1,4 +1,4 @@
-from ...base import logging, re, pickle, GlobalData, ObjectName, get_unique_name, DirectObject
+from ...base import logging, re, pickle, GlobalData, ObjectName, NameRegistry, get_unique_name, DirectObject
 from panda3d.core import *
 from collections import OrderedDict
 import weakref
@@ -7,9 +7,13 @@ import os
 import math
 import random
 import time
+import threading
+import queue
 import datetime
 import copy
 import struct
+import array
+import bisect
 
 GFX_PATH = "res/"
 
@@ -18,6 +22,10 @@ GFX_PATH = "res/"
 # following class
 class BaseObject(object):
 
+    # an empty __slots__ allows derived classes to do without a per-instance
+    # __dict__ by defining __slots__ themselves
+    __slots__ = ()
+
     world = None
     screen = None
     viewport = None
@@ -480,6 +488,389 @@ def get_color_vec(color_id, alpha):
     return VBase4(r, g, b, alpha) / 255.
 
 
+# Return the indices of the set bits in the given sequence of 32-bit masks (e.g. the
+# texels of a region selection mask texture), with each mask representing 32
+# consecutive indices; masks without any set bits are skipped right away
+def get_mask_bit_indices(masks):
+
+    indices = []
+
+    for offset, mask in [(32 * i, m) for i, m in enumerate(masks) if m]:
+
+        while mask:
+            bit = mask & -mask
+            indices.append(offset + bit.bit_length() - 1)
+            mask ^= bit
+
+    return indices
+
+
+# Subobject IDs are generated sequentially, so a set of them can be compactly stored
+# as the bits of a single (arbitrarily large) integer, allowing set operations to be
+# performed bitwise
+class IDBitSet(object):
+
+    def __init__(self, ids=None, bits=0):
+
+        if ids is not None:
+
+            ids = ids if isinstance(ids, (list, tuple, set, frozenset)) else list(ids)
+
+            if ids:
+
+                data = bytearray((max(ids) >> 3) + 1)
+
+                for i in ids:
+                    data[i >> 3] |= 1 << (i & 7)
+
+                bits = int.from_bytes(data, "little")
+
+        self._bits = bits
+
+    def __iter__(self):
+
+        bits = self._bits
+        masks = array.array("I", bits.to_bytes((bits.bit_length() + 31) // 32 * 4, "little"))
+
+        if sys.byteorder == "big":
+            masks.byteswap()
+
+        return iter(get_mask_bit_indices(masks))
+
+    def __len__(self):
+
+        return bin(self._bits).count("1")
+
+    def __bool__(self):
+
+        return self._bits != 0
+
+    def __contains__(self, obj_id):
+
+        return obj_id >= 0 and (self._bits >> obj_id) & 1 == 1
+
+    def __or__(self, other):
+
+        return IDBitSet(bits=self._bits | other._bits)
+
+    def __and__(self, other):
+
+        return IDBitSet(bits=self._bits & other._bits)
+
+    def __sub__(self, other):
+
+        return IDBitSet(bits=self._bits & ~other._bits)
+
+    def __xor__(self, other):
+
+        return IDBitSet(bits=self._bits ^ other._bits)
+
+    def __ior__(self, other):
+
+        self._bits |= other._bits
+
+        return self
+
+    def __iand__(self, other):
+
+        self._bits &= other._bits
+
+        return self
+
+    def __isub__(self, other):
+
+        self._bits &= ~other._bits
+
+        return self
+
+    def __ixor__(self, other):
+
+        self._bits ^= other._bits
+
+        return self
+
+    def copy(self):
+
+        return IDBitSet(bits=self._bits)
+
+
+# The IDs of selected subobjects need to be kept in order, but checking whether
+# a subobject is selected should not involve a linear search; the following list
+# keeps a set of its items up to date, which is used for membership tests.
+# It assumes that the list never contains the same ID more than once.
+class SelectedIDList(list):
+
+    def __init__(self, ids=()):
+
+        list.__init__(self, ids)
+
+        self._id_set = set(self)
+
+    def __contains__(self, subobj_id):
+
+        return subobj_id in self._id_set
+
+    def __setitem__(self, index, value):
+
+        list.__setitem__(self, index, value)
+        self._id_set = set(self)
+
+    def __delitem__(self, index):
+
+        list.__delitem__(self, index)
+        self._id_set = set(self)
+
+    def __iadd__(self, ids):
+
+        self.extend(ids)
+
+        return self
+
+    def get_id_set(self):
+
+        return self._id_set
+
+    def append(self, subobj_id):
+
+        list.append(self, subobj_id)
+        self._id_set.add(subobj_id)
+
+    def extend(self, ids):
+
+        start = len(self)
+        list.extend(self, ids)
+        self._id_set.update(self[start:])
+
+    def insert(self, index, subobj_id):
+
+        list.insert(self, index, subobj_id)
+        self._id_set.add(subobj_id)
+
+    def remove(self, subobj_id):
+
+        list.remove(self, subobj_id)
+        self._id_set.discard(subobj_id)
+
+    def pop(self, index=-1):
+
+        subobj_id = list.pop(self, index)
+        self._id_set.discard(subobj_id)
+
+        return subobj_id
+
+    def clear(self):
+
+        list.clear(self)
+        self._id_set.clear()
+
+    def difference_update(self, ids):
+        """ Remove the given IDs, keeping the remaining ones in order """
+
+        ids = ids if isinstance(ids, (set, frozenset)) else set(ids)
+        list.__setitem__(self, slice(None), [i for i in self if i not in ids])
+        self._id_set.difference_update(ids)
+
+
+def compute_tangent_space(pos, pos1, pos2, uv, uv1, uv2, normal,
+                          flip_tangent=False, flip_bitangent=False):
+    """
+    Return a (tangent, bitangent) tuple of (x, y, z) tuples for the triangle vertex
+    with the given position, UVs and normal, with the other two vertices of that
+    triangle having the given positions and UVs.
+    None is returned if either vector cannot be computed.
+
+    """
+
+    epsilon = 1.e-010
+    x, y, z = pos
+    pos_vec1 = (pos1[0] - x, pos1[1] - y, pos1[2] - z)
+    pos_vec2 = (pos2[0] - x, pos2[1] - y, pos2[2] - z)
+    u, v = uv
+    uv_vec1 = (uv1[0] - u, uv1[1] - v)
+    uv_vec2 = (uv2[0] - u, uv2[1] - v)
+
+    def get_world_vec(axis):
+
+        # compute a vector pointing in the +U (axis = 0) or +V (axis = 1) direction,
+        # in texture space and in world space
+        other_axis = 1 - axis
+
+        if abs(uv_vec1[other_axis]) < epsilon:
+            local_vec = uv_vec1
+            world_vec = pos_vec1
+        elif abs(uv_vec2[other_axis]) < epsilon:
+            local_vec = uv_vec2
+            world_vec = pos_vec2
+        else:
+            scale = uv_vec1[other_axis] / uv_vec2[other_axis]
+            local_vec = [c1 - c2 * scale for c1, c2 in zip(uv_vec1, uv_vec2)]
+            # the component of local_vec along the other axis will be 0, so
+            # replacing the texture-space vectors with the corresponding
+            # world-space vectors will yield a world-space vector along the axis
+            world_vec = [c1 - c2 * scale for c1, c2 in zip(pos_vec1, pos_vec2)]
+
+        return world_vec if local_vec[axis] >= 0. else [-c for c in world_vec]
+
+    n_x, n_y, n_z = normal
+    length_sq = n_x * n_x + n_y * n_y + n_z * n_z
+
+    if length_sq:
+        length = math.sqrt(length_sq)
+        n_x, n_y, n_z = n_x / length, n_y / length, n_z / length
+
+    tangent_space = []
+
+    for axis, flip in ((0, flip_tangent), (1, flip_bitangent)):
+
+        # the tangent (bitangent) vector is the world-space U-vector (V-vector)
+        # projected onto the tangent plane
+        w_x, w_y, w_z = get_world_vec(axis)
+        dot = w_x * n_x + w_y * n_y + w_z * n_z
+        vec = (w_x - n_x * dot, w_y - n_y * dot, w_z - n_z * dot)
+        length_sq = sum(c * c for c in vec)
+
+        if not length_sq:
+            return
+
+        length = -math.sqrt(length_sq) if flip else math.sqrt(length_sq)
+        tangent_space.append(tuple(c / length for c in vec))
+
+    return tuple(tangent_space)
+
+
+def _get_float_column_view(vertex_data, column_name, writable=False):
+
+    vertex_format = vertex_data.get_format()
+    array_index = vertex_format.get_array_with(column_name)
+    column = vertex_format.get_column(column_name)
+    stride = vertex_format.get_array(array_index).get_stride()
+    start = column.get_start()
+
+    if column.get_numeric_type() != Geom.NT_float32 or stride % 4 or start % 4:
+        return
+
+    if writable:
+        array = vertex_data.modify_array(array_index)
+    else:
+        array = vertex_data.get_array(array_index)
+
+    view = memoryview(array).cast("B").cast("f")
+
+    return view, start // 4, stride // 4, column.get_num_components()
+
+
+def get_vertex_column_values(vertex_data, column_name):
+    """
+    Return the values in the given column of the given vertex data as a list of
+    tuples, one per row.
+
+    """
+
+    row_count = vertex_data.get_num_rows()
+    column_view = _get_float_column_view(vertex_data, column_name)
+
+    if column_view:
+        view, start, stride, component_count = column_view
+        end = row_count * stride
+        components = [view[start+i:end:stride] for i in range(component_count)]
+        return list(zip(*components))
+
+    component_count = vertex_data.get_format().get_column(column_name).get_num_components()
+    reader = GeomVertexReader(vertex_data, column_name)
+    get_data = getattr(reader, "get_data{:d}".format(component_count))
+
+    return [tuple(get_data()) for _ in range(row_count)]
+
+
+def set_vertex_column_values(vertex_data, column_name, values):
+    """
+    Set the values in the given column of the given vertex data, using a dict
+    with the new value for each row that needs to be changed.
+
+    """
+
+    column_view = _get_float_column_view(vertex_data, column_name, writable=True)
+
+    if not column_view:
+
+        writer = GeomVertexWriter(vertex_data, column_name)
+
+        for row, value in values.items():
+            writer.set_row(row)
+            getattr(writer, "set_data{:d}".format(len(value)))(*value)
+
+        return
+
+    view, start, stride, component_count = column_view
+    row_count = vertex_data.get_num_rows()
+
+    if len(values) * 2 < row_count:
+
+        # only a few rows need to be changed, so write their values directly
+        for row, value in values.items():
+
+            offset = row * stride + start
+
+            for i in range(component_count):
+                view[offset + i] = value[i]
+
+        return
+
+    end = row_count * stride
+
+    for i in range(component_count):
+
+        component = view[start+i:end:stride].tolist()
+
+        for row, value in values.items():
+            component[row] = value[i]
+
+        view[start+i:end:stride] = array.array("f", component)
+
+
+def crop_mask_texture(tex, x, y, width, height):
+    """
+    Replace the RAM image of the given (selection mask) texture with the part of
+    it that has the given size and whose top left corner is at the given pixel
+    coordinates, measured from the top left corner of the original image.
+    Pixels outside of the original image are cleared to zero, so negative
+    offsets can be used to add a border around the image.
+
+    """
+
+    src_w = tex.get_x_size()
+    src_h = tex.get_y_size()
+    pixel_size = tex.get_num_components() * tex.get_component_width()
+    src_view = memoryview(tex.get_ram_image()).cast("B")
+    src_row_size = src_w * pixel_size
+    dest_row_size = width * pixel_size
+    dest_data = bytearray(dest_row_size * height)
+    x_start = max(0, x)
+    x_end = min(src_w, x + width)
+
+    if x_start < x_end:
+
+        src_offset = x_start * pixel_size
+        dest_offset = (x_start - x) * pixel_size
+        size = (x_end - x_start) * pixel_size
+        # the rows of a RAM image are stored from bottom to top
+        src_row_offset = src_h - y - height
+
+        for i in range(max(0, -src_row_offset), min(height, src_h - src_row_offset)):
+            src_start = (src_row_offset + i) * src_row_size + src_offset
+            dest_start = i * dest_row_size + dest_offset
+            dest_data[dest_start:dest_start+size] = src_view[src_start:src_start+size]
+
+    tex.setup_2d_texture(width, height, tex.get_component_type(), tex.get_format())
+    tex.set_ram_image(dest_data)
+
+
+def expand_mask_texture(tex, border):
+
+    crop_mask_texture(tex, -border, -border, tex.get_x_size() + border * 2,
+                      tex.get_y_size() + border * 2)
+
+
 def _get_camera_mask():
 
     prev_bit = 0
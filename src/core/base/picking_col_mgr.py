@@ -1,6 +1,5 @@
 from .mgr import CoreManager as Mgr
-from .base import logging, PendingTasks
-from functools import reduce
+from .base import logging, bisect, PendingTasks
 
 
 # All managers of pickable objects should derive from the following class
@@ -81,6 +80,8 @@ class PickingColorIDManager(object):
         self._ids_to_recover = set()
         self._ids_to_discard = set()
         self._id_ranges_backup = None
+        # the backup shares the list of ID ranges until either of them is changed
+        self._id_ranges_shared = False
 
     def reset(self):
 
@@ -88,6 +89,7 @@ class PickingColorIDManager(object):
         self._ids_to_recover = set()
         self._ids_to_discard = set()
         self._id_ranges_backup = None
+        self._id_ranges_shared = False
         logging.debug('"{}" picking color IDs reset.'.format(self.get_managed_object_type()))
 
     def __get_ranges(self, lst):
@@ -98,54 +100,84 @@ class PickingColorIDManager(object):
         return list(zip([i for i in lst if i - 1 != next(l)],
                    [i + 1 for i in [i for i in lst if i + 1 != next(m)]]))
 
-    def __merge_ranges(self, range_list, next_range):
+    def __add_range(self, id_ranges, range_start, range_end):
+        """
+        Insert the given range of IDs into the sorted list of ID ranges, merging it
+        only with the neighbouring ranges it touches or overlaps.
 
-        if range_list:
+        """
 
-            prev_range_start, prev_range_end = range_list[-1]
-            next_range_start, next_range_end = next_range
+        i = bisect.bisect_left(id_ranges, (range_start,))
 
-            if prev_range_end == next_range_start:
-                del range_list[-1]
-                range_list.append((prev_range_start, next_range_end))
-                return range_list
+        if i and id_ranges[i - 1][1] >= range_start:
+            i -= 1
+            range_start = id_ranges[i][0]
+            range_end = max(range_end, id_ranges[i][1])
 
-        return range_list + [next_range]
+        j = i
+        count = len(id_ranges)
 
-    def __split_ranges(self, range_list, next_range):
+        while j < count and id_ranges[j][0] <= range_end:
+            range_end = max(range_end, id_ranges[j][1])
+            j += 1
 
-        if range_list:
+        id_ranges[i:j] = [(range_start, range_end)]
 
-            prev_range_start, prev_range_end = range_list[-1]
-            next_range_start, next_range_end = next_range
+    def __remove_range(self, id_ranges, range_start, range_end):
+        """
+        Remove the given range of IDs from the sorted list of ID ranges, splitting
+        only the neighbouring ranges it overlaps.
 
-            if next_range_start < prev_range_end:
+        """
 
-                del range_list[-1]
+        i = bisect.bisect_left(id_ranges, (range_start,))
 
-                if prev_range_start != next_range_start:
-                    range_list.append((prev_range_start, next_range_start))
+        if i and id_ranges[i - 1][1] > range_start:
+            i -= 1
 
-                if prev_range_end != next_range_end:
-                    min_range_end = min(prev_range_end, next_range_end)
-                    max_range_end = max(prev_range_end, next_range_end)
-                    range_list.append((min_range_end, max_range_end))
+        j = i
+        count = len(id_ranges)
+        remaining_ranges = []
 
-                return range_list
+        while j < count and id_ranges[j][0] < range_end:
 
-        return range_list + [next_range]
+            start, end = id_ranges[j]
+
+            if start < range_start:
+                remaining_ranges.append((start, range_start))
+
+            if end > range_end:
+                remaining_ranges.append((range_end, end))
+
+            j += 1
+
+        id_ranges[i:j] = remaining_ranges
+
+    def __unshare_id_ranges(self):
+
+        if self._id_ranges_shared:
+            self._id_ranges = self._id_ranges[:]
+            self._id_ranges_shared = False
 
     def get_next_picking_color_id(self):
 
-        if not self._id_ranges:
+        id_ranges = self._id_ranges
+
+        if not id_ranges:
             # TODO: pop up a message notifying the user that no more objects
             # can be created
             return
 
-        next_id, range_end = self._id_ranges.pop(0)
+        self.__unshare_id_ranges()
+        id_ranges = self._id_ranges
+        next_id, range_end = id_ranges[0]
 
+        # the first range is only removed from the list once it is used up, so
+        # retrieving the next ID does not involve shifting all of the ranges
         if next_id + 1 < range_end:
-            self._id_ranges.insert(0, (next_id + 1, range_end))
+            id_ranges[0] = (next_id + 1, range_end)
+        else:
+            del id_ranges[0]
 
         return next_id
 
@@ -159,7 +191,7 @@ class PickingColorIDManager(object):
 
         self._ids_to_recover.update(color_ids)
         logging.debug('****** {} picking color IDs recovered:\n{}'.format(self.get_managed_object_type(),
-                      self.__get_ranges(sorted(self._ids_to_recover))))
+                      self.__get_ranges(sorted(color_ids))))
 
     def discard_picking_color_id(self, color_id):
         """ Discard the given color ID, so it can no longer be used """
@@ -171,17 +203,19 @@ class PickingColorIDManager(object):
 
         self._ids_to_discard.update(color_ids)
         logging.debug('****** {} picking color IDs discarded:\n{}'.format(self.get_managed_object_type(),
-                      self.__get_ranges(sorted(self._ids_to_discard))))
+                      self.__get_ranges(sorted(color_ids))))
 
     def update_picking_color_id_ranges(self):
 
-        id_ranges = self._id_ranges
         set_to_recover = self._ids_to_recover
         set_to_discard = self._ids_to_discard
 
         if not (set_to_recover or set_to_discard):
             return
 
+        self.__unshare_id_ranges()
+        id_ranges = self._id_ranges
+
         logging.debug('++++++ Updating {} picking color IDs ranges, starting with:\n{}'.format(
                       self.get_managed_object_type(), id_ranges))
 
@@ -195,17 +229,17 @@ class PickingColorIDManager(object):
             id_ranges_to_recover = self.__get_ranges(sorted(set_to_recover))
             logging.debug('++++++ Recovering {} picking color IDs:\n{}'.format(
                           self.get_managed_object_type(), id_ranges_to_recover))
-            id_ranges += id_ranges_to_recover
-            id_ranges.sort()
-            id_ranges[:] = reduce(self.__merge_ranges, id_ranges[:], [])
+
+            for range_start, range_end in id_ranges_to_recover:
+                self.__add_range(id_ranges, range_start, range_end)
 
         if set_to_discard:
             id_ranges_to_discard = self.__get_ranges(sorted(set_to_discard))
             logging.debug('++++++ Discarding {} picking color IDs:\n{}'.format(
                           self.get_managed_object_type(), id_ranges_to_discard))
-            id_ranges += id_ranges_to_discard
-            id_ranges.sort()
-            id_ranges[:] = reduce(self.__split_ranges, id_ranges[:], [])
+
+            for range_start, range_end in id_ranges_to_discard:
+                self.__remove_range(id_ranges, range_start, range_end)
 
         self._ids_to_recover = set()
         self._ids_to_discard = set()
@@ -228,17 +262,23 @@ class PickingColorIDManager(object):
 
     def create_id_ranges_backup(self):
 
-        self._id_ranges_backup = self._id_ranges[:]
+        # instead of copying the ID ranges right away, the list is only copied when
+        # it needs to be changed while the backup exists
+        self._id_ranges_backup = self._id_ranges
+        self._id_ranges_shared = True
         logging.debug('"{}" picking color IDs backup created:\n{}'.format(self.get_managed_object_type(),
                       self._id_ranges_backup))
 
     def restore_id_ranges_backup(self):
 
         self._id_ranges = self._id_ranges_backup
+        # the backup is about to be removed, so the ranges are no longer shared
+        self._id_ranges_shared = False
         logging.debug('"{}" picking color IDs backup restored:\n{}'.format(self.get_managed_object_type(),
                       self._id_ranges))
 
     def remove_id_ranges_backup(self):
 
         self._id_ranges_backup = None
+        self._id_ranges_shared = False
         logging.debug('"{}" picking color IDs backup removed.'.format(self.get_managed_object_type()))
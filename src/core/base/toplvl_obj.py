@@ -29,6 +29,7 @@ class TopLevelObject(BaseObject):
         origin = self._origin
         origin.reparent_to(pivot)
         self._pivot_gizmo = Mgr.do("create_pivot_gizmo", self)
+        Mgr.do("invalidate_picking")
 
     def __init__(self, obj_type, obj_id, name, origin_pos, has_color=False):
 
@@ -60,6 +61,7 @@ class TopLevelObject(BaseObject):
             pivot.set_pos_hpr(grid_origin, origin_pos, VBase3(0., 0., 0.))
 
         self._pivot_gizmo = Mgr.do("create_pivot_gizmo", self)
+        Mgr.do("invalidate_picking")
 
     def cancel_creation(self):
 
@@ -73,20 +75,16 @@ class TopLevelObject(BaseObject):
         self._origin = None
         self._pivot.remove_node()
         self._pivot = None
+        Mgr.do("invalidate_picking")
 
     def __update_obj_names(self, name=None):
 
         obj_names = GlobalData["obj_names"]
 
         if name is None:
-
-            value = self._name.get_value()
-
-            if value in obj_names:
-                obj_names.remove(value)
-
-        elif name not in obj_names:
-            obj_names.append(name)
+            obj_names.discard(self._name.get_value())
+        else:
+            obj_names.add(name)
 
     def destroy(self, unregister=True, add_to_hist=True):
 
@@ -117,6 +115,7 @@ class TopLevelObject(BaseObject):
         self._origin = None
         self._pivot.remove_node()
         self._pivot = None
+        Mgr.do("invalidate_picking")
 
         if unregister:
             Mgr.do("unregister_{}".format(self._type), self)
@@ -320,6 +320,12 @@ class MainCamera(BaseObject):
         self._zoom_indicator_dot.set_scale(scale)
 
 
+# the maximum number of consecutive frames in which the picking buffer is not rendered
+# because nothing that affects picking was found to have changed; this limits the time
+# that changes to pickable geometry which are not detected otherwise can go unnoticed
+MAX_SKIPPED_PICKING_FRAMES = 10
+
+
 class PickingCamera(BaseObject):
 
     def __init__(self):
@@ -343,11 +349,22 @@ class PickingCamera(BaseObject):
         self._combined_mask = comb_mask
         self._pixel_color = VBase4()
         self._transformer = None
+        # the picking buffer is only rendered when the picking camera, its lens or
+        # mask, the active object level or the pickable geometry (as tracked by
+        # the picking version) has changed since the previous render
+        self._picking_state = None
+        self._picking_version = 0
+        self._render_requested = False
+        self._skipped_frames = 0
+        self._render_stats = {"rendered": 0, "skipped": 0}
 
         Mgr.expose("picking_mask", lambda index=0: self._masks[index])
         Mgr.expose("picking_masks", lambda: self._combined_mask)
         Mgr.expose("pixel_under_mouse", lambda: VBase4(self._pixel_color))
+        Mgr.expose("picking_render_stats", lambda: self._render_stats.copy())
+        Mgr.accept("invalidate_picking", self.__invalidate_picking)
         Mgr.add_app_updater("viewport", self.__update_frustum)
+        Mgr.add_app_updater("history_change", self.__invalidate_picking)
 
     def __call__(self):
 
@@ -461,10 +478,16 @@ class PickingCamera(BaseObject):
 
         self._transformer = transformer
 
+    def __invalidate_picking(self):
+        """ Make sure the picking buffer is rendered in the next frame """
+
+        self._picking_version += 1
+
     def set_active(self, is_active=True):
 
         self._buffer.set_active(is_active)
         self._np.node().set_active(is_active)
+        self._picking_state = None
         Mgr.remove_task("get_pixel_under_mouse")
 
         if is_active:
@@ -478,6 +501,8 @@ class PickingCamera(BaseObject):
             self._buffer.set_active(False)
             self._np.node().set_active(False)
             self._pixel_color = VBase4()
+            self._picking_state = None
+            self._render_requested = False
             return task.cont
 
         if not self._np.node().is_active():
@@ -500,11 +525,32 @@ class PickingCamera(BaseObject):
                 far_point.y = 0.
                 self._np.set_pos(far_point)
 
+        # the picking buffer rendered in the previous frame (if any) is read back
         if self._tex_peeker:
-            self._tex_peeker.lookup(self._pixel_color, .5, .5)
+            if self._render_requested:
+                self._tex_peeker.lookup(self._pixel_color, .5, .5)
         else:
             self._tex_peeker = self._tex.peek()
 
+        node = self._np.node()
+        picking_state = (self._np.get_mat(self.world), Mat4(node.get_lens().get_projection_mat()),
+                         node.get_camera_mask().get_word(), GlobalData["active_obj_level"],
+                         self._picking_version)
+        stats = self._render_stats
+
+        if (picking_state != self._picking_state
+                or self._skipped_frames >= MAX_SKIPPED_PICKING_FRAMES):
+            self._picking_state = picking_state
+            self._skipped_frames = 0
+            self._render_requested = True
+            stats["rendered"] += 1
+        else:
+            self._skipped_frames += 1
+            self._render_requested = False
+            stats["skipped"] += 1
+
+        self._buffer.set_active(self._render_requested)
+
         return task.cont
 
 
@@ -1,50 +1,55 @@
 from .base import *
 
+# the number of lines gathered before they are written to an exported OBJ file
+OBJ_WRITE_CHUNK_SIZE = 4096
+
 
 class ExportManager(BaseObject):
 
     def __init__(self):
 
+        # if "polygons" is True, the polygons of editable models are exported to
+        # OBJ files as faces, instead of their triangles
+        obj_export_options = {"polygons": False}
+        copier = dict.copy
+        GlobalData.set_default("obj_export_options", obj_export_options, copier)
+
         Mgr.add_app_updater("export", self.__update_export)
 
     def __merge_duplicate_vertices(self, geom_data_obj):
 
         verts = geom_data_obj.get_subobjects("vert")
         merged_verts = set(geom_data_obj.get_merged_vertex(v_id) for v_id in verts)
-        rows = list(range(len(verts)))
-        dupes = {}
+        row_count = len(verts)
+        # for each row, the row of the (first) vertex it duplicates, or the row
+        # itself if it is not a duplicate
+        src_rows = list(range(row_count))
 
         for merged_vert in merged_verts:
 
-            verts1 = [verts[v_id] for v_id in merged_vert]
-            verts2 = verts1[:]
-
-            for vert1 in verts1:
-
-                pos1 = vert1.get_pos()
-                normal1 = vert1.get_normal()
-                uv1 = vert1.get_uvs()
-                col1 = vert1.get_color()
-                row1 = vert1.get_row_index()
+            # vertices within the same merged vertex are duplicates if all of
+            # their data is the same; group them by that data in a single pass
+            rows_by_data = {}
 
-                if row1 in dupes:
-                    continue
+            for v_id in merged_vert:
 
-                for vert2 in verts2[:]:
+                vert = verts[v_id]
+                col = vert.get_color()
+                data = (tuple(vert.get_pos()), tuple(vert.get_normal()),
+                        tuple(sorted(vert.get_uvs().items())),
+                        None if col is None else tuple(col))
+                row = vert.get_row_index()
 
-                    if vert2 is vert1:
-                        continue
+                if data in rows_by_data:
+                    src_rows[row] = rows_by_data[data]
+                else:
+                    rows_by_data[data] = row
 
-                    pos2 = vert2.get_pos()
-                    normal2 = vert2.get_normal()
-                    uv2 = vert2.get_uvs()
-                    col2 = vert2.get_color()
+        rows = [row for row in range(row_count) if src_rows[row] == row]
+        new_rows = [0] * row_count
 
-                    if pos2 == pos1 and normal2 == normal1 and uv2 == uv1 and col2 == col1:
-                        row2 = vert2.get_row_index()
-                        rows.remove(row2)
-                        verts2.remove(vert2)
-                        dupes[row2] = row1
+        for row_dest, row_src in enumerate(rows):
+            new_rows[row_src] = row_dest
 
         geom = geom_data_obj.get_toplevel_node().get_geom(0)
         vdata_src = geom.get_vertex_data()
@@ -55,16 +60,23 @@ class ExportManager(BaseObject):
         for row_dest, row_src in enumerate(rows):
             vdata_dest.copy_row_from(row_dest, vdata_src, row_src, thread)
 
-        for row2, row1 in list(dupes.items()):
-            dupes[row2] = rows.index(row1)
-
         prim_src = geom.get_primitive(0)
+        index_view = memoryview(prim_src.get_vertices()).cast("B")
+        index_view = index_view.cast("H" if prim_src.index_type == Geom.NT_uint16 else "I")
         prim_dest = GeomTriangles(Geom.UH_static)
-        rows_src = prim_src.get_vertex_list()
-        rows_dest = [dupes[row] if row in dupes else rows.index(row) for row in rows_src]
 
-        for indices in (rows_dest[i:i + 3] for i in range(0, len(rows_dest), 3)):
-            prim_dest.add_vertices(*indices)
+        if len(rows) < 65535:
+            prim_dest.set_index_type(Geom.NT_uint16)
+            index_format = "H"
+        else:
+            prim_dest.set_index_type(Geom.NT_uint32)
+            index_format = "I"
+
+        # remap the indices of the primitive in one go, instead of per triangle
+        indices = array.array(index_format, [new_rows[src_rows[row]] for row in index_view])
+        index_array = prim_dest.modify_vertices()
+        index_array.unclean_set_num_rows(len(indices))
+        memoryview(index_array).cast("B")[:] = memoryview(indices).cast("B")
 
         geom_dest = Geom(vdata_dest)
         geom_dest.add_primitive(prim_dest)
@@ -474,15 +486,37 @@ class ExportManager(BaseObject):
 
         material_data = {}
         flat_color_index = 0
-        row_offset = 1
-        namelist = []
+        namelist = NameRegistry()
+        export_polys = GlobalData["obj_export_options"]["polygons"]
+        start_time = time.perf_counter()
+        # the position, UV and normal lines are only written once for each unique
+        # value, each mapped to its (1-based) index in the file
+        line_indices = {"v": {}, "vt": {}, "vn": {}}
+        lines = []
+
+        def add_data_line(data_type, line):
+
+            indices = line_indices[data_type]
+            index = indices.get(line)
+
+            if index is None:
+                index = indices[line] = len(indices) + 1
+                lines.append(line)
+
+            return index
 
         with open(filename, "w") as obj_file:
 
-            obj_file.write("# Created with Panda3D Studio\n\n")
+            def write_lines(force=False):
+
+                if lines and (force or len(lines) >= OBJ_WRITE_CHUNK_SIZE):
+                    obj_file.write("".join(lines))
+                    del lines[:]
+
+            lines.append("# Created with Panda3D Studio\n\n")
             fname = os.path.basename(filename)
             mtllib_name = os.path.splitext(fname)[0]
-            obj_file.write("mtllib {}.mtl\n".format(mtllib_name))
+            lines.append("mtllib {}.mtl\n".format(mtllib_name))
 
             while objs:
 
@@ -490,9 +524,9 @@ class ExportManager(BaseObject):
 
                 if obj.get_type() == "model":
 
-                    name = get_unique_name(obj.get_name().replace(" ", "_"), namelist)
-                    namelist.append(name)
-                    obj_file.write("\ng {}\n\n".format(name))
+                    name = namelist.get_unique_name(obj.get_name().replace(" ", "_"))
+                    namelist.add(name)
+                    lines.append("\ng {}\n\n".format(name))
 
                     geom_obj = obj.get_geom_object()
 
@@ -570,37 +604,58 @@ class ExportManager(BaseObject):
                     origin = obj.get_origin()
                     mat = origin.get_net_transform().get_mat() * convert_mat
                     vertex_data.transform_vertices(mat)
-                    pos_reader = GeomVertexReader(vertex_data, "vertex")
-                    uv_reader = GeomVertexReader(vertex_data, "texcoord")
-                    normal_reader = GeomVertexReader(vertex_data, "normal")
-                    row_count = vertex_data.get_num_rows()
+                    positions = get_vertex_column_values(vertex_data, "vertex")
+                    uvs = get_vertex_column_values(vertex_data, "texcoord")
+                    normals = get_vertex_column_values(vertex_data, "normal")
+                    row_data = []
+
+                    for pos, uv, normal in zip(positions, uvs, normals):
+                        i1 = add_data_line("v", "v {:.6f} {:.6f} {:.6f}\n".format(*pos))
+                        i2 = add_data_line("vt", "vt {:.6f} {:.6f}\n".format(*uv))
+                        i3 = add_data_line("vn", "vn {:.6f} {:.6f} {:.6f}\n".format(*normal))
+                        row_data.append("{:d}/{:d}/{:d}".format(i1, i2, i3))
+                        write_lines()
+
+                    lines.append("\nusemtl {}\n".format(material_alias))
+                    lines.append("# {}\n".format(material_name))
+
+                    if export_polys and obj.get_geom_type() != "basic_geom":
+
+                        verts = geom_data_obj.get_subobjects("vert")
+                        flip = geom_obj.has_flipped_normals()
 
-                    for i in range(row_count):
-                        x, y, z = pos_reader.get_data3()
-                        u, v = uv_reader.get_data2()
-                        xn, yn, zn = normal_reader.get_data3()
-                        obj_file.write("v {:.6f} {:.6f} {:.6f}\n".format(x, y, z))
-                        obj_file.write("vt {:.6f} {:.6f}\n".format(u, v))
-                        obj_file.write("vn {:.6f} {:.6f} {:.6f}\n".format(xn, yn, zn))
+                        for poly in geom_data_obj.get_subobjects("poly").values():
 
-                    obj_file.write("\nusemtl {}\n".format(material_alias))
-                    obj_file.write("# {}\n".format(material_name))
+                            rows = [verts[v_id].get_row_index() for v_id in poly.get_vertex_ids()]
 
-                    index_list = node.node().get_geom(0).get_primitive(0).get_vertex_list()
-                    index_count = len(index_list)
+                            if flip:
+                                rows.reverse()
 
-                    for i in range(0, index_count, 3):
-                        i1, i2, i3 = [j + row_offset for j in index_list[i:i+3]]
-                        indices = (i1, i1, i1, i2, i2, i2, i3, i3, i3)
-                        obj_file.write("f {:d}/{:d}/{:d} {:d}/{:d}/{:d} {:d}/{:d}/{:d}\n".format(*indices))
+                            lines.append("f {}\n".format(" ".join(row_data[row] for row in rows)))
+                            write_lines()
 
-                    row_offset += row_count
+                    else:
+
+                        index_list = node.node().get_geom(0).get_primitive(0).get_vertex_list()
+
+                        for i in range(0, len(index_list), 3):
+                            i1, i2, i3 = index_list[i:i+3]
+                            lines.append("f {} {} {}\n".format(row_data[i1], row_data[i2], row_data[i3]))
+                            write_lines()
 
                 children = obj.get_children()
 
                 if children:
                     objs.extend(children)
 
+            write_lines(force=True)
+
+        duration = time.perf_counter() - start_time
+        size = os.path.getsize(filename) / 1048576.
+        throughput = size / duration if duration else 0.
+        logging.info('OBJ export: {:.2f} MB written in {:.2f} s ({:.2f} MB/s).'.format(
+                     size, duration, throughput))
+
         mtllib_fname = os.path.splitext(filename)[0] + ".mtl"
 
         with open(mtllib_fname, "w") as mtl_file:
@@ -625,10 +680,13 @@ class ExportManager(BaseObject):
                 if "dissolve_map" in data:
                     mtl_file.write("map_d {}\n".format(data["dissolve_map"]))
 
-    def __export(self, filename):
+    def __export(self, filename, obj_export_options=None):
 
         ext = os.path.splitext(filename)[1]
 
+        if obj_export_options:
+            GlobalData["obj_export_options"].update(obj_export_options)
+
         if ext == ".bam":
             self.__export_to_bam(filename)
         elif ext == ".obj":
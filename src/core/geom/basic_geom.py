@@ -247,112 +247,33 @@ class BasicGeom(BaseObject):
         vertex_data = self._geom.node().modify_geom(0).modify_vertex_data()
         vert_indices = self._geom.node().get_geom(0).get_primitive(0).get_vertex_list()
 
-        pos_reader = GeomVertexReader(vertex_data, "vertex")
-        normal_reader = GeomVertexReader(vertex_data, "normal")
-        uv_reader = GeomVertexReader(vertex_data, "texcoord")
-        tan_writer = GeomVertexWriter(vertex_data, "tangent")
-        bitan_writer = GeomVertexWriter(vertex_data, "binormal")
-        vert_handlers = (pos_reader, normal_reader, uv_reader, tan_writer, bitan_writer)
-
-        processed_rows = []
-        epsilon = 1.e-010
-
-        for rows in (vert_indices[i:i + 3] for i in range(0, len(vert_indices), 3)):
-
-            for row in rows:
-
-                if row in processed_rows:
-                    continue
-
-                other_rows = list(rows)
-                other_rows.remove(row)
-                row1, row2 = other_rows
+        # read the needed columns at once, instead of row by row
+        positions = get_vertex_column_values(vertex_data, "vertex")
+        normals = get_vertex_column_values(vertex_data, "normal")
+        uvs = get_vertex_column_values(vertex_data, "texcoord")
+        tangents = {}
+        bitangents = {}
 
-                for handler in vert_handlers:
-                    handler.set_row(row)
-
-                pos = pos_reader.get_data3()
-                normal = normal_reader.get_data3()
-                uv = uv_reader.get_data2()
+        for i in range(0, len(vert_indices), 3):
 
-                pos_reader.set_row(row1)
-                pos1 = pos_reader.get_data3()
-                pos_reader.set_row(row2)
-                pos2 = pos_reader.get_data3()
-                pos_vec1 = pos1 - pos
-                pos_vec2 = pos2 - pos
-
-                uv_reader.set_row(row1)
-                uv1 = uv_reader.get_data2()
-                uv_reader.set_row(row2)
-                uv2 = uv_reader.get_data2()
-                uv_vec1 = uv1 - uv
-                uv_vec2 = uv2 - uv
-
-                # compute a vector pointing in the +U direction, in texture space
-                # and in world space
-
-                if abs(uv_vec1.y) < epsilon:
-                    u_vec_local = uv_vec1
-                    u_vec_world = Vec3(pos_vec1)
-                elif abs(uv_vec2.y) < epsilon:
-                    u_vec_local = uv_vec2
-                    u_vec_world = Vec3(pos_vec2)
-                else:
-                    scale = (uv_vec1.y / uv_vec2.y)
-                    u_vec_local = uv_vec1 - uv_vec2 * scale
-                    # u_vec_local.y will be 0 and thus point in the -/+U direction;
-                    # replacing the texture-space vectors with the corresponding
-                    # world-space vectors will therefore yield a world-space U-vector
-                    u_vec_world = pos_vec1 - pos_vec2 * scale
-
-                if u_vec_local.x < 0.:
-                    u_vec_world *= -1.
-
-                # compute a vector pointing in the +V direction, in texture space
-                # and in world space
-
-                if abs(uv_vec1.x) < epsilon:
-                    v_vec_local = uv_vec1
-                    v_vec_world = Vec3(pos_vec1)
-                elif abs(uv_vec2.x) < epsilon:
-                    v_vec_local = uv_vec2
-                    v_vec_world = Vec3(pos_vec2)
-                else:
-                    scale = (uv_vec1.x / uv_vec2.x)
-                    v_vec_local = uv_vec1 - uv_vec2 * scale
-                    # v_vec_local.x will be 0 and thus point in the -/+V direction;
-                    # replacing the texture-space vectors with the corresponding
-                    # world-space vectors will therefore yield a world-space V-vector
-                    v_vec_world = pos_vec1 - pos_vec2 * scale
-
-                if v_vec_local.y < 0.:
-                    v_vec_world *= -1.
-
-                tangent_plane = Plane(normal, Point3())
-                # the tangent vector is the world-space U-vector projected onto
-                # the tangent plane
-                tangent = Vec3(tangent_plane.project(Point3(u_vec_world)))
-
-                if not tangent.normalize():
-                    continue
+            rows = vert_indices[i:i + 3]
 
-                # the bitangent vector is the world-space V-vector projected onto
-                # the tangent plane
-                bitangent = Vec3(tangent_plane.project(Point3(v_vec_world)))
+            for j, row in enumerate(rows):
 
-                if not bitangent.normalize():
+                if row in tangents:
                     continue
 
-                if flip_tangent:
-                    tangent *= -1.
+                row1, row2 = rows[:j] + rows[j + 1:]
+                tangent_space = compute_tangent_space(positions[row], positions[row1],
+                                                      positions[row2], uvs[row], uvs[row1],
+                                                      uvs[row2], normals[row], flip_tangent,
+                                                      flip_bitangent)
 
-                if flip_bitangent:
-                    bitangent *= -1.
+                if tangent_space:
+                    tangents[row], bitangents[row] = tangent_space
 
-                tan_writer.set_data3(tangent)
-                bitan_writer.set_data3(bitangent)
-                processed_rows.append(row)
+        set_vertex_column_values(vertex_data, "tangent", tangents)
+        set_vertex_column_values(vertex_data, "binormal", bitangents)
 
         self._is_tangent_space_initialized = True
 
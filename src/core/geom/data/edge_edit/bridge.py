@@ -203,8 +203,7 @@ class EdgeBridgeBase(BaseObject):
         poly = Mgr.do("create_poly", self, poly_tris, poly_edges, poly_verts)
         ordered_polys.append(poly)
         polys[poly.get_id()] = poly
-        poly.update_center_pos()
-        poly.update_normal()
+        self.update_poly_geometry([poly])
         normal = poly.get_normal().normalized()
 
         for vert in poly_verts:
@@ -232,7 +231,7 @@ class EdgeBridgeBase(BaseObject):
         # currently backed up
         if "poly" in self._sel_subobj_ids_backup:
 
-            selected_poly_ids = self._sel_subobj_ids_backup["poly"][:]
+            selected_poly_ids = SelectedIDList(self._sel_subobj_ids_backup["poly"])
 
             # the current selection (the picked helper poly) may not be made empty,
             # or the call to self.clear_selection() will have no effect and leave
@@ -17,7 +17,7 @@ class EdgeMergeBase(BaseObject):
         # currently backed up
         if "poly" in self._sel_subobj_ids_backup:
 
-            selected_poly_ids = self._sel_subobj_ids_backup["poly"][:]
+            selected_poly_ids = SelectedIDList(self._sel_subobj_ids_backup["poly"])
 
             # the current selection (the picked helper poly) may not be made empty,
             # or the call to self.clear_selection() will have no effect and leave
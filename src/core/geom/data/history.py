@@ -1,14 +1,110 @@
 from ...base import *
 
+# the time IDs of the events that changed a per-subobject property (e.g. vertex
+# positions) are stored as a chain; a full copy of that chain (a keyframe) is only
+# stored once every TIME_ID_KEYFRAME_INTERVAL changes, while in between, only the
+# time IDs added since the last keyframe are stored
+TIME_ID_KEYFRAME_INTERVAL = 64
+
 
 class GeomHistoryBase(BaseObject):
 
     def __init__(self):
 
         self._subobj_change = {"vert": {}, "edge": {}, "poly": {}}
+        # incremented whenever data is stored in or restored from the history,
+        # so other objects can tell whether their copy of that data is outdated
+        self._data_version = 0
+        # the last loaded or stored value of each time ID chain, along with the
+        # time ID it was stored at, per unique property ID
+        self._time_id_chains = {}
+
+    def get_data_version(self):
+
+        return self._data_version
+
+    def __load_last_time_ids(self, prop_id, time_id=None):
+        """
+        Return the value last stored for the given time ID chain at the given time.
+        The history file is only read if that value isn't cached yet.
+
+        """
+
+        obj_id = self.get_toplevel_object().get_id()
+        last_time_id = Mgr.get("last_history_time", obj_id, prop_id, time_id)
+
+        if last_time_id is None:
+            return
+
+        cached_time_id, time_ids = self._time_id_chains.get(prop_id, (None, None))
+
+        if cached_time_id != last_time_id:
+            time_ids = Mgr.do("load_from_history", obj_id, prop_id, last_time_id)
+            self._time_id_chains[prop_id] = (last_time_id, time_ids)
+
+        return time_ids
+
+    def _load_time_id_chain(self, prop_id, time_id=None):
+        """
+        Return the full chain of time IDs stored for the given unique property ID
+        at the given time, or None if no such chain was stored.
+
+        """
+
+        obj_id = self.get_toplevel_object().get_id()
+        time_ids = self.__load_last_time_ids(prop_id, time_id)
+
+        if time_ids is None or type(time_ids) is tuple:
+            return time_ids
+
+        keyframe_id = "{}__time_ids__extra__".format(prop_id)
+        keyframe = Mgr.do("load_from_history", obj_id, keyframe_id, time_ids["keyframe"])
+
+        return keyframe + time_ids["time_ids"]
+
+    def __get_time_id_chain_to_store(self, prop_id, extra_data):
+        """
+        Return the value to store for the given unique property ID, such that it
+        represents the last stored chain of time IDs, extended with the current time ID.
+        When a keyframe needs to be stored, it is added to the given extra data.
+
+        """
+
+        cur_time_id = Mgr.do("get_history_time")
+        time_ids = self.__load_last_time_ids(prop_id)
+
+        if time_ids is None:
+
+            new_time_ids = (cur_time_id,)
+
+        elif type(time_ids) is tuple and len(time_ids) < TIME_ID_KEYFRAME_INTERVAL:
+
+            new_time_ids = time_ids + (cur_time_id,)
+
+        elif type(time_ids) is dict and len(time_ids["time_ids"]) < TIME_ID_KEYFRAME_INTERVAL:
+
+            new_time_ids = {"keyframe": time_ids["keyframe"],
+                            "time_ids": time_ids["time_ids"] + (cur_time_id,)}
+
+        else:
+
+            if type(time_ids) is tuple:
+                keyframe = time_ids + (cur_time_id,)
+            else:
+                keyframe = self._load_time_id_chain(prop_id) + (cur_time_id,)
+
+            extra_data["{}__time_ids__extra__".format(prop_id)] = keyframe
+            new_time_ids = {"keyframe": cur_time_id, "time_ids": ()}
+
+        # if the new value doesn't end up in the history, the time ID it is cached
+        # with won't be the last one at which the property changed, so it won't be used
+        self._time_id_chains[prop_id] = (cur_time_id, new_time_ids)
+
+        return new_time_ids
 
     def get_data_to_store(self, event_type="", prop_id="", info="", unique_id=False):
 
+        self._data_version += 1
         data = {}
         unique_prop_ids = self._unique_prop_ids
         obj_id = self.get_toplevel_object().get_id()
@@ -48,14 +144,13 @@ class GeomHistoryBase(BaseObject):
 
             for subobj_type in ("vert", "edge", "poly"):
 
-                prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_ids["{}s".format(subobj_type)])
-                prev_time_ids += (cur_time_id,)
-
                 subobjs = iter(self._subobjs[subobj_type].items())
                 creation_times = dict((s_id, s.get_creation_time()) for s_id, s in subobjs)
                 extra_data = {unique_prop_ids["{}__extra__".format(subobj_type)]: {"deleted": creation_times}}
+                subobjs_prop_id = unique_prop_ids["{}s".format(subobj_type)]
+                prev_time_ids = self.__get_time_id_chain_to_store(subobjs_prop_id, extra_data)
 
-                data[unique_prop_ids["{}s".format(subobj_type)]] = {"main": prev_time_ids, "extra": extra_data}
+                data[subobjs_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
             toplvl_obj = self.get_toplevel_object()
             data["tangent space"] = {"main": toplvl_obj.get_property("tangent space")}
@@ -81,8 +176,6 @@ class GeomHistoryBase(BaseObject):
 
             for subobj_type in ("vert", "edge", "poly"):
 
-                prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_ids["{}s".format(subobj_type)])
-                prev_time_ids += (cur_time_id,)
                 data_to_store = {}
 
                 if "deleted" in subobj_change[subobj_type]:
@@ -105,7 +198,9 @@ class GeomHistoryBase(BaseObject):
                     data_to_store["created"] = pickled_objs
 
                 extra_data = {unique_prop_ids["{}__extra__".format(subobj_type)]: data_to_store}
-                data[unique_prop_ids["{}s".format(subobj_type)]] = {"main": prev_time_ids, "extra": extra_data}
+                subobjs_prop_id = unique_prop_ids["{}s".format(subobj_type)]
+                prev_time_ids = self.__get_time_id_chain_to_store(subobjs_prop_id, extra_data)
+                data[subobjs_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
             self._subobj_change = {"vert": {}, "edge": {}, "poly": {}}
 
@@ -149,6 +244,7 @@ class GeomHistoryBase(BaseObject):
 
     def get_property_to_store(self, prop_id, event_type="", info="", unique_id=False):
 
+        self._data_version += 1
         data = {}
         unique_prop_ids = self._unique_prop_ids
         unique_prop_id = prop_id if unique_id else (unique_prop_ids[prop_id]
@@ -178,25 +274,19 @@ class GeomHistoryBase(BaseObject):
 
         elif unique_prop_id == unique_prop_ids["subobj_selection"]:
 
-            sel_subobj_ids = copy.deepcopy(self._selected_subobj_ids)
+            sel_subobj_ids = dict((subobj_type, subobj_ids[:]) for subobj_type, subobj_ids
+                                  in self._selected_subobj_ids.items())
             sel_subobj_ids.update(self._sel_subobj_ids_backup)
             data[unique_prop_id] = {"main": sel_subobj_ids}
 
         elif unique_prop_id == unique_prop_ids["subobj_transform"]:
 
-            obj_id = self.get_toplevel_object().get_id()
             subobj_lvl = GlobalData["active_obj_level"]
             pos_data = {"prev": {}, "pos": {}}
             extra_data = {unique_prop_ids["vert_pos__extra__"]: pos_data}
             cur_time_id = Mgr.do("get_history_time")
-            prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_id)
             verts = self._subobjs["vert"]
 
-            if prev_time_ids:
-                prev_time_ids += (cur_time_id,)
-            else:
-                prev_time_ids = (cur_time_id,)
-
             if event_type == "creation":
 
                 for vert_id, vert in verts.items():
@@ -251,23 +341,17 @@ class GeomHistoryBase(BaseObject):
 
                     merged_vert.set_previous_property_time("transform", cur_time_id)
 
+            prev_time_ids = self.__get_time_id_chain_to_store(unique_prop_id, extra_data)
             data[unique_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
         elif unique_prop_id == unique_prop_ids["poly_tris"]:
 
-            obj_id = self.get_toplevel_object().get_id()
             subobj_lvl = GlobalData["active_obj_level"]
             tri_data = {"prev": {}, "tri_data": {}}
             extra_data = {unique_prop_ids["tri__extra__"]: tri_data}
             cur_time_id = Mgr.do("get_history_time")
-            prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_id)
             polys = self._subobjs["poly"]
 
-            if prev_time_ids:
-                prev_time_ids += (cur_time_id,)
-            else:
-                prev_time_ids = (cur_time_id,)
-
             if event_type == "creation":
 
                 for poly_id, poly in polys.items():
@@ -308,22 +392,16 @@ class GeomHistoryBase(BaseObject):
 
                 self._tri_change = set()
 
+            prev_time_ids = self.__get_time_id_chain_to_store(unique_prop_id, extra_data)
             data[unique_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
         elif unique_prop_id == unique_prop_ids["uvs"]:
 
-            obj_id = self.get_toplevel_object().get_id()
             uv_data = {"prev": {}, "uvs": {}}
             extra_data = {unique_prop_ids["uv__extra__"]: uv_data}
             cur_time_id = Mgr.do("get_history_time")
-            prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_id)
             verts = self._subobjs["vert"]
 
-            if prev_time_ids:
-                prev_time_ids += (cur_time_id,)
-            else:
-                prev_time_ids = (cur_time_id,)
-
             if event_type == "creation":
 
                 for vert_id, vert in verts.items():
@@ -364,22 +442,16 @@ class GeomHistoryBase(BaseObject):
 
                 self._uv_change = set()
 
+            prev_time_ids = self.__get_time_id_chain_to_store(unique_prop_id, extra_data)
             data[unique_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
         elif unique_prop_id == unique_prop_ids["normals"]:
 
-            obj_id = self.get_toplevel_object().get_id()
             normal_data = {"prev": {}, "normals": {}}
             extra_data = {unique_prop_ids["normal__extra__"]: normal_data}
             cur_time_id = Mgr.do("get_history_time")
-            prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_id)
             verts = self._subobjs["vert"]
 
-            if prev_time_ids:
-                prev_time_ids += (cur_time_id,)
-            else:
-                prev_time_ids = (cur_time_id,)
-
             if event_type == "creation":
 
                 for vert_id, vert in verts.items():
@@ -425,22 +497,16 @@ class GeomHistoryBase(BaseObject):
 
                 self._normal_change = set()
 
+            prev_time_ids = self.__get_time_id_chain_to_store(unique_prop_id, extra_data)
             data[unique_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
         elif unique_prop_id == unique_prop_ids["normal_lock"]:
 
-            obj_id = self.get_toplevel_object().get_id()
             lock_data = {"prev": {}, "normal_lock": {}}
             extra_data = {unique_prop_ids["normal_lock__extra__"]: lock_data}
             cur_time_id = Mgr.do("get_history_time")
-            prev_time_ids = Mgr.do("load_last_from_history", obj_id, unique_prop_id)
             verts = self._subobjs["vert"]
 
-            if prev_time_ids:
-                prev_time_ids += (cur_time_id,)
-            else:
-                prev_time_ids = (cur_time_id,)
-
             if event_type == "creation":
 
                 for vert_id, vert in verts.items():
@@ -486,12 +552,14 @@ class GeomHistoryBase(BaseObject):
 
                 self._normal_lock_change = set()
 
+            prev_time_ids = self.__get_time_id_chain_to_store(unique_prop_id, extra_data)
             data[unique_prop_id] = {"main": prev_time_ids, "extra": extra_data}
 
         return data
 
     def restore_data(self, data_ids, restore_type, old_time_id, new_time_id):
 
+        self._data_version += 1
         obj_id = self.get_toplevel_object().get_id()
 
         if "self" in data_ids:
@@ -727,7 +795,7 @@ class GeomHistoryBase(BaseObject):
                 yield True
 
         for subobj_type in ("vert", "edge", "poly", "normal"):
-            selected_subobj_ids[subobj_type] = []
+            selected_subobj_ids[subobj_type] = SelectedIDList()
 
         yield False
 
@@ -736,8 +804,8 @@ class GeomHistoryBase(BaseObject):
         obj_id = self.get_toplevel_object().get_id()
         prop_id = self._unique_prop_ids["{}s".format(subobj_type)]
 
-        prev_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, old_time_id)
-        new_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, new_time_id)
+        prev_time_ids = self._load_time_id_chain(prop_id, old_time_id)
+        new_time_ids = self._load_time_id_chain(prop_id, new_time_id)
 
         if prev_time_ids is None:
 
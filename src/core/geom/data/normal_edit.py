@@ -547,8 +547,33 @@ class NormalEditBase(BaseObject):
 
         return self._shared_normals.get(normal_id)
 
+    def __get_angle_weighted_normal(self, vert, poly):
+        """
+        Return the unit normal of the given polygon, multiplied by the angle of
+        that polygon at the given vertex.
+
+        """
+
+        verts = self._subobjs["vert"]
+        vert_ids = poly.get_vertex_ids()
+        index = vert_ids.index(vert.get_id())
+        pos = vert.get_pos()
+        vec1 = Vec3(verts[vert_ids[index - 1]].get_pos() - pos)
+        vec2 = Vec3(verts[vert_ids[(index + 1) % len(vert_ids)]].get_pos() - pos)
+        normal = Vec3(poly.get_normal())
+
+        if not (vec1.normalize() and vec2.normalize() and normal.normalize()):
+            return Vec3()
+
+        return normal * vec1.angle_rad(vec2)
+
     def update_vertex_normals(self, merged_verts=None, update_tangent_space=True):
-        """ Update the normals of the given merged vertices """
+        """
+        Update the normals of the given merged vertices.
+        Each shared normal is computed from the normals of the polygons it belongs
+        to, weighted according to the "normal_weighting" subobject edit option.
+
+        """
 
         if merged_verts is None:
             merged_verts = set(self._merged_verts.values())
@@ -567,32 +592,36 @@ class NormalEditBase(BaseObject):
         self._normal_change = verts_to_process
 
         vertex_data_top = self._toplvl_node.modify_geom(0).modify_vertex_data()
-        normal_writer = GeomVertexWriter(vertex_data_top, "normal")
         sign = -1. if self._owner.has_flipped_normals() else 1.
+        weight_by_angle = GlobalData["subobj_edit_options"]["normal_weighting"] == "angle"
+        # the new normal for each row, written to the vertex data in one go
+        normal_data = {}
         shared_normals_tmp = [s.difference(locked_normals) for s in
                               set(shared_normals[v_id] for v_id in verts_to_process)]
 
         for shared_normal in shared_normals_tmp:
 
-            vert = verts[shared_normal.pop()]
-            verts_to_update = [vert]
-            poly = polys[vert.get_polygon_id()]
-            normal = Vec3(poly.get_normal())
+            verts_to_update = [verts[vert_id] for vert_id in shared_normal]
+            normal = Vec3()
 
-            for vert_id in shared_normal:
+            for vert in verts_to_update:
 
-                vert = verts[vert_id]
-                verts_to_update.append(vert)
                 poly = polys[vert.get_polygon_id()]
-                normal += poly.get_normal()
+
+                if weight_by_angle:
+                    normal += self.__get_angle_weighted_normal(vert, poly)
+                else:
+                    normal += poly.get_normal()
 
             normal.normalize()
 
+            row_normal = tuple(normal * sign)
+
             for vert in verts_to_update:
-                normal_writer.set_row(vert.get_row_index())
-                normal_writer.set_data3(normal * sign)
+                normal_data[vert.get_row_index()] = row_normal
                 vert.set_normal(normal)
 
+        set_vertex_column_values(vertex_data_top, "normal", normal_data)
         normal_array = vertex_data_top.get_array(2)
         vertex_data_poly = self._vertex_data["poly"]
         vertex_data_poly.set_array(2, GeomVertexArrayData(normal_array))
@@ -637,8 +666,8 @@ class NormalEditBase(BaseObject):
         obj_id = self.get_toplevel_object().get_id()
         prop_id = self._unique_prop_ids["normals"]
 
-        prev_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, old_time_id)
-        new_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, new_time_id)
+        prev_time_ids = self._load_time_id_chain(prop_id, old_time_id)
+        new_time_ids = self._load_time_id_chain(prop_id, new_time_id)
 
         if prev_time_ids is None:
             prev_time_ids = ()
@@ -743,8 +772,8 @@ class NormalEditBase(BaseObject):
         obj_id = self.get_toplevel_object().get_id()
         prop_id = self._unique_prop_ids["normal_lock"]
 
-        prev_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, old_time_id)
-        new_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, new_time_id)
+        prev_time_ids = self._load_time_id_chain(prop_id, old_time_id)
+        new_time_ids = self._load_time_id_chain(prop_id, new_time_id)
 
         if prev_time_ids is None:
             prev_time_ids = ()
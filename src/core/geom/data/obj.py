@@ -31,6 +31,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
         del state["_subobjs"]
         del state["_indexed_subobjs"]
         del state["_is_tangent_space_initialized"]
+        del state["_time_id_chains"]
 
         GeomSelectionBase.__editstate__(self, state)
 
@@ -43,6 +44,8 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
         GeomSelectionBase.__setstate__(self, state)
 
         self._data_row_count = 0
+        self._data_version = 0
+        self._time_id_chains = {}
         self._merged_verts = {}
         self._merged_edges = {}
         self._shared_normals = {}
@@ -121,6 +124,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
         self._tmp_geom_pickable = None
         self._tmp_geom_sel_state = None
         self._tmp_row_indices = {}
+        self._tmp_hilited_row = None
 
     def __del__(self):
 
@@ -143,6 +147,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
             self.unregister()
 
         self._origin.remove_node()
+        Mgr.notify("geom_data_destroyed", self._id)
 
         logging.debug('GeomDataObject "{}" destroyed.'.format(self._id))
         self.__dict__.clear()
@@ -226,7 +231,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
         for poly_data in data:
 
             row_index = 0
-            tmp_edges = []
+            tmp_edges = set()
             positions = {}
             poly_verts_by_pos = {}
             poly_edges_by_pos = {}
@@ -277,7 +282,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
                         # if the edge appears twice, it's actually a diagonal
                         tmp_edges.remove(reversed_vert_ids)
                     else:
-                        tmp_edges.append(edge_vert_ids)
+                        tmp_edges.add(edge_vert_ids)
 
             for edge_vert_ids in tmp_edges:
                 poly_edges_by_vert_id[edge_vert_ids[0]] = edge_vert_ids
@@ -316,7 +321,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
             vert2.add_edge_id(edge1_id)
 
             polygon = Mgr.do("create_poly", self, poly_tris, poly_edges, poly_verts)
-            polygon.update_normal()
+            self.update_poly_geometry([polygon], centers=False)
             ordered_polys.append(polygon)
             poly_id = polygon.get_id()
             normals[poly_id] = normal = V3D(polygon.get_normal().normalized())
@@ -449,7 +454,9 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
                     neighbor_edge_id = merged_edge[0 if merged_edge[1] == edge_id else 1]
                     neighbor_vert1_id, neighbor_vert2_id = edges[neighbor_edge_id]
 
-                    if neighbor_vert1_id not in merged_vert2:
+                    # every vertex ID is mapped to the merged vertex it belongs to,
+                    # so membership can be checked without searching that merged vertex
+                    if merged_verts.get(neighbor_vert1_id) is not merged_vert2:
 
                         if neighbor_vert1_id in merged_verts:
 
@@ -464,7 +471,11 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
                             merged_vert2.append(neighbor_vert1_id)
                             merged_verts[neighbor_vert1_id] = merged_vert2
 
-                    if neighbor_vert2_id not in merged_vert1:
+                    # the merged vertex that vert1 belongs to could have been absorbed
+                    # into merged_vert2 in the meantime
+                    merged_vert1 = merged_verts[vert1_id]
+
+                    if merged_verts.get(neighbor_vert2_id) is not merged_vert1:
 
                         if neighbor_vert2_id in merged_verts:
 
@@ -536,9 +547,19 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
         tris_prim = GeomTriangles(Geom.UH_static)
         tris_prim.reserve_num_vertices(tri_vert_count)
 
+        # The vertex attributes and the vertex indices of the primitives are
+        # collected into typed buffers first, and then copied into the vertex
+        # and index arrays all at once.
+
         if not restore:
-            pos_writer = GeomVertexWriter(vertex_data_poly, "vertex")
-            normal_writer = GeomVertexWriter(vertex_data_poly, "normal")
+            pos_data = array.array("f")
+            normal_data = array.array("f")
+
+        # the largest 16-bit index is reserved as the strip-cut index, so 16-bit
+        # indices can be used as long as the largest row index is below it, just
+        # like GeomPrimitive.add_vertex() would decide
+        tri_rows = array.array("H" if count <= 65535 else "I")
+        line_rows = array.array("H" if count * 2 <= 65535 else "I")
 
         row_index_offset = 0
 
@@ -547,7 +568,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
 
         for poly in self._ordered_polys:
 
-            processed_verts = []
+            processed_vert_ids = set()
 
             for vert_ids in poly:
 
@@ -555,21 +576,21 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
 
                     vert = verts[vert_id]
 
-                    if vert not in processed_verts:
+                    if vert_id not in processed_vert_ids:
 
                         vert.offset_row_index(row_index_offset)
 
                         if not restore:
-                            pos_writer.add_data3(vert.get_pos())
-                            normal_writer.add_data3(vert.get_normal())
+                            pos_data.extend(vert.get_pos())
+                            normal_data.extend(vert.get_normal())
 
-                        processed_verts.append(vert)
+                        processed_vert_ids.add(vert_id)
 
-                    tris_prim.add_vertex(vert.get_row_index())
+                    tri_rows.append(vert.get_row_index())
 
             for edge in poly.get_edges():
                 row1, row2 = (verts[v_id].get_row_index() for v_id in edge)
-                lines_prim.add_vertices(row1, row2 + count)
+                line_rows.extend((row1, row2 + count))
 
             row_index_offset += poly.get_vertex_count()
 
@@ -583,6 +604,16 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
                     yield
                     poly_count = 0
 
+        if not restore:
+            for index, data in ((0, pos_data), (2, normal_data)):
+                to_view = memoryview(vertex_data_poly.modify_array(index)).cast("B")
+                to_view[:] = memoryview(data).cast("B")
+
+        for prim, rows in ((tris_prim, tri_rows), (lines_prim, line_rows)):
+            prim.set_index_type(Geom.NT_uint16 if rows.typecode == "H" else Geom.NT_uint32)
+            prim_array = prim.modify_vertices(len(rows))
+            memoryview(prim_array).cast("B")[:] = memoryview(rows).cast("B")
+
         pos_array_poly = vertex_data_poly.get_array(0)
         vertex_data_vert.set_array(0, pos_array_poly)
         vertex_data_poly_picking.set_array(0, pos_array_poly)
@@ -971,9 +1002,9 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
     def update_tangent_space(self, tangent_flip, bitangent_flip, poly_ids=None):
 
         vertex_data = GeomVertexData(self._vertex_data["poly"])
-        tan_writer = GeomVertexWriter(vertex_data, "tangent")
-        bitan_writer = GeomVertexWriter(vertex_data, "binormal")
         polys = self._subobjs["poly"]
+        tangents = {}
+        bitangents = {}
 
         for poly_id in (polys if poly_ids is None else poly_ids):
 
@@ -982,12 +1013,11 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
 
             for vert in poly.get_vertices():
                 row = vert.get_row_index()
-                tan_writer.set_row(row)
-                bitan_writer.set_row(row)
-                tangent, bitangent = vert.get_tangent_space()
-                tan_writer.set_data3(tangent)
-                bitan_writer.set_data3(bitangent)
+                tangents[row], bitangents[row] = vert.get_tangent_space()
 
+        # write the new tangent space vectors at once, instead of row by row
+        set_vertex_column_values(vertex_data, "tangent", tangents)
+        set_vertex_column_values(vertex_data, "binormal", bitangents)
         array = vertex_data.get_array(3)
         vertex_data_poly = self._vertex_data["poly"]
         vertex_data_poly.set_array(3, GeomVertexArrayData(array))
@@ -1237,6 +1267,7 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
             self._tmp_geom_sel_state.remove_node()
             self._tmp_geom_sel_state = None
             self._tmp_row_indices = {}
+            self._tmp_hilited_row = None
 
             if GlobalData["subobj_edit_options"]["pick_by_aiming"]:
                 aux_picking_root = Mgr.get("aux_picking_root")
@@ -1263,6 +1294,8 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
 
     def init_subobj_picking_via_poly(self, subobj_lvl, picked_poly, category="", extra_data=None):
 
+        self._tmp_hilited_row = None
+
         if subobj_lvl == "vert":
             self.init_vertex_picking_via_poly(picked_poly, category)
         elif subobj_lvl == "edge":
@@ -1277,17 +1310,32 @@ class GeomDataObject(GeomSelectionBase, GeomTransformBase, GeomHistoryBase,
         if row is None:
             return False
 
+        hilited_row = self._tmp_hilited_row
+
+        if row == hilited_row:
+            return True
+
+        # only the rows of the previously and newly highlighted subobjects need
+        # to be updated, instead of resetting the color of all rows
         colors = Mgr.get("subobj_selection_colors")[subobj_lvl]
-        geom = self._tmp_geom_sel_state.node().modify_geom(0)
-        vertex_data = geom.get_vertex_data().set_color((.3, .3, .3, .5))
-        geom.set_vertex_data(vertex_data)
-        col_writer = GeomVertexWriter(geom.modify_vertex_data(), "color")
+        row_count = 2 if subobj_lvl == "edge" else 1
+        vertex_data = self._tmp_geom_sel_state.node().modify_geom(0).modify_vertex_data()
+        col_writer = GeomVertexWriter(vertex_data, "color")
+
+        if hilited_row is not None:
+
+            col_writer.set_row(hilited_row)
+
+            for _ in range(row_count):
+                col_writer.set_data4(.3, .3, .3, .5)
+
         col_writer.set_row(row)
-        col_writer.set_data4(colors["selected"])
 
-        if subobj_lvl == "edge":
+        for _ in range(row_count):
             col_writer.set_data4(colors["selected"])
 
+        self._tmp_hilited_row = row
+
         return True
 
     def set_owner(self, owner):
@@ -1362,7 +1410,11 @@ class GeomDataManager(ObjectManager):
             "sel_edges_by_border": False,
             "sel_polys_by_surface": False,
             "sel_polys_by_smoothing": False,
-            "edge_bridge_segments": 1
+            "edge_bridge_segments": 1,
+            # how the polygon normals are weighted when computing a smoothed vertex
+            # normal: "face" uses the polygon normals as they are, while "angle"
+            # weights the unit polygon normals by the corner angle at the vertex
+            "normal_weighting": "face"
         }
         copier = dict.copy
         GlobalData.set_default("subobj_edit_options", subobj_edit_options, copier)
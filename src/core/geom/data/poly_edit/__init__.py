@@ -12,15 +12,56 @@ class PolygonEditBase(CreationBase, TriangulationBase, SmoothingBase, SurfaceBas
         TriangulationBase.__init__(self)
         SmoothingBase.__init__(self)
 
+    def update_poly_geometry(self, polys=None, centers=True, normals=True):
+        """
+        Update the center positions and/or the normals of the given polygons (all
+        polygons by default).
+        The position of each vertex is retrieved only once, as a tuple of floats,
+        and all of the computations are done on those floats, so no vector objects
+        need to be created other than the resulting centers and normals.
+
+        """
+
+        verts = self._subobjs["vert"]
+        positions = {}
+
+        for poly in (self._ordered_polys if polys is None else polys):
+
+            vert_ids = poly.get_vertex_ids()
+
+            for v_id in vert_ids:
+                if v_id not in positions:
+                    positions[v_id] = tuple(verts[v_id].get_pos())
+
+            if centers:
+                coords = list(zip(*(positions[v_id] for v_id in vert_ids)))
+                count = len(vert_ids)
+                poly.set_center_pos(Point3(*(sum(c) / count for c in coords)))
+
+            if normals:
+
+                normal_x = normal_y = normal_z = 0.
+
+                for v_id1, v_id2, v_id3 in poly:
+                    x1, y1, z1 = positions[v_id1]
+                    x2, y2, z2 = positions[v_id2]
+                    x3, y3, z3 = positions[v_id3]
+                    ax, ay, az = x2 - x1, y2 - y1, z2 - z1
+                    bx, by, bz = x3 - x2, y3 - y2, z3 - z2
+                    normal_x += ay * bz - az * by
+                    normal_y += az * bx - ax * bz
+                    normal_z += ax * by - ay * bx
+
+                scale = 3. / len(poly)
+                poly.set_normal(Vec3(normal_x * scale, normal_y * scale, normal_z * scale))
+
     def update_poly_centers(self):
 
-        for poly in self._ordered_polys:
-            poly.update_center_pos()
+        self.update_poly_geometry(normals=False)
 
     def update_poly_normals(self):
 
-        for poly in self._ordered_polys:
-            poly.update_normal()
+        self.update_poly_geometry(centers=False)
 
     def detach_polygons(self):
 
@@ -339,7 +380,7 @@ class PolygonEditBase(CreationBase, TriangulationBase, SmoothingBase, SurfaceBas
         geom_node.modify_geom(0).set_primitive(0, GeomTriangles(tris_prim))
 
         for subobj_type in ("vert", "edge", "poly", "normal"):
-            selected_subobj_ids[subobj_type] = []
+            selected_subobj_ids[subobj_type] = SelectedIDList()
 
         if selected_vert_ids:
             selected_verts = (verts[vert_id] for vert_id in selected_vert_ids)
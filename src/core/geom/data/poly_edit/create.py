@@ -930,8 +930,7 @@ class CreationBase(BaseObject):
 
         # Miscellaneous updates
 
-        polygon.update_center_pos()
-        polygon.update_normal()
+        self.update_poly_geometry([polygon])
 
         merged_subobjs = {"vert": merged_verts, "edge": merged_edges}
 
@@ -12,12 +12,14 @@ class GeomSelectionBase(BaseObject):
     def __setstate__(self, state):
 
         self._poly_selection_data = {"selected": [], "unselected": []}
-        self._selected_subobj_ids = {"vert": [], "edge": [], "poly": [], "normal": []}
+        self._selected_subobj_ids = dict((subobj_type, SelectedIDList()) for subobj_type
+                                         in ("vert", "edge", "poly", "normal"))
 
     def __init__(self):
 
         self._poly_selection_data = {"selected": [], "unselected": []}
-        self._selected_subobj_ids = {"vert": [], "edge": [], "poly": [], "normal": []}
+        self._selected_subobj_ids = dict((subobj_type, SelectedIDList()) for subobj_type
+                                         in ("vert", "edge", "poly", "normal"))
         self._sel_subobj_ids_backup = {}
         self._selection_backup = {}
 
@@ -25,11 +27,12 @@ class GeomSelectionBase(BaseObject):
                          update_verts_to_transf=True, selection_colors=None, geom=None):
 
         selected_subobj_ids = self._selected_subobj_ids[subobj_type]
+        selected_id_set = selected_subobj_ids.get_id_set()
         geoms = self._geoms[subobj_type]
         selected_subobjs = [subobj for subobj in subobjs_to_select
-                            if subobj.get_id() not in selected_subobj_ids]
+                            if subobj.get_id() not in selected_id_set]
         deselected_subobjs = [subobj for subobj in subobjs_to_deselect
-                              if subobj.get_id() in selected_subobj_ids]
+                              if subobj.get_id() in selected_id_set]
 
         if not (selected_subobjs or deselected_subobjs):
             return False
@@ -63,32 +66,31 @@ class GeomSelectionBase(BaseObject):
             row_ranges_sel_to_move = SparseArray()
             row_ranges_unsel_to_move = SparseArray()
 
-            for poly in selected_subobjs:
-                selected_subobj_ids.append(poly.get_id())
-                start = data_unselected.index(poly[0]) * 3
-                polys_sel.append((start, poly))
+            selected_subobj_ids.extend(poly.get_id() for poly in selected_subobjs)
+            self.__remove_selected_ids(selected_subobj_ids,
+                                       set(poly.get_id() for poly in deselected_subobjs))
+            polys_sel = self.__get_poly_tri_indices(data_unselected, selected_subobjs)
+            polys_unsel = self.__get_poly_tri_indices(data_selected, deselected_subobjs)
+
+            for tri_index, poly in polys_sel:
+                start = tri_index * 3
                 row_ranges_unsel_to_keep.clear_range(start, len(poly))
                 row_ranges_unsel_to_move.set_range(start, len(poly))
 
-            for poly in deselected_subobjs:
-                selected_subobj_ids.remove(poly.get_id())
-                start = data_selected.index(poly[0]) * 3
-                polys_unsel.append((start, poly))
+            for tri_index, poly in polys_unsel:
+                start = tri_index * 3
                 row_ranges_sel_to_keep.clear_range(start, len(poly))
                 row_ranges_sel_to_move.set_range(start, len(poly))
 
-            polys_sel.sort()
-            polys_unsel.sort()
-
             for _, poly in polys_sel:
                 data_selected.extend(poly)
-                for vert_ids in poly:
-                    data_unselected.remove(vert_ids)
+
+            data_unselected[:] = self.__remove_poly_tri_data(data_unselected, polys_sel)
 
             for _, poly in polys_unsel:
                 data_unselected.extend(poly)
-                for vert_ids in poly:
-                    data_selected.remove(vert_ids)
+
+            data_selected[:] = self.__remove_poly_tri_data(data_selected, polys_unsel)
 
             f = lambda values, stride: (v * stride for v in values)
 
@@ -161,15 +163,18 @@ class GeomSelectionBase(BaseObject):
                     col_writer.set_row(row_index)
                     col_writer.set_data4(color_sel)
 
+            ids_to_remove = set()
+
             for combined_subobj in deselected_subobjs:
 
-                for subobj_id in combined_subobj:
-                    selected_subobj_ids.remove(subobj_id)
+                ids_to_remove.update(combined_subobj)
 
                 for row_index in combined_subobj.get_row_indices():
                     col_writer.set_row(row_index)
                     col_writer.set_data4(color_unsel)
 
+            self.__remove_selected_ids(selected_subobj_ids, ids_to_remove)
+
             if subobj_type == "normal":
 
                 selected_normal_ids = []
@@ -188,6 +193,59 @@ class GeomSelectionBase(BaseObject):
 
         return True
 
+    def __remove_selected_ids(self, selected_subobj_ids, ids_to_remove):
+
+        if ids_to_remove:
+            selected_subobj_ids.difference_update(ids_to_remove)
+
+    def __get_poly_tri_indices(self, tri_data, polys):
+        """
+        Return a list of (index, polygon) tuples, sorted by index, with each index
+        being the position of the first triangle of the corresponding polygon within
+        the given triangle data.
+        The triangle data is scanned only once, instead of once per polygon.
+
+        """
+
+        first_tris = dict((poly[0], poly) for poly in polys)
+        poly_count = len(first_tris)
+        tri_indices = []
+
+        if not poly_count:
+            return tri_indices
+
+        for i, vert_ids in enumerate(tri_data):
+
+            if vert_ids in first_tris:
+
+                tri_indices.append((i, first_tris[vert_ids]))
+
+                if len(tri_indices) == poly_count:
+                    break
+
+        return tri_indices
+
+    def __remove_poly_tri_data(self, tri_data, tri_indices):
+        """
+        Return a copy of the given triangle data without the triangles of the
+        polygons in the given, sorted (index, polygon) tuples.
+
+        """
+
+        if not tri_indices:
+            return tri_data
+
+        new_tri_data = []
+        start = 0
+
+        for tri_index, poly in tri_indices:
+            new_tri_data.extend(tri_data[start:tri_index])
+            start = tri_index + len(poly) // 3
+
+        new_tri_data.extend(tri_data[start:])
+
+        return new_tri_data
+
     def is_selected(self, subobj):
 
         return subobj.get_id() in self._selected_subobj_ids[subobj.get_type()]
@@ -284,7 +342,7 @@ class GeomSelectionBase(BaseObject):
             new_data = vertex_data.set_color(color)
             vertex_data.set_array(1, new_data.get_array(1))
 
-        self._selected_subobj_ids[subobj_lvl] = []
+        self._selected_subobj_ids[subobj_lvl] = SelectedIDList()
 
         if update_verts_to_transf:
             self._verts_to_transf[subobj_lvl] = {}
@@ -598,7 +656,7 @@ class GeomSelectionBase(BaseObject):
         geom_node.modify_geom(0).set_primitive(0, GeomTriangles(tris_prim))
 
         for subobj_type in ("vert", "edge", "poly", "normal"):
-            selected_subobj_ids[subobj_type] = []
+            selected_subobj_ids[subobj_type] = SelectedIDList()
 
         if selected_vert_ids:
             selected_verts = (verts[vert_id] for vert_id in selected_vert_ids)
@@ -766,6 +824,7 @@ class Selection(SelectionTransformBase):
 
         self.update_center_pos()
         self.update_ui()
+        Mgr.do("invalidate_picking")
 
         if hide_sets:
             Mgr.update_remotely("selection_set", "hide_name")
@@ -1180,9 +1239,9 @@ class SelectionManager(BaseObject):
         selection = self._selections[obj_lvl]
 
         if obj_lvl == "poly":
-            return set(obj.get_id() for obj in selection)
+            return IDBitSet(obj.get_id() for obj in selection)
         else:
-            return set(obj_id for obj in selection for obj_id in obj)
+            return IDBitSet(obj_id for obj in selection for obj_id in obj)
 
     def __apply_selection_set(self, sel_set):
 
@@ -1443,10 +1502,7 @@ class SelectionManager(BaseObject):
                 state_np.set_shader_input("ellipse_data", Vec4(*ellipse_data))
             elif region_type in ("fence", "lasso", "paint"):
                 if enclose:
-                    img = PNMImage()
-                    mask_tex.store(img)
-                    img.expand_border(2, 2, 2, 2, (0., 0., 0., 0.))
-                    mask_tex.load(img)
+                    expand_mask_texture(mask_tex, 2)
                 state_np.set_shader_input("mask_tex", mask_tex)
             elif enclose:
                 w_b, h_b = tex_buffer.get_size()
@@ -1460,36 +1516,21 @@ class SelectionManager(BaseObject):
             if ge.extract_texture_data(tex, base.win.get_gsg()):
 
                 texels = memoryview(tex.get_ram_image()).cast("I")
+                indices = get_mask_bit_indices(texels)
 
-                if obj_lvl == "edge":
-
-                    sel_edges_by_border = subobj_edit_options["sel_edges_by_border"]
-
-                    for i, mask in enumerate(texels):
-                        for j in range(32):
-                            if mask & (1 << j):
-                                index = 32 * i + j
-                                subobj = subobjs[index].get_merged_object()
-                                if not sel_edges_by_border or len(subobj) == 1:
-                                    sel.update(subobj.get_special_selection())
-
-                elif obj_lvl == "normal":
-
-                    for i, mask in enumerate(texels):
-                        for j in range(32):
-                            if mask & (1 << j):
-                                index = 32 * i + j
-                                subobj = subobjs[index].get_shared_normal()
-                                sel.update(subobj.get_special_selection())
-
+                # since many of the region-selected subobjects can belong to the same
+                # merged subobject (or shared normal), the special selection of each
+                # of the latter is retrieved only once
+                if obj_lvl == "normal":
+                    combined_subobjs = set(subobjs[i].get_shared_normal() for i in indices)
                 else:
+                    combined_subobjs = set(subobjs[i].get_merged_object() for i in indices)
+
+                if obj_lvl == "edge" and subobj_edit_options["sel_edges_by_border"]:
+                    combined_subobjs = [s for s in combined_subobjs if len(s) == 1]
 
-                    for i, mask in enumerate(texels):
-                        for j in range(32):
-                            if mask & (1 << j):
-                                index = 32 * i + j
-                                subobj = subobjs[index].get_merged_object()
-                                sel.update(subobj.get_special_selection())
+                for subobj in combined_subobjs:
+                    sel.update(subobj.get_special_selection())
 
             state_np.clear_attrib(ShaderAttrib)
 
@@ -97,6 +97,8 @@ class GeomTransformBase(BaseObject):
         vertex_data_top = geom_node_top.modify_geom(0).modify_vertex_data()
         pos_writer = GeomVertexWriter(vertex_data_top, "vertex")
 
+        rows = SparseArray()
+
         for vert_id in vertex_ids:
             vert = verts[vert_id]
             poly = polys[vert.get_polygon_id()]
@@ -105,6 +107,7 @@ class GeomTransformBase(BaseObject):
             pos = vert.get_pos()
             pos_writer.set_row(row)
             pos_writer.set_data3(pos)
+            rows.set_bit(row)
 
         pos_array = vertex_data_top.get_array(0)
 
@@ -120,20 +123,17 @@ class GeomTransformBase(BaseObject):
             vertex_data = geoms[geom_type]["sel_state"].node().modify_geom(0).modify_vertex_data()
             vertex_data.set_array(0, pos_array)
 
-        size = pos_array.data_size_bytes
+        # only the rows of the moved vertices need to be copied to the edge geoms
         vertex_data = geoms["edge"]["pickable"].node().modify_geom(0).modify_vertex_data()
         pos_array_edge = vertex_data.modify_array(0)
-        from_view = memoryview(pos_array).cast("B")
-        to_view = memoryview(pos_array_edge).cast("B")
-        to_view[:size] = from_view
-        to_view[size:] = from_view
+        self._copy_position_rows(pos_array, pos_array_edge, rows)
         pos_array_edge = vertex_data.get_array(0)
         vertex_data = geoms["edge"]["sel_state"].node().modify_geom(0).modify_vertex_data()
         vertex_data.set_array(0, pos_array_edge)
 
+        self.update_poly_geometry(polys_to_update)
+
         for poly in polys_to_update:
-            poly.update_center_pos()
-            poly.update_normal()
             verts_to_resmooth.update(merged_verts[v_id] for v_id in poly.get_vertex_ids())
 
         self.update_vertex_normals(verts_to_resmooth)
@@ -143,6 +143,63 @@ class GeomTransformBase(BaseObject):
         model = self.get_toplevel_object()
         model.get_bbox().update(*self._origin.get_tight_bounds())
 
+    def _copy_position_rows(self, from_array, pos_array_edge, rows, pos_array_main=None,
+                            packed=False):
+        """
+        Copy the vertex positions in the given rows of from_array to both halves
+        of pos_array_edge and, optionally, to pos_array_main.
+        If packed is True, from_array contains only the positions of the given rows,
+        in order of increasing row index.
+
+        """
+
+        stride = pos_array_edge.array_format.stride
+        size = pos_array_edge.data_size_bytes // 2
+        from_view = memoryview(from_array).cast("B")
+        edge_view = memoryview(pos_array_edge).cast("B")
+        main_view = None if pos_array_main is None else memoryview(pos_array_main).cast("B")
+        offset = 0
+
+        for i in range(rows.get_num_subranges()):
+
+            start = rows.get_subrange_begin(i) * stride
+            end = rows.get_subrange_end(i) * stride
+
+            if packed:
+                data = from_view[offset:offset+end-start]
+                offset += end - start
+            else:
+                data = from_view[start:end]
+
+            edge_view[start:end] = data
+            edge_view[size+start:size+end] = data
+
+            if main_view is not None:
+                main_view[start:end] = data
+
+    def _get_packed_positions(self, pos_array, rows):
+        """
+        Return a GeomVertexData containing only the vertex positions in the given
+        rows of pos_array, in order of increasing row index.
+
+        """
+
+        vertex_format = GeomVertexFormat.register_format(pos_array.array_format)
+        vertex_data = GeomVertexData("packed_pos_data", vertex_format, Geom.UH_stream)
+        vertex_data.unclean_set_num_rows(rows.get_num_on_bits())
+        stride = pos_array.array_format.stride
+        from_view = memoryview(pos_array).cast("B")
+        to_view = memoryview(vertex_data.modify_array(0)).cast("B")
+        offset = 0
+
+        for i in range(rows.get_num_subranges()):
+            start = rows.get_subrange_begin(i) * stride
+            end = rows.get_subrange_end(i) * stride
+            to_view[offset:offset+end-start] = from_view[start:end]
+            offset += end - start
+
+        return vertex_data
+
     def reposition_vertices(self, computation):
         """ Change the positions of all vertices using the given computation """
 
@@ -183,8 +240,7 @@ class GeomTransformBase(BaseObject):
         vertex_data = geoms["edge"]["sel_state"].node().modify_geom(0).modify_vertex_data()
         vertex_data.set_array(0, pos_array_edge)
 
-        self.update_poly_centers()
-        self.update_poly_normals()
+        self.update_poly_geometry()
 
         self.get_toplevel_object().get_bbox().update(*self._origin.get_tight_bounds())
 
@@ -229,8 +285,7 @@ class GeomTransformBase(BaseObject):
             # NOTE: the LVecBase3f returned by the GeomVertexReader is a const
             vert.set_pos(Point3(*pos))
 
-        self.update_poly_centers()
-        self.update_poly_normals()
+        self.update_poly_geometry()
 
         self.get_toplevel_object().get_bbox().update(*self._origin.get_tight_bounds())
 
@@ -254,6 +309,7 @@ class GeomTransformBase(BaseObject):
         start_data["bounds"] = pos_data["bounds"]
         pos_array_main = pos_data["pos_array"]
         start_data["pos_array"] = GeomVertexArrayData(pos_array_main)
+        start_data["packed_pos"] = None
         geom_node_top = self._toplvl_node
         vertex_data_top = geom_node_top.modify_geom(0).modify_vertex_data()
         vertex_data_top.set_array(0, pos_array_main)
@@ -336,9 +392,19 @@ class GeomTransformBase(BaseObject):
         ref_node = self._get_ref_node()
         transf_center_pos = self._get_transf_center_pos()
         origin = self._origin
-        vertex_data_top = self._toplvl_node.modify_geom(0).modify_vertex_data()
-        tmp_vertex_data = GeomVertexData(vertex_data_top)
-        tmp_vertex_data.set_array(0, GeomVertexArrayData(self._transf_start_data["pos_array"]))
+        start_data = self._transf_start_data
+
+        # Only the start positions of the rows to be transformed are transformed,
+        # so the cost of this method is proportional to the size of the selection
+        # instead of the size of the mesh.
+
+        packed_pos = start_data.get("packed_pos")
+
+        if packed_pos is None or packed_pos[0] is not rows:
+            packed_pos_data = self._get_packed_positions(start_data["pos_array"], rows)
+            start_data["packed_pos"] = packed_pos = (rows, packed_pos_data)
+
+        tmp_vertex_data = GeomVertexData(packed_pos[1])
 
         if transf_type == "custom":
 
@@ -394,21 +460,14 @@ class GeomTransformBase(BaseObject):
             offset_mat = Mat4.translate_mat(tc_pos)
             mat *= offset_mat
 
-        tmp_vertex_data.transform_vertices(mat, rows)
-        pos_array_tmp = GeomVertexArrayData(tmp_vertex_data.get_array(0))
-        vertex_data_top.set_array(0, pos_array_tmp)
-
-        size = pos_array_tmp.data_size_bytes
+        tmp_vertex_data.transform_vertices(mat)
         pos_array_main = self._pos_arrays["main"]
         pos_array_edge = self._pos_arrays["edge"]
-        pos_array_edge.unclean_set_num_rows(pos_array_tmp.get_num_rows() * 2)
-
-        from_view = memoryview(pos_array_tmp).cast("B")
-        to_view = memoryview(pos_array_main).cast("B")
-        to_view[:] = from_view
-        to_view = memoryview(pos_array_edge).cast("B")
-        to_view[:size] = from_view
-        to_view[size:] = from_view
+        self._copy_position_rows(tmp_vertex_data.get_array(0), pos_array_edge, rows,
+                                 pos_array_main, packed=True)
+        # the toplevel geom shares the main position array
+        vertex_data_top = self._toplvl_node.modify_geom(0).modify_vertex_data()
+        vertex_data_top.set_array(0, pos_array_main)
 
     def finalize_transform(self, cancelled=False):
 
@@ -468,9 +527,9 @@ class GeomTransformBase(BaseObject):
             vert_ids = []
             polys_to_update = [polys[poly_id] for poly_id in poly_ids]
 
+            self.update_poly_geometry(polys_to_update)
+
             for poly in polys_to_update:
-                poly.update_center_pos()
-                poly.update_normal()
                 vert_ids.extend(poly.get_vertex_ids())
 
             merged_verts = set(self._merged_verts[vert_id] for vert_id in vert_ids)
@@ -499,8 +558,8 @@ class GeomTransformBase(BaseObject):
         obj_id = self.get_toplevel_object().get_id()
         prop_id = self._unique_prop_ids["subobj_transform"]
 
-        prev_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, old_time_id)
-        new_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, new_time_id)
+        prev_time_ids = self._load_time_id_chain(prop_id, old_time_id)
+        new_time_ids = self._load_time_id_chain(prop_id, new_time_id)
 
         if prev_time_ids is None:
             prev_time_ids = ()
@@ -625,9 +684,7 @@ class GeomTransformBase(BaseObject):
         vertex_data = geoms["edge"]["sel_state"].node().modify_geom(0).modify_vertex_data()
         vertex_data.set_array(0, pos_array_edge)
 
-        for poly in polys_to_update:
-            poly.update_center_pos()
-            poly.update_normal()
+        self.update_poly_geometry(polys_to_update)
 
         bounds = self._origin.get_tight_bounds()
 
@@ -602,8 +602,8 @@ class UVEditBase(BaseObject):
         obj_id = self.get_toplevel_object().get_id()
         prop_id = self._unique_prop_ids["uvs"]
 
-        prev_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, old_time_id)
-        new_time_ids = Mgr.do("load_last_from_history", obj_id, prop_id, new_time_id)
+        prev_time_ids = self._load_time_id_chain(prop_id, old_time_id)
+        new_time_ids = self._load_time_id_chain(prop_id, new_time_id)
 
         if prev_time_ids is None:
             prev_time_ids = ()
@@ -3,19 +3,28 @@ from ..base import *
 
 class Edge(BaseObject):
 
+    __slots__ = ("_id", "_picking_col_id", "_geom_data_obj", "_creation_time",
+                 "_poly_id", "_vert_ids")
+
+    _type = "edge"
+
     def __getstate__(self):
 
         # When pickling an Edge, it should not have a GeomDataObject, since this
         # will be pickled separately.
 
-        state = self.__dict__.copy()
+        state = dict((attr, getattr(self, attr)) for attr in self.__slots__)
         state["_geom_data_obj"] = None
 
         return state
 
+    def __setstate__(self, state):
+
+        for attr in self.__slots__:
+            setattr(self, attr, state.get(attr))
+
     def __init__(self, edge_id, picking_col_id, geom_data_obj, vert_ids):
 
-        self._type = "edge"
         self._id = edge_id
         self._picking_col_id = picking_col_id
         self._geom_data_obj = geom_data_obj
@@ -139,20 +148,27 @@ class Edge(BaseObject):
 
 class MergedEdge(object):
 
+    __slots__ = ("_geom_data_obj", "_ids")
+
+    _type = "edge"
+    _full_type = "merged_edge"
+
     def __getstate__(self):
 
         # When pickling a MergedEdge, it should not have a GeomDataObject, since
         # this will be pickled separately.
 
-        state = self.__dict__.copy()
-        state["_geom_data_obj"] = None
+        state = {"_geom_data_obj": None, "_ids": self._ids}
 
         return state
 
+    def __setstate__(self, state):
+
+        self._geom_data_obj = state["_geom_data_obj"]
+        self._ids = state["_ids"]
+
     def __init__(self, geom_data_obj, edge_id=None):
 
-        self._type = "edge"
-        self._full_type = "merged_edge"
         self._geom_data_obj = geom_data_obj
         self._ids = [] if edge_id is None else [edge_id]
 
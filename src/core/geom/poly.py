@@ -3,24 +3,34 @@ from ..base import *
 
 class Polygon(BaseObject):
 
+    __slots__ = ("_id", "_picking_col_id", "_geom_data_obj", "_creation_time",
+                 "_prev_prop_time", "_tri_data", "_vert_ids", "_edge_ids",
+                 "_center_pos", "_normal")
+
+    _type = "poly"
+
     def __getstate__(self):
 
         # When pickling a Polygon, it should not have a GeomDataObject, since this
         # will be pickled separately.
 
-        state = self.__dict__.copy()
+        state = dict((attr, getattr(self, attr)) for attr in self.__slots__)
         state["_geom_data_obj"] = None
 
         return state
 
+    def __setstate__(self, state):
+
+        for attr in self.__slots__:
+            setattr(self, attr, state.get(attr))
+
     def __init__(self, poly_id, picking_col_id, geom_data_obj, triangle_data, edges, verts):
 
-        self._type = "poly"
         self._id = poly_id
         self._picking_col_id = picking_col_id
         self._geom_data_obj = geom_data_obj
         self._creation_time = None
-        self._prev_prop_time = {"tri_data": None}
+        self._prev_prop_time = None
         self._tri_data = triangle_data  # sequence of 3-tuples of vertex IDs
         self._vert_ids = [vert.get_id() for vert in verts]
         self._edge_ids = [edge.get_id() for edge in edges]
@@ -92,11 +102,17 @@ class Polygon(BaseObject):
 
     def set_previous_property_time(self, prop_id, time_id):
 
+        if self._prev_prop_time is None:
+            self._prev_prop_time = {}
+
         self._prev_prop_time[prop_id] = time_id
 
     def get_previous_property_time(self, prop_id):
 
-        return self._prev_prop_time[prop_id]
+        if self._prev_prop_time is None:
+            return
+
+        return self._prev_prop_time.get(prop_id)
 
     def set_triangle_data(self, triangle_data):
 
@@ -156,19 +172,9 @@ class Polygon(BaseObject):
 
         return [verts[vert_id].get_row_index() for vert_id in self._vert_ids]
 
-    def get_triangle_normal(self, triangle_index):
-
-        verts = self._geom_data_obj.get_subobjects("vert")
-        tri_verts = [verts[vert_id] for vert_id in self._tri_data[triangle_index]]
-        pos1, pos2, pos3 = [vert.get_pos() for vert in tri_verts]
-
-        return V3D(pos2 - pos1) ** V3D(pos3 - pos2)
-
-    def update_normal(self):
+    def set_normal(self, normal):
 
-        tri_count = len(self._tri_data)
-        normals = [self.get_triangle_normal(i) for i in range(tri_count)]
-        self._normal = sum(normals, Vec3()) / tri_count
+        self._normal = normal
 
     def reverse_normal(self):
 
@@ -233,12 +239,6 @@ class Polygon(BaseObject):
 
         return polys
 
-    def update_center_pos(self):
-
-        verts = self.get_vertices()
-        positions = [vert.get_pos() for vert in verts]
-        self._center_pos = sum(positions, Point3()) / len(positions)
-
     def set_center_pos(self, center_pos):
 
         self._center_pos = center_pos
@@ -285,94 +285,30 @@ class Polygon(BaseObject):
     def update_tangent_space(self, flip_tangent=False, flip_bitangent=False):
 
         verts = self._geom_data_obj.get_subobjects("vert")
-        processed_verts = []
-        epsilon = 1.e-010
+        processed_verts = set()
 
         for vert_ids in self._tri_data:
 
-            for vert_id in vert_ids:
-
-                if vert_id in processed_verts:
-                    continue
-
-                vert = verts[vert_id]
-                other_vert_ids = list(vert_ids)
-                other_vert_ids.remove(vert_id)
-                other_verts = [verts[v_id] for v_id in other_vert_ids]
-                pos = vert.get_pos()
-                pos1, pos2 = [v.get_pos() for v in other_verts]
-                pos_vec1 = pos1 - pos
-                pos_vec2 = pos2 - pos
-                uv = Point2(vert.get_uvs(0))
-                uv1, uv2 = [Point2(v.get_uvs(0)) for v in other_verts]
-                uv_vec1 = uv1 - uv
-                uv_vec2 = uv2 - uv
-
-                # compute a vector pointing in the +U direction, in texture space
-                # and in world space
-
-                if abs(uv_vec1.y) < epsilon:
-                    u_vec_local = uv_vec1
-                    u_vec_world = Vec3(pos_vec1)
-                elif abs(uv_vec2.y) < epsilon:
-                    u_vec_local = uv_vec2
-                    u_vec_world = Vec3(pos_vec2)
-                else:
-                    scale = (uv_vec1.y / uv_vec2.y)
-                    u_vec_local = uv_vec1 - uv_vec2 * scale
-                    # u_vec_local.y will be 0 and thus point in the -/+U direction;
-                    # replacing the texture-space vectors with the corresponding
-                    # world-space vectors will therefore yield a world-space U-vector
-                    u_vec_world = pos_vec1 - pos_vec2 * scale
-
-                if u_vec_local.x < 0.:
-                    u_vec_world *= -1.
-
-                # compute a vector pointing in the +V direction, in texture space
-                # and in world space
-
-                if abs(uv_vec1.x) < epsilon:
-                    v_vec_local = uv_vec1
-                    v_vec_world = Vec3(pos_vec1)
-                elif abs(uv_vec2.x) < epsilon:
-                    v_vec_local = uv_vec2
-                    v_vec_world = Vec3(pos_vec2)
-                else:
-                    scale = (uv_vec1.x / uv_vec2.x)
-                    v_vec_local = uv_vec1 - uv_vec2 * scale
-                    # v_vec_local.x will be 0 and thus point in the -/+V direction;
-                    # replacing the texture-space vectors with the corresponding
-                    # world-space vectors will therefore yield a world-space V-vector
-                    v_vec_world = pos_vec1 - pos_vec2 * scale
-
-                if v_vec_local.y < 0.:
-                    v_vec_world *= -1.
-
-                normal = vert.get_normal()
-                tangent_plane = Plane(normal, Point3())
-                # the tangent vector is the world-space U-vector projected onto
-                # the tangent plane
-                tangent = Vec3(tangent_plane.project(Point3(u_vec_world)))
-
-                if not tangent.normalize():
-                    continue
+            tri_verts = [verts[v_id] for v_id in vert_ids]
+            positions = [v.get_pos() for v in tri_verts]
+            uvs = [v.get_uvs(0) for v in tri_verts]
 
-                # the bitangent vector is the world-space V-vector projected onto
-                # the tangent plane
-                bitangent = Vec3(tangent_plane.project(Point3(v_vec_world)))
+            for i, vert_id in enumerate(vert_ids):
 
-                if not bitangent.normalize():
+                if vert_id in processed_verts:
                     continue
 
-                if flip_tangent:
-                    tangent *= -1.
-
-                if flip_bitangent:
-                    bitangent *= -1.
-
-                tangent_space = (tangent, bitangent)
-                vert.set_tangent_space(tangent_space)
-                processed_verts.append(vert_id)
+                vert = tri_verts[i]
+                pos1, pos2 = positions[:i] + positions[i + 1:]
+                uv1, uv2 = uvs[:i] + uvs[i + 1:]
+                tangent_space = compute_tangent_space(positions[i], pos1, pos2, uvs[i], uv1,
+                                                      uv2, vert.get_normal(), flip_tangent,
+                                                      flip_bitangent)
+
+                if tangent_space:
+                    tangent, bitangent = tangent_space
+                    vert.set_tangent_space((Vec3(*tangent), Vec3(*bitangent)))
+                    processed_verts.add(vert_id)
 
 
 class PolygonManager(ObjectManager, PickingColorIDManager):
@@ -713,8 +713,8 @@ class BoxManager(PrimitiveManager):
             for side_id, data in side_data.items():
 
                 name = box_name + " " + side_id
-                name = get_unique_name(name, obj_names)
-                obj_names.append(name)
+                name = obj_names.get_unique_name(name)
+                obj_names.add(name)
                 pos = data["pos"]
                 x, y = data["size"]
                 segments = data["segs"]
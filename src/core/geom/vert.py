@@ -3,40 +3,60 @@ from ..base import *
 
 class Vertex(BaseObject):
 
+    # Vertices are by far the most numerous objects in a dense mesh, so their
+    # data is kept in slots instead of per-instance dicts; properties that
+    # usually have a default value (color, tangent space, previous property
+    # times) are only stored once they are explicitly set.
+
+    __slots__ = ("_id", "_picking_col_id", "_geom_data_obj", "_creation_time",
+                 "_prev_prop_time", "_pos", "_edge_ids", "_poly_id", "_row",
+                 "_row_offset", "_uvs", "_color", "_normal", "_normal_is_locked",
+                 "_tangent_space")
+
+    _type = "vert"
+    _full_type = "single_vert"
+
     def __getstate__(self):
 
-        state = self.__dict__.copy()
+        state = dict((attr, getattr(self, attr)) for attr in self.__slots__)
         state["_geom_data_obj"] = None
-        state["_data"] = data = self._data.copy()
-        data["row_offset"] = 0
+        state["_row_offset"] = 0
 
         return state
 
+    def __setstate__(self, state):
+
+        if "_data" in state:
+            # the vertex was pickled with its data stored in a dict
+            data = state["_data"]
+            state["_row"] = data["row"]
+            state["_row_offset"] = data["row_offset"]
+            state["_uvs"] = data["uvs"]
+            state["_color"] = data.get("color")
+            state["_normal"] = data["normal"]
+            state["_normal_is_locked"] = data["normal_is_locked"]
+            state["_tangent_space"] = data["tangent_space"]
+
+        for attr in self.__slots__:
+            setattr(self, attr, state.get(attr))
+
     def __init__(self, vert_id, picking_col_id, geom_data_obj, pos):
 
-        self._type = "vert"
-        self._full_type = "single_vert"
         self._id = vert_id
         self._picking_col_id = picking_col_id
         self._geom_data_obj = geom_data_obj
         self._creation_time = None
-        self._prev_prop_time = {
-            "transform": None,
-            "uvs": None,
-            "normal": None,
-            "normal_lock": None
-        }
+        self._prev_prop_time = None
         self._pos = Point3(*pos)  # in local space
         self._edge_ids = []
         self._poly_id = None
-        self._data = {
-            "row": 0,
-            "row_offset": 0,
-            "uvs": {},
-            "normal": None,
-            "normal_is_locked": False,
-            "tangent_space": (Vec3(), Vec3())
-        }
+        self._row = 0
+        self._row_offset = 0
+        self._uvs = {}
+        self._color = None
+        self._normal = None
+        self._normal_is_locked = False
+        self._tangent_space = None
 
     def get_type(self):
 
@@ -84,11 +104,17 @@ class Vertex(BaseObject):
 
     def set_previous_property_time(self, prop_id, time_id):
 
+        if self._prev_prop_time is None:
+            self._prev_prop_time = {}
+
         self._prev_prop_time[prop_id] = time_id
 
     def get_previous_property_time(self, prop_id):
 
-        return self._prev_prop_time[prop_id]
+        if self._prev_prop_time is None:
+            return
+
+        return self._prev_prop_time.get(prop_id)
 
     def set_pos(self, pos, ref_node=None):
 
@@ -145,17 +171,15 @@ class Vertex(BaseObject):
 
     def set_row_index(self, index):
 
-        self._data["row"] = index
+        self._row = index
 
     def offset_row_index(self, offset):
 
-        self._data["row_offset"] += offset
+        self._row_offset += offset
 
     def get_row_index(self):
 
-        data = self._data
-
-        return data["row"] + data["row_offset"]
+        return self._row + self._row_offset
 
     def get_row_indices(self):
 
@@ -165,38 +189,34 @@ class Vertex(BaseObject):
 
         if uv_set_id is None:
             uv_data = dict((k, v) for k, v in uvs.items() if v != (0., 0.))
-            self._data["uvs"] = uv_data
+            self._uvs = uv_data
         elif uvs != (0., 0.):
-            self._data["uvs"][uv_set_id] = uvs
-        elif uv_set_id in self._data["uvs"]:
-            del self._data["uvs"][uv_set_id]
+            self._uvs[uv_set_id] = uvs
+        elif uv_set_id in self._uvs:
+            del self._uvs[uv_set_id]
 
     def get_uvs(self, uv_set_id=None):
 
         if uv_set_id is None:
-            return self._data["uvs"]
+            return self._uvs
 
-        return self._data["uvs"].get(uv_set_id, (0., 0.))
+        return self._uvs.get(uv_set_id, (0., 0.))
 
     def set_color(self, color):
 
-        if color == (1., 1., 1., 1.):
-            if "color" in self._data:
-                del self._data["color"]
-        else:
-            self._data["color"] = color
+        self._color = None if color == (1., 1., 1., 1.) else color
 
     def get_color(self):
 
-        return self._data.get("color", (1., 1., 1., 1.))
+        return (1., 1., 1., 1.) if self._color is None else self._color
 
     def set_normal(self, normal):
 
-        self._data["normal"] = normal
+        self._normal = normal
 
     def get_normal(self):
 
-        return self._data["normal"]
+        return self._normal
 
     def get_shared_normal(self):
 
@@ -204,16 +224,16 @@ class Vertex(BaseObject):
 
     def lock_normal(self, locked=True):
 
-        if self._data["normal_is_locked"] == locked:
+        if self._normal_is_locked == locked:
             return False
 
-        self._data["normal_is_locked"] = locked
+        self._normal_is_locked = locked
 
         return True
 
     def has_locked_normal(self):
 
-        return self._data["normal_is_locked"]
+        return self._normal_is_locked
 
     def get_polygon_normal(self):
 
@@ -223,11 +243,14 @@ class Vertex(BaseObject):
 
     def set_tangent_space(self, tangent_space):
 
-        self._data["tangent_space"] = tangent_space
+        self._tangent_space = tangent_space
 
     def get_tangent_space(self):
 
-        return self._data["tangent_space"]
+        if self._tangent_space is None:
+            return (Vec3(), Vec3())
+
+        return self._tangent_space
 
     def get_point_at_screen_pos(self, screen_pos):
 
@@ -248,20 +271,27 @@ class Vertex(BaseObject):
 
 class MergedVertex(object):
 
+    __slots__ = ("_geom_data_obj", "_ids")
+
+    _type = "vert"
+    _full_type = "merged_vert"
+
     def __getstate__(self):
 
         # When pickling a MergedVertex, it should not have a GeomDataObject, since
         # this will be pickled separately.
 
-        state = self.__dict__.copy()
-        state["_geom_data_obj"] = None
+        state = {"_geom_data_obj": None, "_ids": self._ids}
 
         return state
 
+    def __setstate__(self, state):
+
+        self._geom_data_obj = state["_geom_data_obj"]
+        self._ids = state["_ids"]
+
     def __init__(self, geom_data_obj, vert_id=None):
 
-        self._type = "vert"
-        self._full_type = "merged_vert"
         self._geom_data_obj = geom_data_obj
         self._ids = [] if vert_id is None else [vert_id]
 
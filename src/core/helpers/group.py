@@ -1143,9 +1143,8 @@ class GroupManager(ObjectManager):
             Mgr.do("update_obj_link_viz", obj_ids)
 
             namelist = GlobalData["obj_names"]
-            search_pattern = r"^group\s*(\d+)$"
             naming_pattern = "group {:04d}"
-            name = get_unique_name("", namelist, search_pattern, naming_pattern)
+            name = namelist.get_unique_name("", "group", naming_pattern)
             group.set_name(name)
 
             # make undo/redoable
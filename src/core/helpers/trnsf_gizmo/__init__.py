@@ -124,6 +124,7 @@ class TransformGizmoManager(BaseObject, PickingColorIDManager):
         self._active_gizmo.hide()
         self._active_gizmo = self._gizmos[transf_type]
         self._active_gizmo.show()
+        Mgr.do("invalidate_picking")
 
     def __update_active_axes(self, transf_type, axes):
 
@@ -147,6 +148,7 @@ class TransformGizmoManager(BaseObject, PickingColorIDManager):
         roots["ortho"].set_effect(self._compass_effect)
         roots["ortho"].show()
         self.__update()
+        Mgr.do("invalidate_picking")
 
         if Mgr.get_state_id() == "selection_mode":
             self.__enable_gizmo()
@@ -160,6 +162,7 @@ class TransformGizmoManager(BaseObject, PickingColorIDManager):
         roots["ortho"].hide()
         roots["ortho"].clear_effect(CompassEffect.get_class_type())
         self._base.clear_billboard()
+        Mgr.do("invalidate_picking")
 
     def __set_pickable(self, pickable=True):
 
@@ -168,14 +171,18 @@ class TransformGizmoManager(BaseObject, PickingColorIDManager):
         for root in self._roots.values():
             root.show(picking_mask) if pickable else root.hide(picking_mask)
 
+        Mgr.do("invalidate_picking")
+
     def __set_pos(self, pos):
 
         self._target_node.set_pos(pos)
         self.__update()
+        Mgr.do("invalidate_picking")
 
     def __set_hpr(self, *args, **kwargs):
 
         self._target_node.set_hpr(*args, **kwargs)
+        Mgr.do("invalidate_picking")
 
         if self._active_gizmo is self._gizmos["scale"]:
             self._active_gizmo.face_camera()
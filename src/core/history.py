@@ -2,6 +2,13 @@
 from .base import *
 
 COMPRESSION = 9
+# the maximum total size (in bytes) of the pickled history data that can be added
+# to the history file before that file is flushed
+MAX_UNFLUSHED_SIZE = 1 << 24
+# the maximum number of pickled history items waiting to be written to the history
+# file by the history writer thread; when this is exceeded, storing history blocks
+# until the writer catches up
+MAX_PENDING_WRITES = 1024
 
 
 class TimeIDRef(object):
@@ -22,6 +29,15 @@ class TimeIDRef(object):
 class HistoryEvent(object):
 
     _edited_events = set()
+    # For each (object ID, property ID) pair, the time IDs of the events that
+    # changed the corresponding property are kept in chronological order.
+    # Time IDs are taken out of this index when the corresponding events are
+    # deleted or merged, or when their property changes are removed.
+    _prop_change_index = {}
+    # the time IDs of the most recently queried event (the timeline end) and of
+    # all of its past events; this set also serves any of those past events
+    _timeline_time_ids = set()
+    _timeline_end = None
 
     @classmethod
     def update_user_data(cls):
@@ -30,6 +46,56 @@ class HistoryEvent(object):
             event.update_user_description()
             event.update_milestone()
 
+    @classmethod
+    def reset_prop_change_index(cls, events=()):
+
+        cls._prop_change_index = {}
+        cls.reset_timeline()
+
+        for event in events:
+            cls.index_prop_changes(event.get_time_id(), event.get_object_data())
+
+    @classmethod
+    def index_prop_changes(cls, time_id, obj_data):
+
+        index = cls._prop_change_index
+
+        for obj_id, prop_ids in obj_data.items():
+            for prop_id in prop_ids:
+                time_ids = index.setdefault((obj_id, prop_id), [])
+                i = bisect.bisect_left(time_ids, time_id)
+                if i == len(time_ids) or time_ids[i] != time_id:
+                    time_ids.insert(i, time_id)
+
+    @classmethod
+    def unindex_prop_changes(cls, time_id, obj_data):
+
+        index = cls._prop_change_index
+
+        for obj_id, prop_ids in obj_data.items():
+            for prop_id in prop_ids:
+
+                key = (obj_id, prop_id)
+                time_ids = index.get(key)
+
+                if not time_ids:
+                    continue
+
+                i = bisect.bisect_left(time_ids, time_id)
+
+                if i < len(time_ids) and time_ids[i] == time_id:
+
+                    del time_ids[i]
+
+                    if not time_ids:
+                        del index[key]
+
+    @classmethod
+    def reset_timeline(cls):
+
+        cls._timeline_time_ids = set()
+        cls._timeline_end = None
+
     @classmethod
     def reset_temp_user_data(cls):
 
@@ -53,6 +119,7 @@ class HistoryEvent(object):
         self._is_milestone_tmp = None
         self._to_be_merged = False
 
+        self.index_prop_changes(time_id, data["objects"])
         previous_event = Mgr.get("history_event", prev_time_id)
 
         if previous_event:
@@ -76,6 +143,8 @@ class HistoryEvent(object):
     def set_previous_event(self, prev_time_id):
 
         self._prev = prev_time_id
+        # the past of this event and its future events has changed
+        HistoryEvent.reset_timeline()
 
     def get_previous_event(self):
 
@@ -92,6 +161,35 @@ class HistoryEvent(object):
 
         return events
 
+    def get_past_time_ids(self):
+        """
+        Return a set containing the time IDs of this event and all of its past
+        events.
+        Only one such set is kept, for the end of the most recently queried timeline;
+        it is also returned for the past events on that timeline, in which case it
+        contains later time IDs as well.
+        A new event that directly follows the end of that timeline is added to it,
+        instead of collecting the time IDs of all of its past events again.
+
+        """
+
+        cls = HistoryEvent
+        time_ids = cls._timeline_time_ids
+
+        if self._time_id in time_ids:
+            return time_ids
+
+        if self._prev is not None and self._prev == cls._timeline_end:
+            time_ids.add(self._time_id)
+        else:
+            time_ids = set(event.get_time_id() for event in self.get_past())
+            time_ids.add(self._time_id)
+            cls._timeline_time_ids = time_ids
+
+        cls._timeline_end = self._time_id
+
+        return time_ids
+
     def add_next_event(self, time_id):
 
         if time_id not in self._next:
@@ -239,10 +337,13 @@ class HistoryEvent(object):
                 del data[obj_id]
 
         self._data["objects"].update(data)
+        self.index_prop_changes(self._time_id, obj_data)
 
     def remove_object_props(self, obj_id, process_previous=True):
 
         if obj_id in self._data["objects"]:
+            prop_ids = self._data["objects"][obj_id]
+            self.unindex_prop_changes(self._time_id, {obj_id: prop_ids})
             del self._data["objects"][obj_id]
 
         if process_previous:
@@ -264,19 +365,29 @@ class HistoryEvent(object):
         if obj_id in data and prop_id in data[obj_id]:
             return self._time_id
 
-        if process_previous:
+        if not process_previous:
+            return
 
-            event = self.get_previous_event()
+        time_ids = self._prop_change_index.get((obj_id, prop_id))
 
-            while event:
+        if not time_ids:
+            return
 
-                time_id = event.get_last_object_prop_change(obj_id, prop_id,
-                                                            process_previous=False)
+        past_time_ids = self.get_past_time_ids()
 
-                if time_id:
-                    return time_id
+        # past events have earlier time IDs, so the most recent past event that
+        # changed the property is found by searching the index backwards, starting
+        # from the time ID of this event
+        for i in range(bisect.bisect_left(time_ids, self._time_id) - 1, -1, -1):
 
-                event = event.get_previous_event()
+            time_id = time_ids[i]
+
+            if time_id in past_time_ids:
+
+                event = Mgr.get("history_event", time_id)
+
+                if event.get_last_object_prop_change(obj_id, prop_id, process_previous=False):
+                    return time_id
 
     def get_last_object_ids(self):
 
@@ -305,6 +416,24 @@ class HistoryManager(BaseObject):
         self._hist_events = {}
         self._prev_time_id = self._next_time_id = self._saved_time_id = (0, 0)
         self._backup_file_index = 1
+        # the history file is kept open between accesses
+        self._hist_file = None
+        self._unflushed_streams = []
+        self._unflushed_size = 0
+        # new history data is added to the history file (and compressed when that
+        # file is flushed) by a separate thread; the main thread only accesses that
+        # file while holding the following lock, or after waiting for all pending
+        # writes to be done
+        self._hist_file_lock = threading.Lock()
+        self._write_queue = queue.Queue(MAX_PENDING_WRITES)
+        self._writer_thread = None
+        # the pickled data that has not been flushed to the history file yet, per
+        # subfile name; this has its own lock, so reading that data never has to
+        # wait for the history file to be flushed
+        self._pending_subfiles = {}
+        self._pending_lock = threading.Lock()
+        self._write_stats = {"write_count": 0, "last_latency": 0., "max_latency": 0.,
+                             "total_latency": 0.}
 
         self._clocks = {"automerge": ClockObject(), "autobackup": ClockObject()}
 
@@ -317,6 +446,8 @@ class HistoryManager(BaseObject):
         GlobalData.set_default("autobackup_defaults", autobackup_defaults, copier)
 
         Mgr.expose("history_event", lambda time_id: self._hist_events.get(time_id))
+        Mgr.expose("last_history_time", self.__get_last_time_id)
+        Mgr.expose("history_write_stats", self.__get_write_stats)
         Mgr.accept("require_scene_save", self.__require_scene_save)
         Mgr.accept("reset_history", self.__reset_history)
         Mgr.accept("load_from_history", self.__load_from_history)
@@ -362,10 +493,12 @@ class HistoryManager(BaseObject):
     def __reset_history(self):
 
         event_data = {"objects": {}, "object_ids": TimeIDRef((0, 0))}
+        HistoryEvent.reset_prop_change_index()
         root_event = HistoryEvent((0, 0), event_data)
         self._hist_events = {(0, 0): root_event, "root": root_event}
         self._prev_time_id = self._saved_time_id = (0, 0)
 
+        self.__close_history_file()
         hist_file = Multifile()
         hist_file.open_write("hist.dat")
         time_id_stream = StringStream(pickle.dumps(self._prev_time_id, -1))
@@ -385,18 +518,175 @@ class HistoryManager(BaseObject):
         self._clocks["autobackup"].reset()
         self._backup_file_index = 1
 
+    def __open_history_file(self):
+
+        if not self._hist_file:
+            self._hist_file = hist_file = Multifile()
+            hist_file.open_read_write("hist.dat")
+
+        return self._hist_file
+
+    def __get_history_file(self):
+        """
+        Return the history file, which is kept open for reading and writing between
+        accesses, instead of being reopened for every history event.
+        Pending writes are waited for, so the file can safely be accessed until new
+        history data is added.
+        This is only needed to modify the file; to simply read history data, use
+        __read_history_subfile instead.
+
+        """
+
+        self.__wait_for_history_writes()
+
+        return self.__open_history_file()
+
+    def __add_history_subfile(self, subfile_name, data_pickled):
+        """
+        Queue the given pickled data to be added to the history file as a new subfile
+        by the history writer thread.
+
+        """
+
+        if not self._writer_thread:
+            self._writer_thread = thread = threading.Thread(target=self.__write_history,
+                                                            name="history_writer")
+            thread.daemon = True
+            thread.start()
+
+        with self._pending_lock:
+            self._pending_subfiles[subfile_name] = data_pickled
+
+        self._write_queue.put((subfile_name, data_pickled, time.perf_counter()))
+
+    def __write_history(self):
+        """
+        Add the queued history data to the history file.
+        This runs in the history writer thread.
+
+        The history file is flushed (which is when the data is compressed) whenever
+        no more data is waiting to be written, or when the total size of the data
+        added since the previous flush exceeds MAX_UNFLUSHED_SIZE; the streams
+        holding that data need to be kept alive until then.
+        The data remains available in the pending subfiles until it has been flushed,
+        so the main thread can read it without waiting for that flush.
+
+        """
+
+        write_queue = self._write_queue
+        stats = self._write_stats
+        unflushed_subfiles = []
+
+        while True:
+
+            subfile_name, data_pickled, start_time = write_queue.get()
+
+            try:
+
+                with self._hist_file_lock:
+                    hist_file = self.__open_history_file()
+                    stream = StringStream(data_pickled)
+                    hist_file.add_subfile(subfile_name, stream, COMPRESSION)
+
+                self._unflushed_streams.append(stream)
+                self._unflushed_size += len(data_pickled)
+                unflushed_subfiles.append((subfile_name, data_pickled))
+
+                if write_queue.empty() or self._unflushed_size > MAX_UNFLUSHED_SIZE:
+
+                    with self._hist_file_lock:
+                        hist_file.flush()
+
+                    self._unflushed_streams = []
+                    self._unflushed_size = 0
+
+                    with self._pending_lock:
+
+                        pending_subfiles = self._pending_subfiles
+
+                        for name, data in unflushed_subfiles:
+                            if pending_subfiles.get(name) is data:
+                                del pending_subfiles[name]
+
+                    unflushed_subfiles = []
+
+                latency = time.perf_counter() - start_time
+                stats["write_count"] += 1
+                stats["last_latency"] = latency
+                stats["max_latency"] = max(stats["max_latency"], latency)
+                stats["total_latency"] += latency
+
+            except Exception:
+
+                logging.exception("Couldn't write '{}' to history file.".format(subfile_name))
+
+            finally:
+
+                write_queue.task_done()
+
+    def __wait_for_history_writes(self):
+
+        if self._writer_thread:
+            self._write_queue.join()
+
+    def __read_history_subfile(self, subfile_name):
+        """
+        Return the pickled data of the given history subfile, or None if it doesn't
+        exist.
+        Data that has not been flushed to the history file yet is returned directly,
+        without waiting for the history writer thread.
+
+        """
+
+        with self._pending_lock:
+            if subfile_name in self._pending_subfiles:
+                return self._pending_subfiles[subfile_name]
+
+        with self._hist_file_lock:
+
+            hist_file = self.__open_history_file()
+            subfile_index = hist_file.find_subfile(subfile_name)
+
+            if subfile_index == -1:
+                return
+
+            return hist_file.read_subfile(subfile_index)
+
+    def __get_write_stats(self):
+        """
+        Return the number of history items waiting to be written, as well as the
+        number of items written so far and the time (in seconds) that passed between
+        queueing an item and adding it to the history file.
+
+        """
+
+        stats = self._write_stats
+        write_count = stats["write_count"]
+        avg_latency = stats["total_latency"] / write_count if write_count else 0.
+
+        return {"queue_depth": self._write_queue.qsize(), "write_count": write_count,
+                "last_latency": stats["last_latency"], "max_latency": stats["max_latency"],
+                "avg_latency": avg_latency}
+
+    def __close_history_file(self):
+
+        self.__wait_for_history_writes()
+
+        if self._hist_file:
+            self._hist_file.flush()
+            self._hist_file.close()
+            self._hist_file = None
+
+        self._unflushed_streams = []
+        self._unflushed_size = 0
+
     def __load_from_history(self, obj_id, data_id, time_id=None):
 
         if not time_id:
             time_id = self._prev_time_id
 
-        hist_file = Multifile()
-        hist_file.open_read("hist.dat")
-
         subfile_name = "{}/{}/{}".format(time_id, obj_id, data_id)
-        data_pickled = hist_file.read_subfile(hist_file.find_subfile(subfile_name))
-
-        hist_file.close()
+        data_pickled = self.__read_history_subfile(subfile_name)
 
         return pickle.loads(data_pickled)
 
@@ -405,6 +695,9 @@ class HistoryManager(BaseObject):
         if not time_id:
             time_id = self._prev_time_id
 
+        if time_id not in self._hist_events:
+            return
+
         event = self._hist_events[time_id]
 
         return event.get_last_object_prop_change(obj_id, prop_id)
@@ -423,12 +716,7 @@ class HistoryManager(BaseObject):
         if last_time_id is None:
             return
 
-        hist_file = Multifile()
-        hist_file.open_read("hist.dat")
-
-        value = self.__load_property_value(hist_file, last_time_id, obj_id, prop_id)
-
-        hist_file.close()
+        value = self.__load_property_value(last_time_id, obj_id, prop_id)
 
         if return_last_time_id:
             return value, last_time_id
@@ -467,6 +755,9 @@ class HistoryManager(BaseObject):
     def __add_history(self, event_descr, event_data, update_time_id=True):
 
         logging.debug("Adding history:\n{}".format(event_descr))
+        # every undoable change (object creation, deletion, transformation,
+        # geometry editing...) can affect what is under the mouse cursor
+        Mgr.do("invalidate_picking")
 
         if self._event_descr_to_store:
             if event_descr:
@@ -522,11 +813,6 @@ class HistoryManager(BaseObject):
         event = HistoryEvent(time_id, data, self._prev_time_id, self._event_descr_to_store)
         self._hist_events[time_id] = event
 
-        hist_file = Multifile()
-        hist_file.open_read_write("hist.dat")
-
-        streams = []
-
         for obj_id in obj_data:
 
             if "object" in obj_data[obj_id] and obj_data[obj_id]["object"] is None:
@@ -536,22 +822,16 @@ class HistoryManager(BaseObject):
 
                 subfile_name = "{}/{}/{}".format(time_id, obj_id, prop_id)
                 prop_val = prop_val_data["main"]
-                streams.append(StringStream(pickle.dumps(prop_val, -1)))
-                hist_file.add_subfile(subfile_name, streams[-1], COMPRESSION)
+                self.__add_history_subfile(subfile_name, pickle.dumps(prop_val, -1))
 
                 if "extra" in prop_val_data:
                     for data_id, data in prop_val_data["extra"].items():
                         subfile_name = "{}/{}/{}".format(time_id, obj_id, data_id)
-                        streams.append(StringStream(pickle.dumps(data, -1)))
-                        hist_file.add_subfile(subfile_name, streams[-1], COMPRESSION)
+                        self.__add_history_subfile(subfile_name, pickle.dumps(data, -1))
 
         if obj_ids is not None:
             subfile_name = "{}/object_ids".format(time_id)
-            streams.append(StringStream(pickle.dumps(obj_ids, -1)))
-            hist_file.add_subfile(subfile_name, streams[-1], COMPRESSION)
-
-        hist_file.flush()
-        hist_file.close()
+            self.__add_history_subfile(subfile_name, pickle.dumps(obj_ids, -1))
 
         self._event_data_to_store = {"objects": {}}
         self._event_descr_to_store = ""
@@ -650,18 +930,16 @@ class HistoryManager(BaseObject):
         if end_events:
             self.__update_history(None, None, events_to_delete, end_events, None, False, True)
 
-    def __load_property_value(self, hist_file, time_id, obj_id, prop_id):
+    def __load_property_value(self, time_id, obj_id, prop_id):
 
         subfile_name = "{}/{}/{}".format(time_id, obj_id, prop_id)
-        subfile_index = hist_file.find_subfile(subfile_name)
+        prop_val_pickled = self.__read_history_subfile(subfile_name)
 
-        if subfile_index == -1:
+        if prop_val_pickled is None:
             msg = "Couldn't load '{}' property of '{}' for time ID {}".format(prop_id, obj_id, time_id)
             logging.critical(msg)
             raise RuntimeError(msg)
 
-        prop_val_pickled = hist_file.read_subfile(subfile_index)
-
         return pickle.loads(prop_val_pickled)
 
     def __get_undo_description(self):
@@ -709,9 +987,6 @@ class HistoryManager(BaseObject):
 
         props_to_restore = {}
 
-        hist_file = Multifile()
-        hist_file.open_read("hist.dat")
-
         for obj_id in time_ids:
 
             obj_time_ids = time_ids[obj_id]
@@ -720,7 +995,7 @@ class HistoryManager(BaseObject):
             # to undo this, it has to be restored by unpickling it
             if "object" in obj_time_ids:
                 time_id = obj_time_ids["object"]
-                obj = self.__load_property_value(hist_file, time_id, obj_id, "object")
+                obj = self.__load_property_value(time_id, obj_id, "object")
                 # the entire object will be restored
                 obj_time_ids = {"self": None}
             else:
@@ -728,8 +1003,6 @@ class HistoryManager(BaseObject):
 
             props_to_restore[obj] = list(obj_time_ids.keys())
 
-        hist_file.close()
-
         old_time_id = self._prev_time_id
         new_time_id = prev_event.get_time_id()
         logging.debug('Undoing event with time ID {} and restoring event with time ID {}'.format(
@@ -782,23 +1055,18 @@ class HistoryManager(BaseObject):
 
         props_to_restore = {}
 
-        hist_file = Multifile()
-        hist_file.open_read("hist.dat")
-
         for obj_id, prop_ids in obj_data.items():
 
             # if "object" is in prop_ids, it means that the object was created;
             # to redo this, it has to be restored by unpickling it
             if "object" in prop_ids:
-                obj = self.__load_property_value(hist_file, new_time_id, obj_id, "object")
+                obj = self.__load_property_value(new_time_id, obj_id, "object")
                 prop_ids = ["self"]
             else:
                 obj = Mgr.get("object", obj_id)
 
             props_to_restore[obj] = prop_ids
 
-        hist_file.close()
-
         for obj, data_ids in props_to_restore.items():
             obj.restore_data(data_ids, restore_type="redo", old_time_id=old_time_id,
                              new_time_id=new_time_id)
@@ -818,8 +1086,7 @@ class HistoryManager(BaseObject):
 
     def __save_history(self, scene_file, set_saved_state=True):
 
-        hist_file = Multifile()
-        hist_file.open_read_write("hist.dat")
+        hist_file = self.__get_history_file()
         time_id_stream = StringStream(pickle.dumps(self._prev_time_id, -1))
         hist_file.add_subfile("time_id", time_id_stream, COMPRESSION)
         hist_event_stream = StringStream(pickle.dumps(self._hist_events, -1))
@@ -828,8 +1095,9 @@ class HistoryManager(BaseObject):
         if hist_file.needs_repack():
             hist_file.repack()
 
-        hist_file.flush()
-        hist_file.close()
+        # the history file must be complete on disk before it can be added to the
+        # scene file
+        self.__close_history_file()
 
         scene_file.add_subfile("hist.dat", Filename.binary_filename("hist.dat"), 0)
 
@@ -843,15 +1111,16 @@ class HistoryManager(BaseObject):
 
         Mgr.update_remotely("screenshot", "create")
 
+        self.__close_history_file()
         scene_file.extract_subfile(scene_file.find_subfile("hist.dat"), Filename("hist.dat"))
 
-        hist_file = Multifile()
-        hist_file.open_read("hist.dat")
+        hist_file = self.__get_history_file()
 
         time_id_pickled = hist_file.read_subfile(hist_file.find_subfile("time_id"))
         self._prev_time_id = self._next_time_id = self._saved_time_id = pickle.loads(time_id_pickled)
         events_pickled = hist_file.read_subfile(hist_file.find_subfile("events"))
         self._hist_events = pickle.loads(events_pickled)
+        HistoryEvent.reset_prop_change_index(self._hist_events.values())
         event = self._hist_events[self._prev_time_id]
 
         obj_ids_time_id = event.get_last_object_ids().get_time_id()
@@ -864,11 +1133,9 @@ class HistoryManager(BaseObject):
         for obj_id in obj_ids:
 
             time_id = event.get_last_object_prop_change(obj_id, "creation")
-            obj = self.__load_property_value(hist_file, time_id, obj_id, "object")
+            obj = self.__load_property_value(time_id, obj_id, "object")
             objs_to_restore.append(obj)
 
-        hist_file.close()
-
         for obj in objs_to_restore:
             obj.restore_data(["self"], restore_type="redo", old_time_id=(-1, 0),
                              new_time_id=self._prev_time_id)
@@ -888,7 +1155,7 @@ class HistoryManager(BaseObject):
             past = self._hist_events[self._prev_time_id].get_past()
             Mgr.update_app("history", "show", self._hist_events, self._prev_time_id, past)
 
-    def __merge_history(self, end_event, subfile_names, subfiles_to_remove, hist_file, comment=""):
+    def __merge_history(self, end_event, subfile_names, subfiles_to_remove, comment=""):
 
         to_merge = [end_event]
         prev_event = end_event.get_previous_event()
@@ -922,7 +1189,7 @@ class HistoryManager(BaseObject):
             prev_time_id = prev_event.get_time_id()
             prev_obj_ids_time_id = prev_event.get_last_object_ids().get_time_id()
             subfile_name = "{}/object_ids".format(prev_obj_ids_time_id)
-            data_pickled = hist_file.read_subfile(hist_file.find_subfile(subfile_name))
+            data_pickled = self.__read_history_subfile(subfile_name)
             obj_ids_before = pickle.loads(data_pickled)
         else:
             prev_time_id = None
@@ -933,7 +1200,7 @@ class HistoryManager(BaseObject):
         end_obj_ids = end_event.get_last_object_ids()
         end_obj_ids_time_id = end_obj_ids.get_time_id()
         subfile_name = "{}/object_ids".format(end_obj_ids_time_id)
-        data_pickled = hist_file.read_subfile(hist_file.find_subfile(subfile_name))
+        data_pickled = self.__read_history_subfile(subfile_name)
         obj_ids_after = pickle.loads(data_pickled)
         obsolete_obj_ids = set()
         obj_ids_time_id = prev_obj_ids_time_id
@@ -944,7 +1211,7 @@ class HistoryManager(BaseObject):
 
             if time_id != obj_ids_time_id:
                 subfile_name = "{}/object_ids".format(time_id)
-                data_pickled = hist_file.read_subfile(hist_file.find_subfile(subfile_name))
+                data_pickled = self.__read_history_subfile(subfile_name)
                 obsolete_obj_ids.update(pickle.loads(data_pickled))
                 obj_ids_time_id = time_id
 
@@ -987,12 +1254,10 @@ class HistoryManager(BaseObject):
 
                         subfile_name = "{}/{}/{}".format(time_id, obj_id, "object"
                                                          if prop_id == "creation" else prop_id)
-                        data_pickled = hist_file.read_subfile(hist_file.find_subfile(subfile_name))
+                        data_pickled = self.__read_history_subfile(subfile_name)
                         subfile_name = "{}/{}/{}".format(end_time_id, obj_id, "object"
                                                          if prop_id == "creation" else prop_id)
-                        data_stream = StringStream(data_pickled)
-                        hist_file.add_subfile(subfile_name, data_stream, COMPRESSION)
-                        hist_file.flush()
+                        self.__add_history_subfile(subfile_name, data_pickled)
 
             start_event.update_object_data(obj_data)
 
@@ -1007,11 +1272,9 @@ class HistoryManager(BaseObject):
 
         if obj_ids_subfile_to_move:
             end_obj_ids.set_time_id(end_time_id)
-            data_pickled = hist_file.read_subfile(hist_file.find_subfile(obj_ids_subfile_to_move))
+            data_pickled = self.__read_history_subfile(obj_ids_subfile_to_move)
             subfile_name = "{}/object_ids".format(end_time_id)
-            data_stream = StringStream(data_pickled)
-            hist_file.add_subfile(subfile_name, data_stream, COMPRESSION)
-            hist_file.flush()
+            self.__add_history_subfile(subfile_name, data_pickled)
 
     def __update_history(self, to_undo, to_redo, to_delete, to_merge, to_restore,
                          set_unsaved, automerge=False):
@@ -1033,8 +1296,7 @@ class HistoryManager(BaseObject):
         time_to_restore = to_restore if to_restore else self._prev_time_id
         event_to_restore = self._hist_events[time_to_restore]
 
-        hist_file = Multifile()
-        hist_file.open_read_write("hist.dat")
+        hist_file = self.__get_history_file()
 
         if to_undo or to_redo:
 
@@ -1056,7 +1318,7 @@ class HistoryManager(BaseObject):
             for obj_id in objects_to_create:
 
                 time_id = event_to_restore.get_last_object_prop_change(obj_id, "creation")
-                obj = self.__load_property_value(hist_file, time_id, obj_id, "object")
+                obj = self.__load_property_value(time_id, obj_id, "object")
                 props_to_restore[obj] = ["self"]
 
             for obj_id in objects_to_update:
@@ -1069,8 +1331,6 @@ class HistoryManager(BaseObject):
                 obj = Mgr.get("object", obj_id)
                 props_to_restore[obj] = prop_ids
 
-        hist_file.close()
-
         old_time_id = self._prev_time_id
 
         if to_undo or to_redo:
@@ -1085,8 +1345,7 @@ class HistoryManager(BaseObject):
 
         Mgr.do("update_picking_col_id_ranges")
 
-        hist_file = Multifile()
-        hist_file.open_read_write("hist.dat")
+        hist_file = self.__get_history_file()
 
         def get_future_events(event):
 
@@ -1137,8 +1396,7 @@ class HistoryManager(BaseObject):
         comment = "Automerged" if automerge else "Merged"
 
         for event in to_merge:
-            self.__merge_history(event, subfile_names, subfiles_to_remove,
-                                 hist_file, comment=comment)
+            self.__merge_history(event, subfile_names, subfiles_to_remove, comment=comment)
 
         for event in events_to_merge:
             add_subfiles_to_remove(event, subfile_names, subfiles_to_remove,
@@ -1150,7 +1408,12 @@ class HistoryManager(BaseObject):
         events_to_remove.update(events_to_merge)
 
         for event in events_to_remove:
-            del self._hist_events[event.get_time_id()]
+            time_id = event.get_time_id()
+            HistoryEvent.unindex_prop_changes(time_id, event.get_object_data())
+            del self._hist_events[time_id]
+
+        if events_to_remove:
+            HistoryEvent.reset_timeline()
 
         for event in events_to_remove:
 
@@ -1159,14 +1422,16 @@ class HistoryManager(BaseObject):
             if prev_event:
                 prev_event.remove_next_event(event.get_time_id(), update_milestone_count=True)
 
+        # the history data added while merging needs to be written before anything
+        # can be removed from the history file
+        hist_file = self.__get_history_file()
+
         for name in subfiles_to_remove:
             hist_file.remove_subfile(hist_file.find_subfile(name))
 
         if to_delete or to_merge:
             hist_file.repack()
 
-        hist_file.close()
-
         if automerge:
 
             if time_to_restore != self._prev_time_id:
@@ -1217,14 +1482,13 @@ class HistoryManager(BaseObject):
         merge_time_ids = tuple(merge_time_ids)
         subfiles_to_remove = set()
 
-        hist_file = Multifile()
-        hist_file.open_read_write("hist.dat")
+        hist_file = self.__get_history_file()
         subfile_names = [hist_file.get_subfile_name(i)
                          for i in range(hist_file.get_num_subfiles())]
         subfile_names.remove("events")
         subfile_names.remove("time_id")
 
-        self.__merge_history(event, subfile_names, subfiles_to_remove, hist_file)
+        self.__merge_history(event, subfile_names, subfiles_to_remove)
 
         root_event = self._hist_events["root"]
         time_id = root_event.get_time_id()
@@ -1235,16 +1499,18 @@ class HistoryManager(BaseObject):
                 if not (subfile_name.startswith(merge_time_ids) and "__extra__" in subfile_name):
                     subfiles_to_remove.add(subfile_name)
 
+        hist_file = self.__get_history_file()
+
         for subfile_name in subfiles_to_remove:
             hist_file.remove_subfile(hist_file.find_subfile(subfile_name))
 
         hist_file.repack()
-        hist_file.close()
 
         self._prev_time_id = time_id
 
         root_event.clear_next_events()
         self._hist_events = {time_id: root_event, "root": root_event}
+        HistoryEvent.reset_prop_change_index([root_event])
 
         self._saved_time_id = (-1, 0)
         GlobalData["unsaved_scene"] = True
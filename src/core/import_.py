@@ -2,6 +2,10 @@ from .base import *
 from .geom.material import render_state_to_material
 
 
+# distance within which points of imported collision polygons are merged
+COLL_VERT_WELD_TOLERANCE = 1.e-06
+
+
 class ImportManager(BaseObject):
 
     def __init__(self):
@@ -36,7 +40,7 @@ class ImportManager(BaseObject):
         self._model_root = model_root
         hierarchy = self._hierarchy
 
-        obj_names = GlobalData["obj_names"]
+        obj_names = GlobalData["obj_names"].copy()
         self._obj_names = new_obj_names = []
         coll_indices = self._coll_obj_indices
         node_paths = [(model_root, 0, None)]
@@ -68,7 +72,7 @@ class ImportManager(BaseObject):
             if not new_name:
                 new_name = "object 0001"
 
-            new_name = get_unique_name(new_name, obj_names + new_obj_names)
+            new_name = obj_names.get_unique_name(new_name)
 
             if not old_name:
                 old_name = "<Unnamed>"
@@ -84,13 +88,14 @@ class ImportManager(BaseObject):
                 node_data["geom_type"] = "regular"
             elif node_type == "CollisionNode":
                 new_name = obj_name if obj_name else "collision object 0001"
-                new_name = get_unique_name(new_name, obj_names + new_obj_names)
+                new_name = obj_names.get_unique_name(new_name)
                 node_data["new_name"] = new_name
                 node_data["geom_type"] = "collision"
                 coll_indices.append(index)
             else:
                 node_data["geom_type"] = "none"
 
+            obj_names.add(new_name)
             new_obj_names.append(new_name)
 
         Mgr.update_remotely("import", hierarchy, new_obj_names)
@@ -204,8 +209,8 @@ class ImportManager(BaseObject):
                 hpr = quat.get_hpr()
 
                 name = "object 0001"
-                name = get_unique_name(name, obj_names)
-                obj_names.append(name)
+                name = obj_names.get_unique_name(name)
+                obj_names.add(name)
 
                 segments = {"x": 1, "y": 1, "z": 1}
                 creator = Mgr.do("create_custom_box", name, x, y, z, segments, pos, inverted=True)
@@ -246,8 +251,8 @@ class ImportManager(BaseObject):
                 hpr = quat.get_hpr()
 
             name = "object 0001"
-            name = get_unique_name(name, obj_names)
-            obj_names.append(name)
+            name = obj_names.get_unique_name(name)
+            obj_names.add(name)
 
             x = y = 10.
             segments = {"x": 1, "y": 1}
@@ -287,50 +292,52 @@ class ImportManager(BaseObject):
 
     def __create_collision_model(self, name, polys):
 
-        coords = []
+        tolerance = COLL_VERT_WELD_TOLERANCE
+        inv_cell_size = 1. / tolerance
+        max_dist_sq = tolerance * tolerance
+        # welded points, hashed by the grid cell they fall into
+        cells = {}
+        # interleaved position and normal data, one row per 6 floats
+        vert_data = array.array("f")
+        indices = array.array("I")
         poly_count = 0
-
-        vertex_format = GeomVertexFormat.get_v3n3()
-        vertex_data = GeomVertexData("basic_geom", vertex_format, Geom.UH_static)
-        pos_writer = GeomVertexWriter(vertex_data, "vertex")
-        normal_writer = GeomVertexWriter(vertex_data, "normal")
-        tris = GeomTriangles(Geom.UH_static)
         row = 0
 
-        for poly in polys:
+        def weld(point):
 
-            points = [point for point in poly]
-            rows_by_pos = {}
+            x, y, z = point
+            cx, cy, cz = (int(math.floor(c * inv_cell_size)) for c in (x, y, z))
 
-            for i, point in enumerate(points):
-                for impr_crd in coords:
-                    if point == impr_crd:
-                        points[i] = impr_crd
-                        break
-                else:
-                    coords.append(point)
+            for i in (cx - 1, cx, cx + 1):
+                for j in (cy - 1, cy, cy + 1):
+                    for k in (cz - 1, cz, cz + 1):
+                        for crd in cells.get((i, j, k), ()):
+                            if (crd[0] - x) ** 2 + (crd[1] - y) ** 2 + (crd[2] - z) ** 2 <= max_dist_sq:
+                                return crd
+
+            crd = (x, y, z)
+            cells.setdefault((cx, cy, cz), []).append(crd)
+
+            return crd
 
+        for poly in polys:
+
+            points = [weld(point) for point in poly]
+            rows_by_pos = {}
             plane = Plane(*poly[:3])
-            normal = plane.get_normal()
-            pos = points.pop(0)
-            pos_writer.add_data3(*pos)
-            normal_writer.add_data3(normal)
-            rows_by_pos[pos] = row1 = row
-            row += 1
+            normal = tuple(plane.get_normal())
 
-            for positions in (points[i:i+2] for i in range(len(points) - 1)):
+            for pos in points:
+                if pos not in rows_by_pos:
+                    vert_data.extend(pos)
+                    vert_data.extend(normal)
+                    rows_by_pos[pos] = row
+                    row += 1
 
-                tris.add_vertex(row1)
+            row1 = rows_by_pos[points[0]]
 
-                for pos in positions:
-                    if pos in rows_by_pos:
-                        tris.add_vertex(rows_by_pos[pos])
-                    else:
-                        pos_writer.add_data3(*pos)
-                        normal_writer.add_data3(normal)
-                        rows_by_pos[pos] = row
-                        tris.add_vertex(row)
-                        row += 1
+            for i in range(1, len(points) - 1):
+                indices.extend((row1, rows_by_pos[points[i]], rows_by_pos[points[i + 1]]))
 
             poly_count += 1
 
@@ -338,6 +345,22 @@ class ImportManager(BaseObject):
                 yield
                 poly_count = 0
 
+        vertex_format = GeomVertexFormat.get_v3n3()
+        vertex_data = GeomVertexData("basic_geom", vertex_format, Geom.UH_static)
+        vertex_data.unclean_set_num_rows(row)
+        memoryview(vertex_data.modify_array(0)).cast("B")[:] = memoryview(vert_data).cast("B")
+        tris = GeomTriangles(Geom.UH_static)
+
+        if row < 65535:
+            tris.set_index_type(Geom.NT_uint16)
+            indices = array.array("H", indices)
+        else:
+            tris.set_index_type(Geom.NT_uint32)
+
+        index_array = tris.modify_vertices()
+        index_array.unclean_set_num_rows(len(indices))
+        memoryview(index_array).cast("B")[:] = memoryview(indices).cast("B")
+
         geom = Geom(vertex_data)
         geom.add_primitive(tris)
         node = GeomNode("basic_geom")
@@ -369,6 +392,10 @@ class ImportManager(BaseObject):
         model_root = self._model_root
         hierarchy = self._hierarchy
         data = [(hierarchy[0], None)]
+        # names of existing objects as well as those of the objects still to be
+        # imported, kept up to date throughout the import process
+        obj_names = GlobalData["obj_names"].copy()
+        obj_names.update(self._obj_names)
 
         while data:
 
@@ -399,8 +426,6 @@ class ImportManager(BaseObject):
 
                         obj = self.__create_model_group(obj_name, node_path.get_transform())
                         obj.get_origin().node().copy_tags(node)
-                        obj_names = GlobalData["obj_names"] + self._obj_names
-                        obj_names.remove(obj_name)
 
                         for i in geom_indices:
                             state = node.get_geom_state(i)
@@ -413,8 +438,8 @@ class ImportManager(BaseObject):
                             new_geom = NodePath(new_node)
                             new_geom.set_state(state)
                             member_name = "object 0001"
-                            member_name = get_unique_name(member_name, obj_names)
-                            obj_names.append(member_name)
+                            member_name = obj_names.get_unique_name(member_name)
+                            obj_names.add(member_name)
                             member = Mgr.do("create_basic_geom", new_geom, member_name, materials).get_model()
                             member.register(restore=False)
                             Mgr.do("add_group_member", member, obj, restore="import")
@@ -455,7 +480,6 @@ class ImportManager(BaseObject):
                     coll_objs = []
                     coll_polys = []
                     coll_planes = []
-                    obj_names = GlobalData["obj_names"] + self._obj_names
 
                     for solid in node.get_solids():
 
@@ -478,8 +502,8 @@ class ImportManager(BaseObject):
                         else:
 
                             name = "object 0001"
-                            name = get_unique_name(name, obj_names)
-                            obj_names.append(name)
+                            name = obj_names.get_unique_name(name)
+                            obj_names.add(name)
 
                             if obj_type in ("CollisionSphere", "CollisionInvSphere"):
 
@@ -521,8 +545,8 @@ class ImportManager(BaseObject):
                     if coll_polys:
 
                         name = "object 0001"
-                        name = get_unique_name(name, obj_names)
-                        obj_names.append(name)
+                        name = obj_names.get_unique_name(name)
+                        obj_names.add(name)
 
                         for model in self.__create_collision_model(name, coll_polys):
                             yield
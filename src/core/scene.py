@@ -1,5 +1,14 @@
 from .base import *
 
+# version of the layout of the scene data within a scene file;
+# version 1 files store all scene data pickled into a single "scene/data" subfile,
+# while version 2 files store each part of the scene data in a separate subfile,
+# listed in "scene/toc"
+SCENE_FORMAT_VERSION = 2
+# the compression level used for the scene data; the history data, which makes up
+# the bulk of a scene file, is already compressed and is added uncompressed
+SCENE_COMPRESSION = 6
+
 
 class SceneManager(BaseObject):
 
@@ -117,8 +126,7 @@ class SceneManager(BaseObject):
 
         GlobalData["loading_scene"] = True
         Mgr.update_remotely("screenshot", "create")
-        scene_data_str = scene_file.read_subfile(scene_file.find_subfile("scene/data"))
-        scene_data = pickle.loads(scene_data_str)
+        scene_data = self.__read_scene_data(scene_file)
         Mgr.do("set_material_library", scene_data["material_library"])
         Mgr.do("load_history", scene_file)
         scene_file.close()
@@ -144,6 +152,11 @@ class SceneManager(BaseObject):
             names_loaded[obj_lvl] = names = {}
 
             for set_id_loaded, sel_set in lvl_sets_loaded.items():
+
+                # subobject selection sets saved by older versions are Python sets
+                if obj_lvl != "top" and isinstance(sel_set, set):
+                    sel_set = IDBitSet(sel_set)
+
                 set_id = id(sel_set)
                 sets[set_id] = sel_set
                 names[set_id] = lvl_names_loaded[set_id_loaded]
@@ -182,6 +195,31 @@ class SceneManager(BaseObject):
         PendingTasks.handle(["object", "ui"], True)
         GlobalData["open_file"] = filename
 
+    def __read_scene_data(self, scene_file):
+
+        subfile_index = scene_file.find_subfile("scene/data")
+
+        if subfile_index != -1:
+            # version 1 scene file
+            return pickle.loads(scene_file.read_subfile(subfile_index))
+
+        toc = pickle.loads(scene_file.read_subfile(scene_file.find_subfile("scene/toc")))
+
+        if toc["version"] > SCENE_FORMAT_VERSION:
+            logging.warning("Scene file format version {:d} is newer than supported"
+                            " version {:d}.".format(toc["version"], SCENE_FORMAT_VERSION))
+
+        scene_data = {}
+
+        for data_id in toc["data_ids"]:
+
+            subfile_index = scene_file.find_subfile("scene/{}".format(data_id))
+
+            if subfile_index != -1:
+                scene_data[data_id] = pickle.loads(scene_file.read_subfile(subfile_index))
+
+        return scene_data
+
     def __save(self, filename, set_saved_state=True):
 
         scene_data = {}
@@ -208,9 +246,19 @@ class SceneManager(BaseObject):
         scene_file = Multifile()
         scene_file.open_write(Filename(filename))
         id_stream = StringStream()
-        scene_file.add_subfile("Panda3DStudio", id_stream, 9)
-        scene_data_stream = StringStream(pickle.dumps(scene_data, -1))
-        scene_file.add_subfile("scene/data", scene_data_stream, 9)
+        scene_file.add_subfile("Panda3DStudio", id_stream, SCENE_COMPRESSION)
+        # the streams need to be kept alive until the scene file is flushed
+        streams = [id_stream]
+        toc = {"version": SCENE_FORMAT_VERSION, "data_ids": list(scene_data.keys())}
+        stream = StringStream(pickle.dumps(toc, -1))
+        scene_file.add_subfile("scene/toc", stream, SCENE_COMPRESSION)
+        streams.append(stream)
+
+        for data_id, data in scene_data.items():
+            stream = StringStream(pickle.dumps(data, -1))
+            scene_file.add_subfile("scene/{}".format(data_id), stream, SCENE_COMPRESSION)
+            streams.append(stream)
+
         Mgr.do("save_history", scene_file, set_saved_state)
 
         if scene_file.needs_repack():
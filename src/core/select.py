@@ -89,6 +89,7 @@ class Selection(SelectionTransformBase):
         self.update_center_pos()
         self.update_ui()
         self.update_obj_props()
+        Mgr.do("invalidate_picking")
 
         if hide_sets:
             Mgr.update_remotely("selection_set", "hide_name")
@@ -428,6 +429,7 @@ class SelectionManager(BaseObject):
                          "shape_tex_card": self._sel_shape_tex_card
                         }
         Mgr.expose("selection_mask_data", lambda: sel_mask_data)
+        Mgr.expose("region_selection_stats", lambda: self._region_sel_stats.copy())
         Mgr.accept("select_top", self.__select_toplvl_obj)
         Mgr.accept("select_single_top", self.__select_single)
         Mgr.accept("init_region_select", self.__init_region_select)
@@ -563,6 +565,8 @@ class SelectionManager(BaseObject):
         background.set_color((0., 0., 0., 0.))
         self._sel_mask_tex = None
         self._sel_mask_buffer = None
+        # the duration (in seconds) of each step of the last region selection
+        self._region_sel_stats = {"mask_crop": 0., "selection": 0.}
         self._region_sel_listener = None
         self._mouse_prev = (0., 0.)
 
@@ -1256,14 +1260,18 @@ class SelectionManager(BaseObject):
         else:
             ellipse_data = ()
 
+        stats = self._region_sel_stats
+
         if region_type in ("fence", "lasso", "paint"):
-            img = PNMImage()
-            self._sel_mask_tex.store(img)
-            cropped_img = PNMImage(*bfr_size, 4)
-            cropped_img.copy_sub_image(img, 0, 0, int(round(l * w)), int(round((1. - t) * h)))
-            self._sel_mask_tex.load(cropped_img)
+            start_time = time.perf_counter()
+            crop_mask_texture(self._sel_mask_tex, int(round(l * w)), int(round((1. - t) * h)),
+                              w_b, h_b)
+            stats["mask_crop"] = time.perf_counter() - start_time
+        else:
+            stats["mask_crop"] = 0.
 
         Mgr.get("picking_cam").set_active(False)
+        start_time = time.perf_counter()
 
         lens = get_off_axis_lens((w_f, h_f))
         picking_mask = Mgr.get("picking_mask")
@@ -1333,10 +1341,7 @@ class SelectionManager(BaseObject):
                     state_np.set_shader_input("ellipse_data", Vec4(*ellipse_data))
                 elif region_type in ("fence", "lasso", "paint"):
                     if enclose:
-                        img = PNMImage()
-                        self._sel_mask_tex.store(img)
-                        img.expand_border(2, 2, 2, 2, (0., 0., 0., 0.))
-                        self._sel_mask_tex.load(img)
+                        expand_mask_texture(self._sel_mask_tex, 2)
                     state_np.set_shader_input("mask_tex", self._sel_mask_tex)
                 elif enclose:
                     state_np.set_shader_input("buffer_size", Vec2(w_b + 2, h_b + 2))
@@ -1357,11 +1362,8 @@ class SelectionManager(BaseObject):
 
                     texels = memoryview(tex.get_ram_image()).cast("I")
 
-                    for i, mask in enumerate(texels):
-                        for j in range(32):
-                            if mask & (1 << j):
-                                index = 32 * i + j
-                                sel.add(objs[index].get_toplevel_object(get_group=True))
+                    for index in get_mask_bit_indices(texels):
+                        sel.add(objs[index].get_toplevel_object(get_group=True))
 
                 state_np.clear_attrib(ShaderAttrib)
                 Mgr.update_locally("region_picking", False)
@@ -1402,6 +1404,8 @@ class SelectionManager(BaseObject):
             Mgr.do("region_select_subobjs", cam_np, lens_exp, bfr,
                    ellipse_data, self._sel_mask_tex, op)
 
+        stats["selection"] = time.perf_counter() - start_time
+
         if region_type in ("fence", "lasso", "paint"):
             self._sel_mask_tex = None
 
@@ -6,6 +6,10 @@ from .uv_transform import UVTransformationBase
 from .world_select import SelectionManager
 from .helpers import Grid, UVTransformGizmo
 
+# the maximum estimated size (in bytes) of the geometry of the UV data objects
+# kept in memory after closing the UV editor, for reuse when it is reopened
+UV_DATA_CACHE_SIZE = 64 * 1024 * 1024
+
 
 class UVEditor(UVNavigationBase, UVSelectionBase, UVTransformationBase,
                VertexEditManager, EdgeEditManager, PolygonEditManager):
@@ -41,6 +45,11 @@ class UVEditor(UVNavigationBase, UVSelectionBase, UVTransformationBase,
         self._uv_set_names = {}
         self._uv_data_obj_copies = {}
         self._models = []
+        # per (GeomDataObject ID, UV set ID), a (weak reference to GeomDataObject,
+        # data version, UVDataObject, data size) tuple, ordered from least to most
+        # recently used
+        self._uv_data_cache = OrderedDict()
+        self._uv_data_cache_size = 0
 
         UVNavigationBase.__init__(self)
         UVSelectionBase.__init__(self)
@@ -129,6 +138,8 @@ class UVEditor(UVNavigationBase, UVSelectionBase, UVTransformationBase,
         UVMgr.accept("end_drawing_aux_picking_viz", self.__end_drawing_aux_picking_viz)
 
         Mgr.add_app_updater("uv_interface", self.__toggle_interface)
+        Mgr.add_notification_handler("geom_data_destroyed", "uv_data_cache",
+                                     self.__discard_cached_uv_data)
 
     def setup(self):
 
@@ -186,6 +197,7 @@ class UVEditor(UVNavigationBase, UVSelectionBase, UVTransformationBase,
         self.cam_node.set_active(True)
         UVMgr.get("picking_cam").set_active()
         self._models = self._world_sel_mgr.get_models()
+        self.__prune_uv_data_cache()
 
         UVSelectionBase.setup(self)
         UVNavigationBase.setup(self)
@@ -282,14 +294,83 @@ class UVEditor(UVNavigationBase, UVSelectionBase, UVTransformationBase,
         self._uv_data_objs[uv_set_id] = uv_data_objs = {}
 
         for model in models:
+
             geom_data_obj = model.get_geom_object().get_geom_data_object()
-            uv_data_objs[geom_data_obj] = UVDataObject(uv_set_id, uv_registry, geom_data_obj)
+            uv_data_obj = self.__get_cached_uv_data_object(geom_data_obj, uv_set_id)
+
+            if uv_data_obj:
+                uv_data_obj.reuse(uv_registry)
+                for sel_state in ("unselected", "selected"):
+                    uv_data_obj.set_poly_state(sel_state, self._poly_states[sel_state])
+            else:
+                uv_data_obj = UVDataObject(uv_set_id, uv_registry, geom_data_obj)
+
+            uv_data_objs[geom_data_obj] = uv_data_obj
+
+    def __get_cached_uv_data_object(self, geom_data_obj, uv_set_id):
+
+        key = (geom_data_obj.get_id(), uv_set_id)
+
+        if key not in self._uv_data_cache:
+            return
+
+        obj_ref, data_version, uv_data_obj, size = self._uv_data_cache.pop(key)
+        self._uv_data_cache_size -= size
+
+        if obj_ref() is geom_data_obj and data_version == geom_data_obj.get_data_version():
+            return uv_data_obj
+
+        uv_data_obj.destroy(destroy_tex_seams=False)
+
+    def __cache_uv_data_object(self, geom_data_obj, uv_set_id, uv_data_obj):
+
+        uv_data_obj.store_for_reuse()
+        size = uv_data_obj.get_data_size()
+        cache = self._uv_data_cache
+        key = (geom_data_obj.get_id(), uv_set_id)
+        obj_ref = weakref.ref(geom_data_obj)
+        cache[key] = (obj_ref, geom_data_obj.get_data_version(), uv_data_obj, size)
+        self._uv_data_cache_size += size
+
+        while self._uv_data_cache_size > UV_DATA_CACHE_SIZE:
+            _, (_, _, uv_data_obj, size) = cache.popitem(last=False)
+            uv_data_obj.destroy(destroy_tex_seams=False)
+            self._uv_data_cache_size -= size
+
+    def __prune_uv_data_cache(self):
+        """ Remove the cached UV data of models that were deleted or changed. """
+
+        cache = self._uv_data_cache
+
+        for key, (obj_ref, data_version, uv_data_obj, size) in list(cache.items()):
+
+            geom_data_obj = obj_ref()
+            model = geom_data_obj and Mgr.get("model", geom_data_obj.get_toplevel_object().get_id())
+
+            if (model and model.get_geom_type() == "editable_geom"
+                    and model.get_geom_object().get_geom_data_object() is geom_data_obj
+                    and geom_data_obj.get_data_version() == data_version):
+                continue
+
+            del cache[key]
+            uv_data_obj.destroy(destroy_tex_seams=False)
+            self._uv_data_cache_size -= size
+
+    def __discard_cached_uv_data(self, geom_data_id):
+        """ Remove the cached UV data of the destroyed GeomDataObject with the given ID """
+
+        cache = self._uv_data_cache
+
+        for key in [k for k in cache if k[0] == geom_data_id]:
+            _, _, uv_data_obj, size = cache.pop(key)
+            uv_data_obj.destroy(destroy_tex_seams=False)
+            self._uv_data_cache_size -= size
 
     def __destroy_uv_data(self):
 
-        for uv_data_objs in self._uv_data_objs.values():
-            for uv_data_obj in uv_data_objs.values():
-                uv_data_obj.destroy()
+        for uv_set_id, uv_data_objs in self._uv_data_objs.items():
+            for geom_data_obj, uv_data_obj in uv_data_objs.items():
+                self.__cache_uv_data_object(geom_data_obj, uv_set_id, uv_data_obj)
 
         for geom_data_obj, uv_data_obj in self._uv_data_obj_copies.items():
             geom_data_obj.clear_copied_uvs()
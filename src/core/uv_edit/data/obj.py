@@ -74,6 +74,7 @@ class UVDataObject(UVDataSelectionBase, UVDataTransformBase, VertexEditBase,
         self._tmp_geom_pickable = None
         self._tmp_geom_sel_state = None
         self._tmp_row_indices = {}
+        self._tmp_hilited_row = None
 
         UVDataSelectionBase.__init__(self, data_copy)
         is_copy = True if data_copy else False
@@ -141,10 +142,61 @@ class UVDataObject(UVDataSelectionBase, UVDataTransformBase, VertexEditBase,
 
         return UVDataObject(uv_set_id, None, None, data_copy)
 
-    def destroy(self):
+    def destroy(self, destroy_tex_seams=True):
 
         self._origin.remove_node()
+
+        if destroy_tex_seams:
+            self._geom_data_obj.destroy_tex_seams(self._uv_set_id)
+
+    def store_for_reuse(self):
+        """
+        Deselect everything and remove the texture seams from the geometry of the
+        model, so this object can be cached when the UV editor is closed.
+
+        """
+
+        for subobj_lvl in ("vert", "edge", "poly"):
+
+            self.remove_selection_backup(subobj_lvl)
+
+            if self._selected_subobj_ids[subobj_lvl]:
+                self.clear_selection(subobj_lvl)
+
         self._geom_data_obj.destroy_tex_seams(self._uv_set_id)
+        self.hide()
+
+    def reuse(self, uv_registry):
+
+        for subobj_type in ("vert", "edge", "poly"):
+            uv_registry[subobj_type].update((s.get_picking_color_id(), s)
+                                            for s in self._subobjs[subobj_type].values())
+
+        color = UVMgr.get("uv_selection_colors")["seam"]["unselected"]
+        self._geom_data_obj.create_tex_seams(self._uv_set_id, self._seam_edge_ids[:], color)
+        self.show()
+
+    def get_data_size(self):
+        """
+        Return an estimate of the memory (in bytes) used by the geometry of this
+        object.
+
+        """
+
+        size = 0
+
+        for geom_np in self._origin.find_all_matches("**/+GeomNode"):
+            for geom in geom_np.node().get_geoms():
+
+                vertex_data = geom.get_vertex_data()
+
+                for i in range(vertex_data.get_num_arrays()):
+                    size += vertex_data.get_array(i).data_size_bytes
+
+                for prim in geom.get_primitives():
+                    size += prim.get_vertices().data_size_bytes if prim.is_indexed() else 0
+
+        return size
 
     def __process_geom_data(self, uv_registry):
 
@@ -197,33 +249,47 @@ class UVDataObject(UVDataSelectionBase, UVDataTransformBase, VertexEditBase,
         merged_uv_verts = self._merged_verts
         merged_uv_edges = self._merged_edges
 
-        for vert_id, uv_vert in uv_verts.items():
+        # each merged vertex and merged edge is processed only once; its members
+        # are grouped by UVs (or by merged UV vertices, in the case of edges) using
+        # a dict, instead of being compared pairwise
+
+        for vert_id in uv_verts:
 
             if vert_id in merged_uv_verts:
                 continue
 
-            uv = verts[vert_id].get_uvs(uv_set_id)
-            merged_vert = geom_data_obj.get_merged_vertex(vert_id)
-            merged_uv_vert = MergedVertex(self)
+            merged_uv_verts_by_uvs = {}
+
+            for v_id in geom_data_obj.get_merged_vertex(vert_id):
+
+                uv = verts[v_id].get_uvs(uv_set_id)
+
+                if uv in merged_uv_verts_by_uvs:
+                    merged_uv_vert = merged_uv_verts_by_uvs[uv]
+                else:
+                    merged_uv_vert = merged_uv_verts_by_uvs[uv] = MergedVertex(self)
 
-            for v_id in merged_vert:
-                if verts[v_id].get_uvs(uv_set_id) == uv:
-                    merged_uv_vert.append(v_id)
-                    merged_uv_verts[v_id] = merged_uv_vert
+                merged_uv_vert.append(v_id)
+                merged_uv_verts[v_id] = merged_uv_vert
 
-        for edge_id, uv_edge in uv_edges.items():
+        for edge_id in uv_edges:
 
             if edge_id in merged_uv_edges:
                 continue
 
-            merged_uvs = set(merged_uv_verts[v_id] for v_id in uv_edge)
-            merged_edge = geom_data_obj.get_merged_edge(edge_id)
-            merged_uv_edge = MergedEdge(self)
+            merged_uv_edges_by_verts = {}
+
+            for e_id in geom_data_obj.get_merged_edge(edge_id):
+
+                merged_uvs = frozenset(merged_uv_verts[v_id] for v_id in edges[e_id])
+
+                if merged_uvs in merged_uv_edges_by_verts:
+                    merged_uv_edge = merged_uv_edges_by_verts[merged_uvs]
+                else:
+                    merged_uv_edge = merged_uv_edges_by_verts[merged_uvs] = MergedEdge(self)
 
-            for e_id in merged_edge:
-                if set(merged_uv_verts[v_id] for v_id in edges[e_id]) == merged_uvs:
-                    merged_uv_edge.append(e_id)
-                    merged_uv_edges[e_id] = merged_uv_edge
+                merged_uv_edge.append(e_id)
+                merged_uv_edges[e_id] = merged_uv_edge
 
         seam_edges = [m_e for m_e in merged_uv_edges.values() if len(m_e) == 1]
         self.fix_seams(seam_edges)
@@ -697,6 +763,7 @@ class UVDataObject(UVDataSelectionBase, UVDataTransformBase, VertexEditBase,
             self._tmp_geom_sel_state.remove_node()
             self._tmp_geom_sel_state = None
             self._tmp_row_indices = {}
+            self._tmp_hilited_row = None
 
             if GlobalData["uv_edit_options"]["pick_by_aiming"]:
                 aux_picking_root = Mgr.get("aux_picking_root")
@@ -719,6 +786,8 @@ class UVDataObject(UVDataSelectionBase, UVDataTransformBase, VertexEditBase,
 
     def init_subobj_picking_via_poly(self, subobj_lvl, picked_poly, category=""):
 
+        self._tmp_hilited_row = None
+
         if subobj_lvl == "vert":
             self.init_vertex_picking_via_poly(picked_poly, category)
         elif subobj_lvl == "edge":
@@ -731,17 +800,32 @@ class UVDataObject(UVDataSelectionBase, UVDataTransformBase, VertexEditBase,
         if row is None:
             return False
 
+        hilited_row = self._tmp_hilited_row
+
+        if row == hilited_row:
+            return True
+
+        # only the rows of the previously and newly highlighted subobjects need
+        # to be updated, instead of resetting the color of all rows
         colors = UVMgr.get("uv_selection_colors")[subobj_lvl]
-        geom = self._tmp_geom_sel_state.node().modify_geom(0)
-        vertex_data = geom.get_vertex_data().set_color((.3, .3, .3, .5))
-        geom.set_vertex_data(vertex_data)
-        col_writer = GeomVertexWriter(geom.modify_vertex_data(), "color")
+        row_count = 2 if subobj_lvl == "edge" else 1
+        vertex_data = self._tmp_geom_sel_state.node().modify_geom(0).modify_vertex_data()
+        col_writer = GeomVertexWriter(vertex_data, "color")
+
+        if hilited_row is not None:
+
+            col_writer.set_row(hilited_row)
+
+            for _ in range(row_count):
+                col_writer.set_data4(.3, .3, .3, .5)
+
         col_writer.set_row(row)
-        col_writer.set_data4(colors["selected"])
 
-        if subobj_lvl == "edge":
+        for _ in range(row_count):
             col_writer.set_data4(colors["selected"])
 
+        self._tmp_hilited_row = row
+
         return True
 
     def set_poly_state(self, sel_state, state):
@@ -926,11 +926,8 @@ class UVSelectionBase(BaseObject):
             ellipse_data = ()
 
         if region_type in ("fence", "lasso", "paint"):
-            img = PNMImage()
-            self._sel_mask_tex.store(img)
-            cropped_img = PNMImage(w_b, h_b, 4)
-            cropped_img.copy_sub_image(img, 0, 0, int(round(l * w)), int(round((1. - t) * h)))
-            self._sel_mask_tex.load(cropped_img)
+            crop_mask_texture(self._sel_mask_tex, int(round(l * w)), int(round((1. - t) * h)),
+                              w_b, h_b)
 
         UVMgr.get("picking_cam").set_active(False)
 
@@ -1005,10 +1002,7 @@ class UVSelectionBase(BaseObject):
                 state_np.set_shader_input("ellipse_data", Vec4(*ellipse_data))
             elif region_type in ("fence", "lasso", "paint"):
                 if enclose:
-                    img = PNMImage()
-                    self._sel_mask_tex.store(img)
-                    img.expand_border(2, 2, 2, 2, (0., 0., 0., 0.))
-                    self._sel_mask_tex.load(img)
+                    expand_mask_texture(self._sel_mask_tex, 2)
                 state_np.set_shader_input("mask_tex", self._sel_mask_tex)
             elif enclose:
                 state_np.set_shader_input("buffer_size", Vec2(w_b + 2, h_b + 2))
@@ -406,9 +406,9 @@ class SelectionManager(BaseObject):
         selection = self._selections[obj_lvl]
 
         if obj_lvl == "poly":
-            return set(obj.get_id() for obj in selection)
+            return IDBitSet(obj.get_id() for obj in selection)
         else:
-            return set(obj_id for obj in selection for obj_id in obj)
+            return IDBitSet(obj_id for obj in selection for obj_id in obj)
 
     def __apply_selection_set(self, sel_set):
 
@@ -676,10 +676,7 @@ class SelectionManager(BaseObject):
                 state_np.set_shader_input("ellipse_data", Vec4(*ellipse_data))
             elif region_type in ("fence", "lasso", "paint"):
                 if enclose:
-                    img = PNMImage()
-                    mask_tex.store(img)
-                    img.expand_border(2, 2, 2, 2, (0., 0., 0., 0.))
-                    mask_tex.load(img)
+                    expand_mask_texture(mask_tex, 2)
                 state_np.set_shader_input("mask_tex", mask_tex)
             elif enclose:
                 w_b, h_b = tex_buffer.get_size()
@@ -209,7 +209,7 @@ class FileManager(object):
                           icon_id="icon_exclamation")
         elif update_type == "export":
             # TODO: implement and show ExportDialog
-            on_yes = lambda filename: Mgr.update_remotely("export", "export", filename)
+            on_yes = self.__export
             open_file = GlobalData["open_file"]
             default_filename = Filename(open_file).get_dirname() + "/" if open_file else ""
             FileDialog(title="Export scene",
@@ -219,6 +219,25 @@ class FileManager(object):
                        file_types=("Panda3D model files|bam", "Wavefront files|obj", "All types|*"),
                        default_filename=default_filename)
 
+    def __export(self, filename):
+
+        if not filename.endswith(".obj"):
+            Mgr.update_remotely("export", "export", filename)
+            return
+
+        def export(polygons):
+
+            options = {"polygons": polygons}
+            Mgr.update_remotely("export", "export", filename, options)
+
+        MessageDialog(title="OBJ export",
+                      message="Export the polygons of editable models as faces\n"
+                              "with more than three vertices where needed,\n"
+                              "instead of as triangles?",
+                      choices="yesno",
+                      on_yes=lambda: export(True),
+                      on_no=lambda: export(False))
+
     def __prepare_import(self):
 
         on_yes = lambda filename: Mgr.update_remotely("import", "prepare", filename)
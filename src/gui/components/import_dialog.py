@@ -155,10 +155,11 @@ class ObjectPane(DialogScrollPane):
     def __parse_name(self, new_name, index):
 
         name = self._hierarchy[index]["new_name"]
-        obj_names = GlobalData["obj_names"] + self._obj_names
-        obj_names.remove(name)
+        obj_names = GlobalData["obj_names"].copy()
+        obj_names.update(self._obj_names)
+        obj_names.discard(name)
 
-        return get_unique_name(new_name.strip(), obj_names)
+        return obj_names.get_unique_name(new_name.strip())
 
     def __handle_name(self, new_name, index):
 